@@ -4,14 +4,27 @@ from avro_compat.fastavro import read
 from avro_compat.fastavro import write
 from avro_compat.fastavro import schema
 from avro_compat.fastavro import validation
+from avro_compat.fastavro import columnar
+from avro_compat.fastavro import arrow
+from avro_compat.fastavro import index
 
 reader = read.reader
 json_reader = read.json_reader
 block_reader = read.block_reader
+raw_record_reader = read.raw_record_reader
+lazy_reader = read.lazy_reader
+count_records = read.count_records
+read_header = read.read_header
 schemaless_reader = read.schemaless_reader
 writer = write.writer
 json_writer = write.json_writer
 schemaless_writer = write.schemaless_writer
+write_columns = columnar.write_columns
+write_dataframe = columnar.write_dataframe
+to_arrow = arrow.to_arrow
+from_arrow = arrow.from_arrow
+build_index = index.build_index
+load_index = index.load_index
 is_avro = read.is_avro
 validate = validation.validate
 parse_schema = schema.parse_schema
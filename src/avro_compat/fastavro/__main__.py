@@ -25,5 +25,20 @@ finally:
 main = mod.main
 CleanJSONEncoder = mod.CleanJSONEncoder
 
+
+def _run_subcommand():
+    from avro_compat.fastavro import rewrite, transcode
+
+    subcommands = {
+        "recompress": rewrite.recompress_main,
+        "transcode": transcode.main,
+    }
+    if len(sys.argv) > 1 and sys.argv[1] in subcommands:
+        subcommands[sys.argv[1]](sys.argv[2:])
+        return True
+    return False
+
+
 if __name__ == "__main__":
-    main()
+    if not _run_subcommand():
+        main()
@@ -0,0 +1,172 @@
+import collections
+import io
+
+import cavro
+
+from . import _codecs
+from ._read_common import HEADER_SCHEMA
+
+_LONG = cavro.Schema("long", parse_json=False)
+_HEADER = cavro.Schema(HEADER_SCHEMA, parse_json=False, options=cavro.Options(record_decodes_to_dict=True))
+
+
+class Header:
+    def __init__(self, metadata, sync_marker, size):
+        self.metadata = metadata
+        self.sync_marker = sync_marker
+        self.size = size
+
+    @property
+    def codec(self):
+        return self.metadata.get("avro.codec", b"null").decode()
+
+    @property
+    def schema(self):
+        return self.metadata["avro.schema"].decode()
+
+
+class RawBlock:
+    def __init__(self, offset, num_records, data, codec, end=None):
+        self.offset = offset
+        self.num_records = num_records
+        self.data = data
+        self.codec = codec
+        # The offset just past the block's sync marker, where the next block starts
+        self.end = end
+
+    @property
+    def size(self):
+        return len(self.data)
+
+    def decompress(self):
+        return _codecs.get_decompressor(self.codec)(self.data)
+
+
+BlockHeader = collections.namedtuple("BlockHeader", ["offset", "num_records", "size"])
+
+
+def encode_long(value):
+    return _LONG.binary_encode(value)
+
+
+def read_long(fo):
+    return _LONG.binary_read(cavro.FileReader(fo))
+
+
+def read_header(fo):
+    start = fo.tell()
+    try:
+        header = _HEADER.binary_read(cavro.FileReader(fo))
+    except (EOFError, cavro.CavroException) as e:
+        raise ValueError("cannot read header - is it an avro file?") from e
+    if header["magic"] != cavro.OBJ_MAGIC_BYTES:
+        raise ValueError("cannot read header - is it an avro file?")
+    return Header(header["meta"], header["sync"], fo.tell() - start)
+
+
+def find_sync(fo, sync_marker, position, chunk_size=1 << 20):
+    # The offset of the first sync marker starting at or after position, or None. bytes.find is a
+    # memchr based search, so scanning large chunks is far cheaper than looking byte by byte
+    fo.seek(position)
+    overlap = b""
+    while True:
+        chunk = fo.read(chunk_size)
+        if not chunk:
+            return None
+        data = overlap + chunk
+        found = data.find(sync_marker)
+        if found >= 0:
+            return position - len(overlap) + found
+        position += len(chunk)
+        overlap = data[max(0, len(data) - len(sync_marker) + 1) :]
+
+
+def _past_end(offset, header, end):
+    # A block belongs to the byte range its preceding sync marker starts in
+    return end is not None and offset - len(header.sync_marker) >= end
+
+
+def read_block(fo, header, end=None):
+    # The block at the current position, or None at the end of the file or byte range
+    offset = fo.tell()
+    if _past_end(offset, header, end):
+        return None
+    try:
+        num_records = read_long(fo)
+    except EOFError:
+        return None
+    size = read_long(fo)
+    if num_records < 0 or size < 0:
+        raise ValueError(f"invalid block header at offset {offset}")
+    data = fo.read(size)
+    marker = fo.read(len(header.sync_marker))
+    if len(data) != size or len(marker) != len(header.sync_marker):
+        raise EOFError(f"truncated block at offset {offset}")
+    if marker != header.sync_marker:
+        raise ValueError(f"sync marker mismatch after block at offset {offset}")
+    return RawBlock(offset, num_records, data, header.codec, fo.tell())
+
+
+def iter_blocks(fo, header, end=None):
+    return iter(lambda: read_block(fo, header, end), None)
+
+
+def iter_block_headers(fo, header, end=None):
+    # Seeks over the block data, only the counts, sizes and sync markers are read
+    marker_size = len(header.sync_marker)
+    while True:
+        offset = fo.tell()
+        if _past_end(offset, header, end):
+            return
+        try:
+            num_records = read_long(fo)
+        except EOFError:
+            return
+        size = read_long(fo)
+        fo.seek(size, io.SEEK_CUR)
+        marker = fo.read(marker_size)
+        if len(marker) != marker_size:
+            raise EOFError(f"truncated block at offset {offset}")
+        if marker != header.sync_marker:
+            raise ValueError(f"sync marker mismatch after block at offset {offset}")
+        yield BlockHeader(offset, num_records, size)
+
+
+def skipped_blocks(fo, header, start, stop):
+    # The (offset, num_records) of the blocks from start to the sync marker at stop, or to the end of the
+    # file when stop is None, going by their headers alone. None when the headers don't lead there
+    marker_size = len(header.sync_marker)
+    file_end = fo.seek(0, io.SEEK_END)
+    blocks = []
+    offset = start
+    while True:
+        fo.seek(offset)
+        try:
+            num_records = read_long(fo)
+            size = read_long(fo)
+        except EOFError:
+            return None
+        if num_records < 0 or size < 0:
+            return None
+        blocks.append((offset, num_records))
+        marker = fo.tell() + size
+        if stop is None and marker + marker_size >= file_end:
+            return blocks
+        if stop is not None and marker >= stop:
+            return blocks if marker == stop else None
+        offset = marker + marker_size
+
+
+def write_header(fo, metadata, sync_marker):
+    fo.write(_HEADER.binary_encode({"magic": cavro.OBJ_MAGIC_BYTES, "meta": metadata, "sync": sync_marker}))
+
+
+def write_raw_block(fo, num_records, compressed, sync_marker):
+    fo.write(encode_long(num_records))
+    fo.write(encode_long(len(compressed)))
+    fo.write(compressed)
+    fo.write(sync_marker)
+
+
+def write_block(fo, num_records, data, codec, sync_marker, compression_level=None):
+    write_raw_block(fo, num_records, _codecs.get_compressor(codec)(data, compression_level), sync_marker)
@@ -0,0 +1,120 @@
+import bz2
+import lzma
+import zlib
+
+try:
+    import snappy
+except ImportError:
+    snappy = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.block
+except ImportError:
+    lz4 = None
+
+
+def _null_compress(data, level):
+    return bytes(data)
+
+
+def _null_decompress(data):
+    return data
+
+
+def _deflate_compress(data, level):
+    # Strip the zlib header and checksum, avro uses raw deflate
+    if level is None:
+        return zlib.compress(data)[2:-4]
+    return zlib.compress(data, level)[2:-4]
+
+
+def _deflate_decompress(data):
+    return zlib.decompressobj(-15).decompress(data)
+
+
+def _bzip2_compress(data, level):
+    return bz2.compress(data, 9 if level is None else level)
+
+
+def _bzip2_decompress(data):
+    return bz2.decompress(data)
+
+
+def _xz_compress(data, level):
+    return lzma.compress(data, preset=level)
+
+
+def _xz_decompress(data):
+    return lzma.decompress(data)
+
+
+def _snappy_compress(data, level):
+    return snappy.compress(data) + (zlib.crc32(data) & 0xFFFFFFFF).to_bytes(4, "big")
+
+
+def _snappy_decompress(data):
+    data = memoryview(data)
+    decompressed = snappy.decompress(bytes(data[:-4]))
+    if (zlib.crc32(decompressed) & 0xFFFFFFFF).to_bytes(4, "big") != data[-4:]:
+        raise ValueError("snappy block checksum mismatch")
+    return decompressed
+
+
+def _zstandard_compress(data, level):
+    if level is None:
+        return zstandard.ZstdCompressor().compress(data)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _zstandard_decompress(data):
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def _lz4_compress(data, level):
+    return lz4.block.compress(data)
+
+
+def _lz4_decompress(data):
+    return lz4.block.decompress(data)
+
+
+_CODECS = {
+    "null": (_null_compress, _null_decompress, True),
+    "deflate": (_deflate_compress, _deflate_decompress, True),
+    "bzip2": (_bzip2_compress, _bzip2_decompress, True),
+    "xz": (_xz_compress, _xz_decompress, True),
+    "snappy": (_snappy_compress, _snappy_decompress, snappy is not None),
+    "zstandard": (_zstandard_compress, _zstandard_decompress, zstandard is not None),
+    "lz4": (_lz4_compress, _lz4_decompress, lz4 is not None),
+}
+
+# What the decompressors raise for damaged data, bz2 raises OSError
+DECOMPRESS_ERRORS = (zlib.error, lzma.LZMAError, OSError, ValueError)
+if snappy is not None:
+    DECOMPRESS_ERRORS += (snappy.UncompressError,)
+if zstandard is not None:
+    DECOMPRESS_ERRORS += (zstandard.ZstdError,)
+if lz4 is not None:
+    DECOMPRESS_ERRORS += (lz4.block.LZ4BlockError,)
+
+BLOCK_COMPRESSORS = {name: compress for name, (compress, _, available) in _CODECS.items() if available}
+BLOCK_DECOMPRESSORS = {name: decompress for name, (_, decompress, available) in _CODECS.items() if available}
+
+
+def get_compressor(codec):
+    try:
+        return BLOCK_COMPRESSORS[codec]
+    except KeyError:
+        raise ValueError(f"unrecognized codec: {codec}") from None
+
+
+def get_decompressor(codec):
+    try:
+        return BLOCK_DECOMPRESSORS[codec]
+    except KeyError:
+        raise ValueError("Unrecognized codec") from None
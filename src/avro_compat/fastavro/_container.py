@@ -0,0 +1,324 @@
+import collections
+import io
+import queue
+import threading
+import time
+
+import cavro
+
+from . import _block
+from . import _codecs
+
+_BYTE = cavro.Schema({"type": "fixed", "name": "byte", "size": 1}, parse_json=False)
+
+# What a damaged block raises while it is framed, decompressed or decoded
+_CORRUPTION_ERRORS = (EOFError, ValueError, IndexError, OverflowError, cavro.CavroException) + _codecs.DECOMPRESS_ERRORS
+
+# num_records is None when the block's header could not be read
+CorruptBlock = collections.namedtuple("CorruptBlock", ["offset", "num_records", "error", "resumed_at"])
+
+
+class Recovery:
+    """The corrupt blocks skipped while reading a damaged container file"""
+
+    def __init__(self):
+        self.corrupt_blocks = []
+
+    @property
+    def bad_blocks(self):
+        return len(self.corrupt_blocks)
+
+    @property
+    def records_lost(self):
+        # None when a corrupt block's record count is unknown
+        counts = [block.num_records for block in self.corrupt_blocks]
+        if None in counts:
+            return None
+        return sum(counts)
+
+
+class BlockContainer:
+    """A stand-in for cavro.ContainerReader that reads blocks itself, for the reader modes that need to"""
+
+    def __init__(self, fo, options, header=None):
+        self.fo = fo
+        self.header = _block.read_header(fo) if header is None else header
+        self.writer_schema = cavro.Schema(self.header.schema, options=options)
+        self.codec_name = self.header.codec
+        self.metadata = self.header.metadata
+        self.marker = self.header.sync_marker
+        # Fails early for codecs that aren't available, blocks are decompressed by RawBlock.decompress
+        _codecs.get_decompressor(self.codec_name)
+        self.set_reader_schema(None)
+        self.set_filter(None, None)
+        self.set_block_filter(None)
+        self.objects_left_in_block = 0
+        self._records = iter(())
+        self._blocks = None
+        self._end = None
+        self.recovery = None
+        self._follow = None
+        self._prefetch = 0
+
+    def set_reader_schema(self, reader_schema):
+        self.reader_schema = reader_schema or self.writer_schema
+        if reader_schema is None:
+            self.schema = self.writer_schema
+        else:
+            self.schema = reader_schema.reader_for_writer(self.writer_schema)
+
+    def set_filter(self, test, test_schema):
+        # test_schema decodes just the fields test needs, the full record is only decoded if it passes
+        self._test = test
+        self._test_schema = test_schema
+
+    def set_range(self, start, end):
+        # Reads the blocks whose preceding sync marker starts in [start, end), like Avro's input splits
+        marker_size = len(self.marker)
+        found = _block.find_sync(self.fo, self.marker, max(start, self.header.size - marker_size))
+        if found is None:
+            self.fo.seek(0, io.SEEK_END)
+        else:
+            self.fo.seek(found + marker_size)
+        self._end = end
+
+    def set_recovery(self, recover):
+        # Corrupt blocks are recorded and skipped rather than ending iteration
+        self.recovery = Recovery() if recover else None
+
+    def set_follow(self, poll_interval, max_poll_interval, idle_timeout):
+        # At the end of the file, wait for more blocks to be appended rather than stopping
+        self._follow = (poll_interval, max_poll_interval, idle_timeout)
+
+    def set_prefetch(self, num_blocks):
+        # A thread reads and decompresses up to num_blocks blocks ahead of decoding
+        self._prefetch = num_blocks
+
+    def set_block_filter(self, skip_block):
+        # skip_block(ordinal, block) is true for blocks that need not be decompressed
+        self._skip_block = skip_block
+
+    def iter_blocks(self):
+        if self._follow is not None:
+            blocks = self._iter_following(*self._follow)
+        elif self.recovery is None:
+            blocks = _block.iter_blocks(self.fo, self.header, self._end)
+        else:
+            blocks = self._iter_recovering()
+        if self._skip_block is not None:
+            blocks = self._iter_filtered(blocks)
+        if self._prefetch:
+            blocks = _iter_prefetched(blocks, self._prefetch)
+        return blocks
+
+    def _close_blocks(self):
+        # Stops any prefetch thread before the file is read from elsewhere
+        close = getattr(self._blocks, "close", None)
+        if close is not None:
+            close()
+        self._blocks = None
+
+    def _iter_filtered(self, blocks):
+        ordinal = 0
+        for block in blocks:
+            if not block.num_records:
+                continue
+            if not self._skip_block(ordinal, block):
+                yield block
+            ordinal += 1
+
+    def _iter_recovering(self):
+        marker_size = len(self.marker)
+        while True:
+            offset = self.fo.tell()
+            try:
+                block = _block.read_block(self.fo, self.header, self._end)
+            except _CORRUPTION_ERRORS as e:
+                # The block's framing is unusable, reading resumes after the next sync marker. The blocks
+                # skipped on the way are counted from their headers, if those lead to the marker
+                found = _block.find_sync(self.fo, self.marker, offset + 1)
+                resumed_at = self.fo.seek(0, io.SEEK_END) if found is None else found + marker_size
+                skipped = _block.skipped_blocks(self.fo, self.header, offset, found) or [(offset, None)]
+                for skipped_offset, num_records in skipped:
+                    self.recovery.corrupt_blocks.append(CorruptBlock(skipped_offset, num_records, e, resumed_at))
+                self.fo.seek(resumed_at)
+                continue
+            if block is None:
+                return
+            yield block
+
+    def _iter_following(self, poll_interval, max_poll_interval, idle_timeout):
+        delay = poll_interval
+        idle_since = time.monotonic()
+        while True:
+            offset = self.fo.tell()
+            try:
+                block = _block.read_block(self.fo, self.header)
+            except EOFError:
+                # The last block is still being written
+                block = None
+            if block is not None:
+                delay = poll_interval
+                idle_since = time.monotonic()
+                yield block
+                continue
+            self.fo.seek(offset)
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                return
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+    def _check_consumed(self, reader, block):
+        # Garbage can decode without error, but then it rarely ends exactly at the end of the block
+        if self.recovery is None:
+            return
+        try:
+            _BYTE.binary_read(reader)
+        except EOFError:
+            return
+        raise ValueError(f"block at offset {block.offset} has data after its last record")
+
+    def read_block_at(self, offset):
+        self._close_blocks()
+        self.fo.seek(offset)
+        return next(_block.iter_blocks(self.fo, self.header))
+
+    def seek_block(self, offset, skip=0):
+        # Reading continues from the block at offset, less its first skip records
+        self._close_blocks()
+        self.fo.seek(offset)
+        self._blocks = self.iter_blocks()
+        records = []
+        for block in self._blocks:
+            records = self.decode_block(block)[skip:]
+            break
+        self._records = iter(records)
+        self.objects_left_in_block = len(records)
+
+    def skip(self, n):
+        if self.objects_left_in_block:
+            records = list(self._records)[n:]
+            n -= self.objects_left_in_block - len(records)
+            self._records = iter(records)
+            self.objects_left_in_block = len(records)
+        if not n:
+            return
+        if (
+            self._test is not None
+            or self._skip_block is not None
+            or self._follow is not None
+            or self._prefetch
+            or self.recovery is not None
+        ):
+            # Only decoding tells which records pass the filters, a followed file may still be growing, a
+            # prefetch thread has already read ahead and corrupt blocks are only found by reading them
+            for _ in zip(range(n), self):
+                pass
+            return
+        for block in _block.iter_block_headers(self.fo, self.header, self._end):
+            if block.num_records > n:
+                self.seek_block(block.offset, n)
+                return
+            n -= block.num_records
+        self._blocks = iter(())
+
+    def decode_block(self, block):
+        data = block.decompress()
+        read = self.schema.binary_read
+        test = self._test
+        if test is None:
+            reader = cavro.MemoryReader(data)
+            records = [read(reader) for _ in range(block.num_records)]
+            self._check_consumed(reader, block)
+            return records
+        if self._test_schema is None:
+            reader = cavro.MemoryReader(data)
+            records = [read(reader) for _ in range(block.num_records)]
+            self._check_consumed(reader, block)
+            return [record for record in records if test(record)]
+
+        # The test fields are read through a FileReader so each record's end offset is known, then only
+        # the records that pass are decoded in full, each from its own slice of the block
+        buf = io.BytesIO(data)
+        reader = cavro.FileReader(buf)
+        read_test = self._test_schema.binary_read
+        view = memoryview(data)
+        records = []
+        start = 0
+        for _ in range(block.num_records):
+            keep = test(read_test(reader))
+            end = buf.tell()
+            if keep:
+                records.append(read(cavro.MemoryReader(view[start:end])))
+            start = end
+        if self.recovery is not None and start != len(data):
+            raise ValueError(f"block at offset {block.offset} has data after its last record")
+        return records
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._blocks is None:
+            self._blocks = self.iter_blocks()
+        while not self.objects_left_in_block:
+            block = next(self._blocks)
+            try:
+                records = self.decode_block(block)
+            except _CORRUPTION_ERRORS as e:
+                if self.recovery is None:
+                    raise
+                self.recovery.corrupt_blocks.append(CorruptBlock(block.offset, block.num_records, e, block.end))
+                continue
+            self._records = iter(records)
+            self.objects_left_in_block = len(records)
+        self.objects_left_in_block -= 1
+        return next(self._records)
+
+
+_DONE = object()
+
+
+def _iter_prefetched(blocks, num_blocks):
+    # Reading real files and zlib, bz2 and lzma decompression release the GIL, so they overlap with decoding on
+    # the main thread. Reads from an in-memory buffer such as BytesIO don't
+    ready = queue.Queue(num_blocks)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def work():
+        try:
+            for block in blocks:
+                try:
+                    block = _block.RawBlock(block.offset, block.num_records, block.decompress(), "null", block.end)
+                except _codecs.DECOMPRESS_ERRORS:
+                    # Left compressed, so the error is raised, or recovered from, where the block is decoded
+                    pass
+                if not put(block):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(_DONE)
+
+    thread = threading.Thread(target=work, name="avro-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
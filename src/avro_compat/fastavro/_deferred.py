@@ -0,0 +1,126 @@
+from . import schema as schema_
+
+
+class _Leaf:
+    def __init__(self, fn, schema):
+        self.fn = fn
+        self.schema = schema
+        self.slots = []
+
+    def collect(self, container, key):
+        self.slots.append((container, key))
+
+
+class _Record:
+    def __init__(self):
+        self.fields = []
+
+    def collect(self, container, key):
+        value = container[key]
+        if isinstance(value, tuple):
+            # (name, record) when union values are returned with their type name
+            value = value[1]
+        for name, node in self.fields:
+            node.collect(value, name)
+
+
+class _Array:
+    def __init__(self, items):
+        self.items = items
+
+    def collect(self, container, key):
+        value = container[key]
+        for i in range(len(value)):
+            self.items.collect(value, i)
+
+
+class _Map:
+    def __init__(self, values):
+        self.values = values
+
+    def collect(self, container, key):
+        value = container[key]
+        for name in value:
+            self.values.collect(value, name)
+
+
+class _Nullable:
+    def __init__(self, node):
+        self.node = node
+
+    def collect(self, container, key):
+        if container[key] is not None:
+            self.node.collect(container, key)
+
+
+def _fullname(name, namespace):
+    if "." in name or not namespace:
+        return name
+    return f"{namespace}.{name}"
+
+
+def defer(options, readers):
+    return options.with_logical_types(*(schema_.DeferredLogicalType(*key.split("-", 1)) for key in readers))
+
+
+class DeferredConversions:
+    def __init__(self, schema, readers):
+        self.readers = readers
+        self.leaves = []
+        self._names = {}
+        self.root = self._build(schema, None)
+
+    def _build(self, schema, namespace):
+        if isinstance(schema, str):
+            return self._names.get(_fullname(schema, namespace))
+        if isinstance(schema, list):
+            branches = [branch for branch in schema if branch != "null"]
+            nodes = [self._build(branch, namespace) for branch in branches]
+            if not any(nodes):
+                return None
+            if len(branches) > 1:
+                raise ValueError("batch logical readers are not supported in unions of more than one non-null type")
+            return _Nullable(nodes[0]) if len(branches) < len(schema) else nodes[0]
+
+        ty = schema["type"]
+        if not isinstance(ty, str):
+            return self._build(ty, namespace)
+        name = None
+        if "name" in schema:
+            name = _fullname(schema["name"], schema.get("namespace", namespace))
+            namespace = name.rpartition(".")[0]
+
+        fn = self.readers.get(f"{ty}-{schema.get('logicalType')}")
+        if fn is not None:
+            node = _Leaf(fn, schema)
+            self.leaves.append(node)
+            self._names[name] = node
+            return node
+        if ty in ("record", "error"):
+            node = _Record()
+            self._names[name] = node
+            for field in schema["fields"]:
+                sub = self._build(field["type"], namespace)
+                if sub is not None:
+                    node.fields.append((field["name"], sub))
+            return node if node.fields else None
+        if ty == "array":
+            items = self._build(schema["items"], namespace)
+            return None if items is None else _Array(items)
+        if ty == "map":
+            values = self._build(schema["values"], namespace)
+            return None if values is None else _Map(values)
+        return None
+
+    def apply(self, records):
+        if self.root is None:
+            return
+        for i in range(len(records)):
+            self.root.collect(records, i)
+        for leaf in self.leaves:
+            slots, leaf.slots = leaf.slots, []
+            if not slots:
+                continue
+            converted = leaf.fn([container[key] for container, key in slots], leaf.schema)
+            for (container, key), value in zip(slots, converted):
+                container[key] = value
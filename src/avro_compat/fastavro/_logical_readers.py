@@ -1,3 +1,6 @@
 import cavro
 
 LOGICAL_READERS = {k: None for k in cavro.LOGICAL_TYPES}
+
+# "<type>-<logical type>": fn(values, schema) -> list, called once per block per field
+BATCH_LOGICAL_READERS = {}
@@ -0,0 +1,39 @@
+# Imported by require_numpy on first use, so importing the package doesn't load numpy
+np = None
+
+
+# Logical types that map onto numpy datetime64/timedelta64 values with the same epoch and unit
+DATETIME64_DTYPES = {
+    "int-date": "datetime64[D]",
+    "long-timestamp-millis": "datetime64[ms]",
+    "long-timestamp-micros": "datetime64[us]",
+    "long-local-timestamp-millis": "datetime64[ms]",
+    "long-local-timestamp-micros": "datetime64[us]",
+    "int-time-millis": "timedelta64[ms]",
+    "long-time-micros": "timedelta64[us]",
+}
+
+
+def require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for this feature") from None
+        np = numpy
+    return np
+
+
+def datetime64_dtype(schema):
+    return DATETIME64_DTYPES[f"{schema['type']}-{schema['logicalType']}"]
+
+
+def to_datetime64(values, schema):
+    # The encoded integers are already offsets from the unix epoch in the target unit
+    return np.asarray(values, dtype="int64").view(datetime64_dtype(schema))
+
+
+def datetime64_readers():
+    require_numpy()
+    return dict.fromkeys(DATETIME64_DTYPES, to_datetime64)
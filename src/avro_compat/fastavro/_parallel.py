@@ -0,0 +1,47 @@
+import collections
+import concurrent.futures
+
+_worker_state = None
+
+
+def _init_worker(make_state, args):
+    global _worker_state
+    _worker_state = make_state(*args)
+
+
+def _call_worker(fn, item):
+    return fn(_worker_state, item)
+
+
+def ordered_map(fn, make_state, state_args, items, workers, processes=True):
+    # fn(state, item) for each item, in order, with state = make_state(*state_args). With workers, up to
+    # 2 * workers items are in flight in a process or thread pool
+    if workers is None:
+        state = make_state(*state_args)
+        for item in items:
+            yield fn(state, item)
+        return
+    if processes:
+        # Schemas can't be pickled, so each worker builds its own state from picklable arguments
+        pool = concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(make_state, state_args)
+        )
+
+        def submit(item):
+            return pool.submit(_call_worker, fn, item)
+
+    else:
+        state = make_state(*state_args)
+        pool = concurrent.futures.ThreadPoolExecutor(workers)
+
+        def submit(item):
+            return pool.submit(fn, state, item)
+
+    with pool:
+        pending = collections.deque()
+        for item in items:
+            pending.append(submit(item))
+            if len(pending) > 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,130 @@
+import operator
+
+from . import _projection
+
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, options: value in options,
+    "not in": lambda value, options: value not in options,
+}
+
+
+def _steps(path):
+    # Paths are parsed as fields= parses them, but a value must be a single field, not every item of an array
+    steps = _projection._parse_path(path)
+    if "*" in steps:
+        raise ValueError(f"array wildcards are not supported in this field path: {path!r}")
+    return steps
+
+
+def _getter(path):
+    steps = _steps(path)
+    if len(steps) == 1:
+        return operator.itemgetter(steps[0])
+
+    def get(record):
+        for step in steps:
+            if record is None:
+                return None
+            record = record[step]
+        return record
+
+    return get
+
+
+def _compile(expr, paths):
+    if not isinstance(expr, tuple) or not expr:
+        raise ValueError(f"invalid where expression: {expr!r}")
+    op = expr[0]
+    if op in ("and", "or"):
+        tests = [_compile(sub, paths) for sub in expr[1:]]
+        if op == "and":
+            return lambda record: all(test(record) for test in tests)
+        return lambda record: any(test(record) for test in tests)
+    if op == "not":
+        if len(expr) != 2:
+            raise ValueError(f"invalid where expression: {expr!r}")
+        negated = _compile(expr[1], paths)
+        return lambda record: not negated(record)
+    if len(expr) != 3 or expr[1] not in _COMPARISONS:
+        raise ValueError(f"invalid where expression: {expr!r}")
+    path, op, value = expr
+    paths.append(path)
+    get = _getter(path)
+    compare = _COMPARISONS[op]
+    if op in ("==", "!="):
+        return lambda record: compare(get(record), value)
+
+    def test(record):
+        # Ordering and membership tests are false for nulls
+        field = get(record)
+        return field is not None and compare(field, value)
+
+    return test
+
+
+def compile_where(expr):
+    """Compile a where expression into (field paths it reads, test function)
+
+    Expressions are (path, op, value) comparisons, with op one of ==, !=, <, <=, >, >=, in or
+    "not in", combined with ("and", *exprs), ("or", *exprs) and ("not", expr).
+    """
+    paths = []
+    test = _compile(expr, paths)
+    return paths, test
+
+
+def _may_match_comparison(stats, op, value):
+    low, high, nulls = stats["min"], stats["max"], stats["null_count"]
+    if op == "==":
+        return nulls > 0 if value is None else low is not None and low <= value <= high
+    if op == "!=":
+        return nulls > 0 or low is None or value is None or not (low == high == value)
+    if low is None:
+        # Every value is null, which fails ordering and membership tests
+        return op == "not in"
+    if op == "<":
+        return low < value
+    if op == "<=":
+        return low <= value
+    if op == ">":
+        return high > value
+    if op == ">=":
+        return high >= value
+    if op == "in":
+        return any(option is not None and low <= option <= high for option in value)
+    return True
+
+
+def _compile_may_match(expr):
+    op = expr[0]
+    if op in ("and", "or"):
+        tests = [_compile_may_match(sub) for sub in expr[1:]]
+        if op == "and":
+            return lambda fields: all(test(fields) for test in tests)
+        return lambda fields: any(test(fields) for test in tests)
+    if op == "not":
+        return lambda fields: True
+    path, op, value = expr
+
+    def may_match(fields):
+        stats = fields.get(path)
+        if stats is None:
+            return True
+        try:
+            return _may_match_comparison(stats, op, value)
+        except TypeError:
+            return True
+
+    return may_match
+
+
+def compile_may_match(expr):
+    """Compile a where expression into a test of whether a block with the given field statistics could match"""
+    compile_where(expr)  # Validates the expression
+    return _compile_may_match(expr)
@@ -0,0 +1,164 @@
+import re
+
+_STEP = re.compile(r"([^.\[\]]+)|\[\*\]")
+_PRIMITIVES = frozenset(["null", "boolean", "int", "long", "float", "double", "bytes"])
+
+
+class _NoMatch(Exception):
+    pass
+
+
+class _Recursive(Exception):
+    pass
+
+
+def _parse_path(path):
+    steps = []
+    pos = 0
+    for match in _STEP.finditer(path):
+        between = path[pos : match.start()]
+        if between not in ("", ".") or (between == "." and not steps):
+            raise ValueError(f"invalid field path: {path!r}")
+        steps.append(match.group(1) or "*")
+        pos = match.end()
+    if not steps or pos != len(path) or steps[0] == "*":
+        raise ValueError(f"invalid field path: {path!r}")
+    return steps
+
+
+def _build_tree(paths):
+    # Nested dicts of selected steps, None selects everything below a step
+    tree = {}
+    for path in paths:
+        node = tree
+        steps = _parse_path(path)
+        for step in steps[:-1]:
+            child = node.get(step, {})
+            if child is None:
+                break
+            node[step] = child
+            node = child
+        else:
+            node[steps[-1]] = None
+    return tree
+
+
+class _Projector:
+    def __init__(self, skim=False):
+        self.defined = set()
+        # With skim, unselected fields are kept but read as cheaply as possible rather than dropped
+        self.skim = skim
+        self.skimmed = {}
+        # Records being projected or skimmed, cavro can't resolve a skimmed record that refers back to them
+        self.active = set()
+
+    def project(self, ctype, tree):
+        if tree is None:
+            return ctype.get_schema(self.defined)
+        type_name = ctype.type_name
+        if type_name == "union":
+            branches = []
+            matched = False
+            for branch in ctype.union_types:
+                try:
+                    branches.append(self.project(branch, tree))
+                    matched = True
+                except _NoMatch:
+                    branches.append(branch.get_schema(self.defined))
+            if not matched:
+                raise _NoMatch()
+            return branches
+        if type_name in ("record", "error"):
+            return self._project_record(ctype, tree)
+        if type_name in ("array", "map") and tree.keys() == {"*"}:
+            if type_name == "array":
+                return {"type": "array", "items": self.project(ctype.item_type, tree["*"])}
+            return {"type": "map", "values": self.project(ctype.value_type, tree["*"])}
+        raise _NoMatch()
+
+    def _project_record(self, ctype, tree):
+        names = {field.name for field in ctype.fields}
+        if not tree.keys() <= names:
+            raise _NoMatch()
+        fields = []
+        key = (ctype.effective_namespace, ctype.name)
+        self.active.add(key)
+        for field in ctype.fields:
+            if field.name in tree:
+                fields.append(self._field(field, self.project(field.type, tree[field.name])))
+            elif self.skim:
+                fields.append(self._field(field, self._skim(field.type)))
+        self.active.discard(key)
+        projected = self._record(ctype, fields)
+        self.defined.add(projected["name"])
+        return projected
+
+    def _field(self, field, field_type):
+        # Keep defaults and aliases, so projected reader schemas still resolve
+        projected = {k: v for k, v in field.get_schema(set()).items() if k != "type"}
+        projected["type"] = field_type
+        return projected
+
+    def _record(self, ctype, fields):
+        fullname = f"{ctype.effective_namespace}.{ctype.name}" if ctype.effective_namespace else ctype.name
+        projected = {"type": "record", "name": fullname, "fields": fields}
+        if fullname in self.defined:
+            # The same record type projected differently elsewhere, resolve this one through an alias
+            projected["name"] = f"{fullname}_projection{len(self.defined)}"
+            projected["aliases"] = [fullname]
+        return projected
+
+    def _skim(self, ctype):
+        # Strings are read as bytes and logical types left undecoded, which is far cheaper than
+        # decoding them and cheaper than cavro's skipping of fields missing from the reader schema
+        type_name = ctype.type_name
+        if type_name == "string":
+            return "bytes"
+        if type_name in _PRIMITIVES:
+            return type_name
+        if type_name == "array":
+            return {"type": "array", "items": self._skim(ctype.item_type)}
+        if type_name == "map":
+            return {"type": "map", "values": self._skim(ctype.value_type)}
+        if type_name == "union":
+            branches = [self._skim(branch) for branch in ctype.union_types]
+            if branches.count("bytes") > 1:
+                # A union of string and bytes can't read both as bytes
+                return ctype.get_schema(self.defined)
+            return branches
+        if type_name in ("record", "error"):
+            key = (ctype.effective_namespace, ctype.name)
+            if key in self.active:
+                raise _Recursive()
+            try:
+                return self.skimmed[key]
+            except KeyError:
+                pass
+            self.active.add(key)
+            skimmed = self._record(ctype, [self._field(field, self._skim(field.type)) for field in ctype.fields])
+            self.active.discard(key)
+            self.defined.add(skimmed["name"])
+            self.skimmed[key] = skimmed["name"]
+            return skimmed
+        return ctype.get_schema(self.defined)
+
+
+def project(cschema, fields, skim=False):
+    """A reader schema with only the given field paths (e.g. "a", "b.c", "d[*].e") of a record schema"""
+    ctype = cschema.type
+    if ctype.type_name not in ("record", "error"):
+        raise ValueError("fields can only be selected from a record schema")
+    tree = _build_tree(fields)
+    try:
+        return _Projector(skim).project(ctype, tree)
+    except _NoMatch:
+        pass
+    except _Recursive:
+        return project(cschema, fields)
+    # Find the first path that does not match to report it
+    for path in fields:
+        try:
+            _Projector().project(ctype, _build_tree([path]))
+        except _NoMatch:
+            raise ValueError(f"field path {path!r} does not match the schema") from None
+    raise ValueError("field paths do not match the schema")
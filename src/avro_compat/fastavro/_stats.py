@@ -0,0 +1,171 @@
+import datetime
+import decimal
+
+import cavro
+
+from . import _predicate
+
+
+_VALUE = ["null", "boolean", "long", "double", "string", "bytes"]
+_VALUE_TYPES = (bool, int, float, str, bytes)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_LOCAL_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_DATE = datetime.date(1970, 1, 1)
+
+
+def _micros(delta):
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _encode_value(value):
+    # (value, logical), where the decoded value of a logical type is stored as a _VALUE it converts to
+    # losslessly, tagged with the conversion, so blocks keep their range of timestamps, dates or decimals
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            return _micros(value - _LOCAL_EPOCH), "local-timestamp"
+        return _micros(value - _EPOCH), "timestamp"
+    if isinstance(value, datetime.date):
+        return (value - _EPOCH_DATE).days, "date"
+    if isinstance(value, datetime.time) and value.tzinfo is None:
+        return _micros(datetime.datetime.combine(_EPOCH_DATE, value) - _LOCAL_EPOCH), "time"
+    if isinstance(value, decimal.Decimal):
+        return str(value), "decimal"
+    if value is None or isinstance(value, _VALUE_TYPES):
+        return value, None
+    raise TypeError(f"values of type {type(value).__name__}")
+
+
+_LOGICAL_DECODERS = {
+    "timestamp": lambda micros: _EPOCH + datetime.timedelta(microseconds=micros),
+    "local-timestamp": lambda micros: _LOCAL_EPOCH + datetime.timedelta(microseconds=micros),
+    "date": lambda days: _EPOCH_DATE + datetime.timedelta(days=days),
+    "time": lambda micros: (_LOCAL_EPOCH + datetime.timedelta(microseconds=micros)).time(),
+    "decimal": decimal.Decimal,
+}
+
+
+def _encode_field_stats(stats):
+    low, logical = _encode_value(stats["min"])
+    high, _ = _encode_value(stats["max"])
+    return dict(stats, min=low, max=high, logical=logical)
+
+
+def _decode_field_stats(stats):
+    stats = dict(stats)
+    decode = _LOGICAL_DECODERS.get(stats.pop("logical", None))
+    if decode is not None:
+        stats["min"] = decode(stats["min"])
+        stats["max"] = decode(stats["max"])
+    return stats
+
+
+STATS_SCHEMA = {
+    "type": "record",
+    "name": "BlockStats",
+    "namespace": "avro_compat.stats",
+    "fields": [
+        {"name": "block", "type": "long"},
+        {"name": "num_records", "type": "long"},
+        {
+            "name": "fields",
+            "type": {
+                "type": "map",
+                "values": {
+                    "type": "record",
+                    "name": "FieldStats",
+                    "fields": [
+                        {"name": "min", "type": _VALUE},
+                        {"name": "max", "type": _VALUE},
+                        {"name": "null_count", "type": "long"},
+                        {"name": "logical", "type": ["null", "string"], "default": None},
+                    ],
+                },
+            },
+        },
+    ],
+}
+
+_STATS = cavro.Schema(STATS_SCHEMA, parse_json=False, options=cavro.Options(record_decodes_to_dict=True))
+
+
+def _record_type(ctype):
+    if isinstance(ctype, cavro.UnionType):
+        records = [branch for branch in ctype.union_types if isinstance(branch, cavro.RecordType)]
+        return records[0] if len(records) == 1 else None
+    return ctype if isinstance(ctype, cavro.RecordType) else None
+
+
+def _getter(ctype, path):
+    # Like _predicate._getter, but a field a record leaves out reads as its schema default, the value written
+    steps = []
+    for name in _predicate._steps(path):
+        ctype = _record_type(ctype)
+        field = None if ctype is None else next((f for f in ctype.fields if f.name == name), None)
+        steps.append((name, cavro.NO_DEFAULT if field is None else field.default_value))
+        ctype = None if field is None else field.type
+
+    def get(record):
+        for name, default in steps:
+            if record is None:
+                return None
+            try:
+                record = record[name]
+            except KeyError:
+                if default is cavro.NO_DEFAULT:
+                    # Left for the container to reject
+                    return None
+                record = default
+        return record
+
+    return get
+
+
+class StatsCollector:
+    """Per-block min/max/null counts of some fields, fed the values of records before they are written"""
+
+    def __init__(self, paths, cschema):
+        self.paths = list(paths)
+        self._getters = [_getter(cschema.type, path) for path in self.paths]
+        self._pending = []
+        self.blocks = []
+
+    def values(self, record):
+        return [get(record) for get in self._getters]
+
+    def add(self, values):
+        self._pending.append(values)
+
+    def close_block(self, num_records):
+        rows = self._pending[:num_records]
+        del self._pending[:num_records]
+        fields = {}
+        for i, path in enumerate(self.paths):
+            values = [row[i] for row in rows if row[i] is not None]
+            low = high = None
+            if values:
+                try:
+                    low = min(values)
+                    high = max(values)
+                    if _encode_value(low)[1] != _encode_value(high)[1]:
+                        raise TypeError(f"values of types {type(low).__name__} and {type(high).__name__}")
+                except TypeError as e:
+                    raise ValueError(f"cannot collect statistics for {path!r}: {e}") from e
+            fields[path] = {"min": low, "max": high, "null_count": len(rows) - len(values)}
+        self.blocks.append({"block": len(self.blocks), "num_records": num_records, "fields": fields})
+
+
+def write_block_stats(fo, blocks):
+    container = cavro.ContainerWriter(fo, _STATS, "deflate", options=_STATS.options)
+    for block in blocks:
+        fields = {path: _encode_field_stats(stats) for path, stats in block["fields"].items()}
+        container.write_one(dict(block, fields=fields))
+    container.flush(True)
+
+
+def read_block_stats(fo):
+    # Stats files written before logical values were supported have no "logical" field
+    return [
+        dict(block, fields={path: _decode_field_stats(stats) for path, stats in block["fields"].items()})
+        for block in cavro.ContainerReader(fo, options=_STATS.options)
+    ]
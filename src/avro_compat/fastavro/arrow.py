@@ -0,0 +1,282 @@
+import io
+
+import cavro
+
+from . import _block
+from . import schema as schema_
+
+# Imported by _require_pyarrow on first use, so importing the package doesn't load pyarrow
+pa = None
+
+
+def _require_pyarrow():
+    global pa
+    if pa is None:
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("pyarrow is required for arrow conversion") from None
+        pa = pyarrow
+
+
+_PRIMITIVE_TYPES = {
+    "null": "null",
+    "boolean": "bool_",
+    "int": "int32",
+    "long": "int64",
+    "float": "float32",
+    "double": "float64",
+    "bytes": "binary",
+    "string": "string",
+}
+
+
+def _logical_name(ctype):
+    for adapter in ctype.value_adapters:
+        name = getattr(adapter, "logical_name", None)
+        if name is not None:
+            return name
+    return None
+
+
+_UNITS = {"millis": "ms", "micros": "us"}
+
+
+def _logical_arrow_type(ctype, logical):
+    if logical == "date":
+        return pa.date32()
+    if logical == "time-millis":
+        return pa.time32("ms")
+    if logical == "time-micros":
+        return pa.time64("us")
+    if logical in ("timestamp-millis", "timestamp-micros"):
+        return pa.timestamp(_UNITS[logical.rpartition("-")[2]], tz="UTC")
+    if logical in ("local-timestamp-millis", "local-timestamp-micros"):
+        return pa.timestamp(_UNITS[logical.rpartition("-")[2]])
+    if logical == "decimal":
+        schema = ctype.get_schema(set())
+        return pa.decimal128(schema["precision"], schema.get("scale", 0))
+    if logical == "uuid":
+        return pa.string()
+    return None
+
+
+def _branches(ctype):
+    return [branch for branch in ctype.union_types if branch.type_name != "null"]
+
+
+def _branch_name(ctype):
+    return getattr(ctype, "name", None) or ctype.type_name
+
+
+def _nullable(ctype):
+    if ctype.type_name == "null":
+        return True
+    return ctype.type_name == "union" and len(_branches(ctype)) < len(ctype.union_types)
+
+
+def _arrow_type(ctype, parents=()):
+    type_name = ctype.type_name
+    logical = _logical_name(ctype)
+    if logical is not None:
+        arrow_type = _logical_arrow_type(ctype, logical)
+        if arrow_type is not None:
+            return arrow_type
+    if type_name in _PRIMITIVE_TYPES:
+        return getattr(pa, _PRIMITIVE_TYPES[type_name])()
+    if type_name == "fixed":
+        return pa.binary(ctype.size)
+    if type_name == "enum":
+        return pa.dictionary(pa.int32(), pa.string())
+    if type_name in ("record", "error"):
+        if ctype.name in parents:
+            raise ValueError(f"recursive type {ctype.name} cannot be mapped to arrow")
+        parents = parents + (ctype.name,)
+        return pa.struct(
+            [
+                pa.field(field.name, _arrow_type(field.type, parents), nullable=_nullable(field.type))
+                for field in ctype.fields
+            ]
+        )
+    if type_name == "array":
+        item = ctype.item_type
+        return pa.list_(pa.field("item", _arrow_type(item, parents), nullable=_nullable(item)))
+    if type_name == "map":
+        value = ctype.value_type
+        return pa.map_(pa.string(), pa.field("value", _arrow_type(value, parents), nullable=_nullable(value)))
+    if type_name == "union":
+        branches = _branches(ctype)
+        if not branches:
+            return pa.null()
+        if len(branches) == 1:
+            return _arrow_type(branches[0], parents)
+        return pa.dense_union(
+            [pa.field(_branch_name(branch), _arrow_type(branch, parents)) for branch in ctype.union_types],
+            type_codes=list(range(len(ctype.union_types))),
+        )
+    raise ValueError(f"cannot map avro type {type_name} to arrow")
+
+
+def _get_type(schema):
+    if isinstance(schema, cavro.Schema):
+        return schema.type
+    return schema_._get_cschema(schema_.parse_schema(schema)).type
+
+
+def _is_record(ctype):
+    return ctype.type_name in ("record", "error")
+
+
+def _arrow_schema(ctype):
+    if _is_record(ctype):
+        return pa.schema(list(_arrow_type(ctype)))
+    # Files of non-record values become a single column table
+    return pa.schema([pa.field("value", _arrow_type(ctype), nullable=_nullable(ctype))])
+
+
+def arrow_schema(schema):
+    """The arrow schema that the records of an avro schema are converted to"""
+    _require_pyarrow()
+    return _arrow_schema(_get_type(schema))
+
+
+def _has_dense_union(arrow_type):
+    if pa.types.is_union(arrow_type):
+        return True
+    return any(_has_dense_union(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+
+
+class _UnionProbe:
+    # The union encoder picks the branch for a value, so encode it and read back the branch index
+    def __init__(self, ctype):
+        self.schema = cavro.Schema(ctype.get_schema(set()), parse_json=False, options=ctype.options)
+
+    def branch(self, value):
+        return _block.read_long(io.BytesIO(self.schema.binary_encode(value)))
+
+
+def _to_array(values, ctype, arrow_type):
+    if not _has_dense_union(arrow_type):
+        return pa.array(values, type=arrow_type)
+    type_name = ctype.type_name
+    nulls = [v is None for v in values]
+    mask = pa.array(nulls, pa.bool_()) if any(nulls) else None
+    if type_name == "union":
+        branches = _branches(ctype)
+        if len(branches) == 1:
+            return _to_array(values, branches[0], arrow_type)
+        probe = _UnionProbe(ctype)
+        groups = [[] for _ in ctype.union_types]
+        type_ids = []
+        offsets = []
+        for value in values:
+            index = probe.branch(value)
+            type_ids.append(index)
+            offsets.append(len(groups[index]))
+            groups[index].append(value)
+        children = [
+            _to_array(group, branch, arrow_type.field(i).type)
+            for i, (group, branch) in enumerate(zip(groups, ctype.union_types))
+        ]
+        return pa.UnionArray.from_dense(
+            pa.array(type_ids, pa.int8()),
+            pa.array(offsets, pa.int32()),
+            children,
+            [field.name for field in arrow_type],
+            list(arrow_type.type_codes),
+        )
+    if type_name in ("record", "error"):
+        children = [
+            _to_array([None if v is None else v[field.name] for v in values], field.type, arrow_type.field(i).type)
+            for i, field in enumerate(ctype.fields)
+        ]
+        return pa.StructArray.from_arrays(children, fields=list(arrow_type), mask=mask)
+    offsets = [0]
+    for value in values:
+        offsets.append(offsets[-1] + (0 if value is None else len(value)))
+    offsets = pa.array(offsets, pa.int32())
+    if type_name == "array":
+        items = [item for value in values if value is not None for item in value]
+        return pa.ListArray.from_arrays(
+            offsets, _to_array(items, ctype.item_type, arrow_type.value_type), type=arrow_type, mask=mask
+        )
+    # map
+    keys = [key for value in values if value is not None for key in value]
+    items = [item for value in values if value is not None for item in value.values()]
+    return pa.MapArray.from_arrays(
+        offsets, pa.array(keys, pa.string()), _to_array(items, ctype.value_type, arrow_type.item_type), mask=mask
+    )
+
+
+def _record_batch(records, ctype, schema):
+    if _is_record(ctype):
+        return pa.RecordBatch.from_struct_array(_to_array(records, ctype, pa.struct(list(schema))))
+    return pa.RecordBatch.from_arrays([_to_array(records, ctype, schema.field(0).type)], schema=schema)
+
+
+def _iter_record_batches(reader, ctype, schema):
+    # Records already read ahead by __next__ complete the current block
+    records = list(reader._block_records)
+    if records:
+        yield _record_batch(records, ctype, schema)
+    for records in iter(reader._read_block, None):
+        yield _record_batch(records, ctype, schema)
+
+
+def to_arrow(reader):
+    """Read the remaining records of a reader into a pyarrow Table, one record batch per block"""
+    _require_pyarrow()
+    if reader.reader_schema is not None:
+        ctype = schema_._get_cschema(reader.reader_schema).type
+    else:
+        ctype = reader._container.writer_schema.type
+    schema = _arrow_schema(ctype)
+    return pa.Table.from_batches(list(_iter_record_batches(reader, ctype, schema)), schema=schema)
+
+
+def _to_python(value, arrow_type):
+    # Arrow maps come back as lists of (key, value) tuples
+    if value is None:
+        return None
+    if pa.types.is_map(arrow_type):
+        return {key: _to_python(item, arrow_type.item_type) for key, item in value}
+    if pa.types.is_struct(arrow_type):
+        return {field.name: _to_python(value[field.name], field.type) for field in arrow_type}
+    if pa.types.is_list(arrow_type):
+        return [_to_python(item, arrow_type.value_type) for item in value]
+    return value
+
+
+def _has_map(arrow_type):
+    if pa.types.is_map(arrow_type):
+        return True
+    return any(_has_map(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+
+
+def from_arrow(table, schema):
+    """Yield records for an avro schema from a pyarrow Table or RecordBatch, e.g. for writer()"""
+    _require_pyarrow()
+    if isinstance(table, pa.RecordBatch):
+        table = pa.Table.from_batches([table])
+    ctype = _get_type(schema)
+    target = _arrow_schema(ctype)
+    missing = set(target.names) - set(table.column_names)
+    if missing:
+        raise ValueError(f"table has no columns for fields: {', '.join(sorted(missing))}")
+    # Cast once per column, so values only need converting when a column's type differs
+    table = table.select(target.names)
+    if table.schema != target:
+        table = table.cast(target)
+
+    if not _is_record(ctype):
+        value_type = target.field(0).type
+        for batch in table.to_batches():
+            for value in batch.column(0).to_pylist():
+                yield _to_python(value, value_type)
+        return
+    fix_maps = [(field.name, field.type) for field in target if _has_map(field.type)]
+    for batch in table.to_batches():
+        for record in batch.to_pylist():
+            for name, arrow_type in fix_maps:
+                record[name] = _to_python(record[name], arrow_type)
+            yield record
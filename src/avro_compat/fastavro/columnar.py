@@ -0,0 +1,302 @@
+from . import _numpy
+from . import schema as schema_
+from . import write
+
+_NUMPY_DTYPES = {
+    "boolean": "bool",
+    "int": "int32",
+    "long": "int64",
+    "float": "float32",
+    "double": "float64",
+}
+
+
+class Column:
+    """A column of values, `validity` is False where a nullable value is null"""
+
+    def __init__(self, values, validity=None):
+        self.values = values
+        self.validity = validity
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if self.validity is not None and not self.validity[index]:
+            return None
+        return self.values[index]
+
+    def to_list(self):
+        values = self.values.tolist()
+        if self.validity is None:
+            return values
+        return [v if valid else None for v, valid in zip(values, self.validity.tolist())]
+
+
+class BinaryColumn(Column):
+    """A string or bytes column, value i is data[offsets[i]:offsets[i + 1]]"""
+
+    def __init__(self, offsets, data, validity=None, is_string=False):
+        super().__init__(data, validity)
+        self.offsets = offsets
+        self.data = data
+        self.is_string = is_string
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if self.validity is not None and not self.validity[index]:
+            return None
+        value = self.data[self.offsets[index] : self.offsets[index + 1]].tobytes()
+        return value.decode() if self.is_string else value
+
+    def to_list(self):
+        return [self[i] for i in range(len(self))]
+
+
+def _fullname(name, namespace):
+    if "." in name or not namespace:
+        return name
+    return f"{namespace}.{name}"
+
+
+def _collect_named(schema, namespace, names):
+    if isinstance(schema, list):
+        for branch in schema:
+            _collect_named(branch, namespace, names)
+        return
+    if not isinstance(schema, dict):
+        return
+    if not isinstance(schema["type"], str):
+        _collect_named(schema["type"], namespace, names)
+        return
+    if "name" in schema:
+        name = _fullname(schema["name"], schema.get("namespace", namespace))
+        names[name] = schema
+        namespace = name.rpartition(".")[0]
+    for field in schema.get("fields", ()):
+        _collect_named(field["type"], namespace, names)
+    for key in ("items", "values"):
+        if key in schema:
+            _collect_named(schema[key], namespace, names)
+
+
+def _object_array(values):
+    array = _numpy.np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _build_binary(values, is_string):
+    if is_string:
+        values = [v.encode() for v in values]
+    offsets = _numpy.np.zeros(len(values) + 1, dtype="int64")
+    _numpy.np.cumsum([len(v) for v in values], out=offsets[1:])
+    data = _numpy.np.frombuffer(b"".join(values), dtype="uint8")
+    return offsets, data
+
+
+class _ColumnBuilder:
+    def __init__(self, schema, namespace, names, datetime64):
+        self.nullable = False
+        if isinstance(schema, list):
+            branches = [branch for branch in schema if branch != "null"]
+            if len(branches) == 1:
+                self.nullable = len(schema) == 2
+                schema = branches[0]
+            else:
+                schema = None
+        if isinstance(schema, str):
+            schema = names.get(_fullname(schema, namespace), schema)
+        if isinstance(schema, dict) and not isinstance(schema["type"], str):
+            schema = schema["type"]
+        ty = schema["type"] if isinstance(schema, dict) else schema
+        logical = schema.get("logicalType") if isinstance(schema, dict) else None
+        self.type = ty
+        self.logical_key = None if logical is None else f"{ty}-{logical}"
+        self.size = schema.get("size") if isinstance(schema, dict) else None
+
+        self.kind = "object"
+        self.dtype = object
+        self.fill = None
+        if logical is not None:
+            if datetime64 and f"{ty}-{logical}" in _numpy.DATETIME64_DTYPES:
+                self.kind = "numpy"
+                self.dtype = _numpy.datetime64_dtype(schema)
+                self.fill = _numpy.np.datetime64("NaT")
+        elif ty in _NUMPY_DTYPES:
+            self.kind = "numpy"
+            self.dtype = _NUMPY_DTYPES[ty]
+            self.fill = False if ty == "boolean" else 0
+        elif ty == "fixed":
+            # Void rather than bytes dtype, so trailing null bytes are kept
+            self.kind = "fixed"
+            self.dtype = f"V{schema['size']}"
+            self.fill = bytes(schema["size"])
+        elif ty in ("string", "bytes"):
+            self.kind = ty
+            self.fill = "" if ty == "string" else b""
+
+    def build(self, values):
+        validity = None
+        if self.nullable:
+            validity = _numpy.np.fromiter((v is not None for v in values), dtype="bool", count=len(values))
+            if not validity.all():
+                fill = self.fill
+                values = [fill if v is None else v for v in values]
+            else:
+                validity = None
+        if self.kind == "numpy":
+            return Column(_numpy.np.array(values, dtype=self.dtype), validity)
+        if self.kind == "fixed":
+            return Column(_numpy.np.frombuffer(b"".join(values), dtype=self.dtype), validity)
+        if self.kind == "object":
+            return Column(_object_array(values), validity)
+        offsets, data = _build_binary(values, self.kind == "string")
+        return BinaryColumn(offsets, data, validity, is_string=self.kind == "string")
+
+    def prepare(self, name, column, nulls=None):
+        """Check a column's dtype once, returning (array, null mask or None) ready for to_list"""
+        if isinstance(column, BinaryColumn):
+            column = _object_array(column.to_list())
+        if isinstance(column, Column):
+            if column.validity is not None:
+                nulls = ~column.validity if nulls is None else nulls | ~column.validity
+            column = column.values
+        elif isinstance(column, _numpy.np.ma.MaskedArray):
+            mask = _numpy.np.ma.getmaskarray(column)
+            nulls = mask if nulls is None else nulls | mask
+            column = column.data
+        values = _numpy.np.asarray(column)
+        if values.ndim != 1:
+            raise ValueError(f"column {name!r} must be one dimensional")
+
+        if nulls is not None:
+            nulls = _numpy.np.asarray(nulls, dtype="bool")
+            if len(nulls) != len(values):
+                raise ValueError(f"mask for column {name!r} has {len(nulls)} values, expected {len(values)}")
+            if not nulls.any():
+                nulls = None
+            elif not self.nullable:
+                raise ValueError(f"column {name!r} contains nulls, but its field is not nullable")
+        if values.dtype != object:
+            values = self._check_dtype(name, values, nulls)
+        return values, nulls
+
+    def _check_dtype(self, name, values, nulls):
+        kind = values.dtype.kind
+        valid = values if nulls is None else values[~nulls]
+        if self.logical_key in _numpy.DATETIME64_DTYPES:
+            if kind in "Mm":
+                return values.astype(_numpy.DATETIME64_DTYPES[self.logical_key]).view("int64")
+            ok = kind in "iu"
+        elif self.logical_key is not None:
+            ok = True
+        elif self.type == "boolean":
+            ok = kind == "b"
+        elif self.type in ("int", "long"):
+            ok = kind in "iu"
+            bits = 32 if self.type == "int" else 64
+            if ok and len(valid) and (valid.min() < -(1 << bits - 1) or valid.max() >= 1 << bits - 1):
+                raise ValueError(f"column {name!r} has values out of range for {self.type}")
+        elif self.type in ("float", "double"):
+            ok = kind in "fiu"
+        elif self.type in ("string", "enum"):
+            ok = kind == "U"
+        elif self.type == "bytes":
+            ok = kind in "SV"
+        elif self.type == "fixed":
+            ok = kind in "SV" and values.dtype.itemsize == self.size
+            if ok:
+                # Void items keep their trailing null bytes in tolist()
+                return values.view(f"V{self.size}")
+        else:
+            ok = True
+        if not ok:
+            raise ValueError(f"column {name!r} has dtype {values.dtype}, which cannot be written as {self.type}")
+        return values
+
+    @staticmethod
+    def to_list(values, nulls):
+        values = values.tolist()
+        if nulls is None:
+            return values
+        return [None if null else v for v, null in zip(values, nulls.tolist())]
+
+
+class ColumnPlan:
+    def __init__(self, schema, datetime64=False):
+        _numpy.require_numpy()
+        if not isinstance(schema, dict) or schema.get("type") not in ("record", "error"):
+            raise ValueError("columnar reads require a record schema")
+        names = {}
+        _collect_named(schema, None, names)
+        namespace = _fullname(schema["name"], schema.get("namespace")).rpartition(".")[0]
+        self.fields = [
+            (field["name"], _ColumnBuilder(field["type"], namespace, names, datetime64)) for field in schema["fields"]
+        ]
+
+    def build(self, records):
+        return {name: builder.build([record[name] for record in records]) for name, builder in self.fields}
+
+    @property
+    def nullable_fields(self):
+        return [name for name, builder in self.fields if builder.nullable]
+
+
+def write_columns(
+    fo,
+    schema,
+    columns,
+    codec="null",
+    sync_interval=1000 * 16,
+    metadata=None,
+    codec_compression_level=None,
+    *,
+    masks=None,
+    chunk_size=10_000,
+):
+    """Write records from a mapping of field name to array-like, masks are True where a value is null"""
+    _numpy.require_numpy()
+    masks = masks or {}
+    output = write.Writer(fo, schema, codec, sync_interval, metadata, compression_level=codec_compression_level)
+    plan = ColumnPlan(output._container.schema.type.get_schema(set()))
+    builders = dict(plan.fields)
+
+    unknown = (columns.keys() | masks.keys()) - builders.keys()
+    if unknown:
+        raise ValueError(f"no fields in schema for columns: {', '.join(sorted(unknown))}")
+    prepared = {name: builders[name].prepare(name, column, masks.get(name)) for name, column in columns.items()}
+    lengths = {len(values) for values, _ in prepared.values()}
+    if len(lengths) > 1:
+        raise ValueError("columns must all have the same length")
+    num_records = lengths.pop() if lengths else 0
+
+    names = list(prepared)
+    for start in range(0, num_records, chunk_size):
+        end = start + chunk_size
+        lists = [
+            _ColumnBuilder.to_list(values[start:end], None if nulls is None else nulls[start:end])
+            for values, nulls in prepared.values()
+        ]
+        records = [dict(zip(names, row)) for row in zip(*lists)]
+        try:
+            output._container.write_many(records)
+        except ValueError as e:
+            raise write._substitute_write_error(records, e) from e
+    output._container.flush(True)
+
+
+def write_dataframe(fo, schema, frame, **kwargs):
+    """write_columns for a pandas DataFrame, missing values in nullable fields are written as null"""
+    parsed = schema_.parse_schema(schema)
+    nullable = set(ColumnPlan(schema_._get_cschema(parsed).type.get_schema(set())).nullable_fields)
+    masks = dict(kwargs.pop("masks", None) or {})
+    columns = {}
+    for name in frame.columns:
+        series = frame[name]
+        if name in nullable and name not in masks and series.hasnans:
+            masks[name] = series.isna().to_numpy()
+        columns[name] = series.to_numpy()
+    write_columns(fo, parsed, columns, masks=masks, **kwargs)
@@ -0,0 +1,154 @@
+import mmap
+import os
+import struct
+
+import cavro
+
+from . import schema as schema_
+from . import _block
+from . import _predicate
+from . import _projection
+from ._stats import _VALUE, _VALUE_TYPES
+
+# Layout, all integers little-endian:
+#   magic, sync marker of the indexed file, block count, key path length, key path (padded to 8 bytes)
+#   block count + 1 entries of (block offset, first record number, position of the block's keys)
+#   min and max key of each block, avro encoded as _KEY_VALUE
+# The final entry marks the end of the last block, so entry i + 1 bounds block i.
+_MAGIC = b"AVROIDX1"
+_HEADER = struct.Struct("<8s16sQQ")
+_ENTRY = struct.Struct("<QQQ")
+_KEY_VALUE = cavro.Schema(_VALUE, parse_json=False)
+
+
+def _pad(size):
+    return -size % 8
+
+
+def _key_decoder(writer_cschema, key):
+    # Keys are compared as their underlying avro values, so logical types are left undecoded
+    options = schema_._get_options(raw_logical_types=True)
+    projected = schema_._get_cschema(schema_.parse_schema(_projection.project(writer_cschema, [key]), _options=options))
+    return projected.reader_for_writer(writer_cschema), _predicate._getter(key)
+
+
+def _block_keys(data, num_records, decoder, get):
+    reader = cavro.MemoryReader(data)
+    return [get(decoder.binary_read(reader)) for _ in range(num_records)]
+
+
+class ContainerIndex:
+    """Block offsets, record numbers and key ranges of a container file, read in place from a buffer"""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        magic, self.sync_marker, self.num_blocks, key_size = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError("not a container index")
+        start = _HEADER.size
+        self.key = bytes(buffer[start : start + key_size]).decode() or None
+        self._entries = start + key_size + _pad(key_size)
+        self._keys = self._entries + (self.num_blocks + 1) * _ENTRY.size
+
+    @property
+    def num_records(self):
+        return self._entry(self.num_blocks)[1]
+
+    def _entry(self, block):
+        return _ENTRY.unpack_from(self._buffer, self._entries + block * _ENTRY.size)
+
+    def block_offset(self, block):
+        return self._entry(block)[0]
+
+    def first_record(self, block):
+        return self._entry(block)[1]
+
+    def key_range(self, block):
+        if self.key is None:
+            raise ValueError("index has no key")
+        reader = cavro.MemoryReader(memoryview(self._buffer)[self._keys + self._entry(block)[2] :])
+        return _KEY_VALUE.binary_read(reader), _KEY_VALUE.binary_read(reader)
+
+    def find_record(self, n):
+        """The (block offset, records to skip in that block) of record n"""
+        if n < 0:
+            raise ValueError("record numbers must not be negative")
+        if n >= self.num_records:
+            return self.block_offset(self.num_blocks), 0
+        low, high = 0, self.num_blocks - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.first_record(mid) <= n:
+                low = mid
+            else:
+                high = mid - 1
+        return self.block_offset(low), n - self.first_record(low)
+
+    def find_key(self, key):
+        """The first block that could contain key, or None"""
+        low, high = 0, self.num_blocks
+        while low < high:
+            mid = (low + high) // 2
+            if self.key_range(mid)[1] < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low == self.num_blocks or key < self.key_range(low)[0]:
+            return None
+        return low
+
+    def tobytes(self):
+        return bytes(self._buffer)
+
+    def write(self, fo):
+        fo.write(self._buffer)
+
+
+def build_index(fo, key=None):
+    """Index the blocks of a container file, key is a field path the file is sorted by"""
+    header = _block.read_header(fo)
+    if key is not None:
+        writer_cschema = cavro.Schema(header.schema, options=schema_._get_options(raw_logical_types=True))
+        decoder, get = _key_decoder(writer_cschema, key)
+    entries = []
+    keys = bytearray()
+    num_records = 0
+    last = None
+    # Without a key only the block headers are needed
+    blocks = _block.iter_blocks(fo, header) if key is not None else _block.iter_block_headers(fo, header)
+    for block in blocks:
+        if not block.num_records:
+            continue
+        entries.append(_ENTRY.pack(block.offset, num_records, len(keys)))
+        num_records += block.num_records
+        if key is None:
+            continue
+        values = _block_keys(block.decompress(), block.num_records, decoder, get)
+        for value in values:
+            if value is None or not isinstance(value, _VALUE_TYPES):
+                raise ValueError(f"cannot index {key!r} values of type {type(value).__name__}")
+            if last is not None and value < last:
+                raise ValueError(f"file is not sorted by {key!r}")
+            last = value
+        keys += _KEY_VALUE.binary_encode(values[0])
+        keys += _KEY_VALUE.binary_encode(values[-1])
+    entries.append(_ENTRY.pack(fo.tell(), num_records, len(keys)))
+
+    key_path = (key or "").encode()
+    out = bytearray(_HEADER.pack(_MAGIC, header.sync_marker, len(entries) - 1, len(key_path)))
+    out += key_path + bytes(_pad(len(key_path)))
+    out += b"".join(entries)
+    out += keys
+    return ContainerIndex(bytes(out))
+
+
+def load_index(source):
+    """Load an index from a path or binary file, memory mapped where possible"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fo:
+            return load_index(fo)
+    try:
+        fileno = source.fileno()
+    except (AttributeError, OSError):
+        return ContainerIndex(source.read())
+    return ContainerIndex(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
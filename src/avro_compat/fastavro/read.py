@@ -1,9 +1,26 @@
 import cavro
+import codecs
+import collections.abc
+import io
+import itertools
+import json
+import os
+import re
 import warnings
 from . import schema as schema_
 from ._read_common import SchemaResolutionError, HEADER_SCHEMA
-from ._logical_readers import LOGICAL_READERS
+from ._logical_readers import LOGICAL_READERS, BATCH_LOGICAL_READERS
 from . import _read
+from . import _block
+from . import _container
+from . import _predicate
+from . import _projection
+from . import _stats
+from . import _deferred
+from . import _numpy
+from . import columnar
+from . import index as index_
+from . import _parallel
 from .write import _substitute_write_error
 
 from fastavro.read import is_avro, json_reader as fa_json_reader
@@ -12,24 +29,240 @@ from fastavro.json_read import AvroJSONDecoder
 _ORIG_LOGICAL_READERS = LOGICAL_READERS.copy()
 
 
+def _rebatch(blocks, size):
+    # Slices whole blocks rather than pulling records one at a time through __next__
+    pending = []
+    for records in blocks:
+        pending += records
+        full = len(pending) - len(pending) % size
+        for start in range(0, full, size):
+            yield pending[start : start + size]
+        pending = pending[full:]
+    if pending:
+        yield pending
+
+
 class reader:
-    def __init__(self, fo, reader_schema=None, **kwargs):
+    def __init__(
+        self,
+        fo,
+        reader_schema=None,
+        *,
+        datetime64=False,
+        fields=None,
+        where=None,
+        where_fields=None,
+        block_stats=None,
+        index=None,
+        start=None,
+        end=None,
+        header=None,
+        recover=False,
+        follow=False,
+        poll_interval=0.1,
+        max_poll_interval=5.0,
+        idle_timeout=None,
+        prefetch_blocks=0,
+        **kwargs,
+    ):
+        batch_readers = {k: v for k, v in BATCH_LOGICAL_READERS.items() if v is not None}
+        if datetime64:
+            batch_readers.update(_numpy.datetime64_readers())
+        options = schema_._get_options(**kwargs)
+        if batch_readers:
+            options = _deferred.defer(options, batch_readers)
+
         reader_cschema = None
         if reader_schema is not None:
             reader_schema = schema_.parse_schema(reader_schema, **kwargs)
+            if batch_readers:
+                reader_schema = schema_.parse_schema(
+                    reader_schema, _options=_deferred.defer(schema_._get_cschema(reader_schema).options, batch_readers)
+                )
             reader_cschema = schema_._get_cschema(reader_schema)
+        self._fo = fo
+        self._options = options
+        self._reader_cschema = reader_cschema
+        self._fo_start = self._tell()
+        split = start is not None or end is not None or header is not None
+        if split and (index is not None or block_stats is not None):
+            raise ValueError("start and end cannot be combined with index or block_stats")
+        if follow and (end is not None or recover or prefetch_blocks):
+            raise ValueError("follow cannot be combined with end, recover or prefetch_blocks")
+        if prefetch_blocks < 0:
+            raise ValueError("prefetch_blocks must not be negative")
         try:
-            self._container = cavro.ContainerReader(
-                fo, reader_schema=reader_cschema, options=schema_._get_options(**kwargs)
-            )
+            if split:
+                if header is None:
+                    fo.seek(0)
+                self._container = _container.BlockContainer(fo, options, header)
+            elif fields is not None or where is not None or index is not None or recover or follow or prefetch_blocks:
+                # These depend on the writer schema or on reading blocks, so blocks are read here rather than by cavro
+                self._container = _container.BlockContainer(fo, options)
+            else:
+                self._container = cavro.ContainerReader(fo, reader_schema=reader_cschema, options=options)
         except cavro.CodecUnavailable as e:
             raise ValueError("Unrecognized codec") from e
         except EOFError:
             raise ValueError("cannot read header - is it an avro file?")
 
+        if split:
+            self._container.set_range(start or 0, end)
+        if recover:
+            self._container.set_recovery(True)
+        if follow:
+            self._container.set_follow(poll_interval, max_poll_interval, idle_timeout)
+        if prefetch_blocks:
+            self._container.set_prefetch(prefetch_blocks)
+        source_cschema = reader_cschema or self._container.writer_schema
+        self._index = None
+        if index is not None:
+            self._set_index(index, where)
+        if where is not None:
+            self._set_where(where, where_fields, source_cschema, options)
+        if block_stats is not None:
+            self._set_block_stats(where, block_stats)
+        if fields is not None:
+            reader_schema = self._project(source_cschema, fields, options)
+            reader_cschema = schema_._get_cschema(reader_schema)
+            self._container.set_reader_schema(reader_cschema)
+        elif reader_cschema is not None and isinstance(self._container, _container.BlockContainer):
+            self._container.set_reader_schema(reader_cschema)
+
+        self._fo_ready = self._tell()
         self.reader_schema = reader_schema
         self.writer_schema = schema_._wrap_type(self._container.writer_schema.schema, self._container.writer_schema)
 
+        self._datetime64 = datetime64
+
+        # Batch logical readers are applied to a whole block of records at a time
+        self._deferred = None
+        self._block_records = iter(())
+        if batch_readers:
+            decode_schema = reader_cschema or self._container.writer_schema
+            deferred = _deferred.DeferredConversions(decode_schema.type.get_schema(set()), batch_readers)
+            if deferred.leaves:
+                self._deferred = deferred
+
+    def _project(self, source_cschema, fields, options, skim=False):
+        return schema_.parse_schema(_projection.project(source_cschema, fields, skim), _options=options)
+
+    def _set_where(self, where, where_fields, source_cschema, options):
+        if callable(where):
+            paths = where_fields
+            if paths is None:
+                test = where
+            else:
+                # Callables only see the fields they asked for, not the skimmed rest of the record
+                names = list(dict.fromkeys(_projection._parse_path(path)[0] for path in paths))
+
+                def test(record):
+                    return where({name: record[name] for name in names})
+
+        else:
+            paths, test = _predicate.compile_where(where)
+        test_schema = None
+        if paths is not None:
+            # The test schema reads every field so the container can find where each record ends, but only
+            # the tested fields are fully decoded
+            writer_cschema = self._container.writer_schema
+            try:
+                projected = schema_._get_cschema(self._project(source_cschema, paths, options, skim=True))
+                test_schema = projected.reader_for_writer(writer_cschema)
+            except cavro.CavroException:
+                projected = schema_._get_cschema(self._project(source_cschema, paths, options))
+                test_schema = projected.reader_for_writer(writer_cschema)
+        self._container.set_filter(test, test_schema)
+
+    def _set_block_stats(self, where, block_stats):
+        if where is None or callable(where):
+            raise ValueError("block_stats can only be used with a where expression")
+        if not isinstance(block_stats, list):
+            block_stats = _stats.read_block_stats(block_stats)
+        by_block = {stats["block"]: stats for stats in block_stats}
+        may_match = _predicate.compile_may_match(where)
+
+        def skip_block(ordinal, block):
+            stats = by_block.get(ordinal)
+            if stats is None:
+                return False
+            if stats["num_records"] != block.num_records:
+                raise ValueError(f"block statistics do not match the block at offset {block.offset}")
+            return not may_match(stats["fields"])
+
+        self._container.set_block_filter(skip_block)
+
+    def _set_index(self, index, where):
+        if where is not None:
+            raise ValueError("index cannot be combined with where")
+        if not isinstance(index, index_.ContainerIndex):
+            index = index_.load_index(index)
+        if index.sync_marker != self._container.marker:
+            raise ValueError("index does not belong to this file")
+        self._index = index
+        self._key_decoder = None
+
+    def _tell(self):
+        # Only files that say they are seekable are asked for their position
+        seekable = getattr(self._fo, "seekable", None)
+        if seekable is None or not seekable():
+            return None
+        return self._fo.tell()
+
+    def skip(self, n):
+        """Skip the next n records, whole blocks are stepped over by their headers without being read"""
+        if n < 0:
+            raise ValueError("cannot skip a negative number of records")
+        buffered = list(self._block_records)
+        self._block_records = iter(buffered[n:])
+        n = max(0, n - len(buffered))
+        if not n:
+            return
+        if not isinstance(self._container, _container.BlockContainer) and self._fo_ready is not None:
+            if self._tell() == self._fo_ready:
+                # cavro hasn't read past the header yet, so blocks can be read here from the start instead
+                self._fo.seek(self._fo_start)
+                self._container = _container.BlockContainer(self._fo, self._options)
+                if self._reader_cschema is not None:
+                    self._container.set_reader_schema(self._reader_cschema)
+        if isinstance(self._container, _container.BlockContainer):
+            self._container.skip(n)
+        else:
+            for _ in zip(range(n), self._container):
+                pass
+
+    def _require_index(self):
+        if self._index is None:
+            raise ValueError("random access requires an index")
+        return self._index
+
+    def seek_record(self, n):
+        """Position the reader so the next record read is record n"""
+        offset, skip = self._require_index().find_record(n)
+        self._container.seek_block(offset, skip)
+        self._block_records = iter(())
+
+    def get(self, key, default=None):
+        """The first record with key in the index's key field, reading continues after it"""
+        index = self._require_index()
+        if index.key is None:
+            raise ValueError("index has no key")
+        block = index.find_key(key)
+        if block is None:
+            return default
+        if self._key_decoder is None:
+            options = schema_._get_options(raw_logical_types=True)
+            writer_cschema = cavro.Schema(self._container.header.schema, options=options)
+            self._key_decoder = index_._key_decoder(writer_cschema, index.key)
+        raw = self._container.read_block_at(index.block_offset(block))
+        keys = index_._block_keys(raw.decompress(), raw.num_records, *self._key_decoder)
+        try:
+            position = keys.index(key)
+        except ValueError:
+            return default
+        self.seek_record(index.first_record(block) + position)
+        return next(self)
+
     @property
     def schema(self):
         warnings.warn("schema is deprecated, use reader_schema instead", DeprecationWarning)
@@ -47,11 +280,51 @@ class reader:
     def metadata(self):
         return {k: v.decode() for k, v in self._container.metadata.items()}
 
+    @property
+    def recovery(self):
+        """The corrupt blocks skipped so far when reading with recover=True, otherwise None"""
+        return getattr(self._container, "recovery", None)
+
+    def _read_block(self):
+        items = [next(self._container)]  # Ensure the next block is read
+        items += itertools.islice(self._container, self._container.objects_left_in_block)
+        if self._deferred is not None:
+            self._deferred.apply(items)
+        return items
+
+    def iter_batches(self, batch_size=None):
+        """Yield dicts of field name to Column, one per block or per batch_size records
+
+        Records are still decoded one by one as in list(reader), so this changes the layout of the values, not
+        the cost of decoding them.
+        """
+        _numpy.require_numpy()
+        cschema = schema_._get_cschema(self.reader_schema) if self.reader_schema is not None else None
+        decode_schema = cschema or self._container.writer_schema
+        plan = columnar.ColumnPlan(decode_schema.type.get_schema(set()), datetime64=self._datetime64)
+        blocks = self._iter_block_lists()
+        if batch_size is not None:
+            blocks = _rebatch(blocks, batch_size)
+        for records in blocks:
+            yield plan.build(records)
+
+    def _iter_block_lists(self):
+        # Records already read ahead by __next__ complete the current block
+        records = list(self._block_records)
+        if records:
+            yield records
+        yield from iter(self._read_block, None)
+
     def __iter__(self):
         return self
 
     def __next__(self):
-        return self._container.__next__()
+        if self._deferred is None:
+            return self._container.__next__()
+        for record in self._block_records:
+            return record
+        self._block_records = iter(self._read_block())
+        return next(self._block_records)
 
 
 class json_reader:
@@ -96,12 +369,190 @@ class block_reader(reader):
         return self
 
     def __next__(self):
-        rec = next(self._container)  # Ensure the next block is read
-        n_left = self._container.objects_left_in_block
-        items = [rec]
-        for _ in range(n_left):
-            items.append(next(self._container))
-        return Block(items, self)
+        return Block(self._read_block(), self)
+
+
+class raw_record_reader:
+    def __init__(self, fo, **kwargs):
+        self._fo = fo
+        self._header = _block.read_header(fo)
+        writer_cschema = cavro.Schema(self._header.schema, options=schema_._get_options(**kwargs))
+        self.writer_schema = schema_._wrap_type(writer_cschema.schema, writer_cschema)
+        self._records = self._iter_records(_block.iter_blocks(fo, self._header), schema_._skip_schema(writer_cschema))
+
+    @property
+    def codec(self):
+        return self._header.codec
+
+    @property
+    def metadata(self):
+        return {k: v.decode() for k, v in self._header.metadata.items()}
+
+    def _iter_records(self, blocks, skip_schema):
+        for block in blocks:
+            data = block.decompress()
+            view = memoryview(data)
+            buf = io.BytesIO(data)
+            reader = cavro.FileReader(buf)
+            start = 0
+            for _ in range(block.num_records):
+                skip_schema.binary_read(reader)
+                end = buf.tell()
+                yield view[start:end]
+                start = end
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._records)
+
+
+class _Projections:
+    # Reader schemas for subsets of a record's fields, built as fields are first accessed
+    def __init__(self, writer, reader=None):
+        self.writer = writer
+        self.source = reader or writer
+        self.fields = {field.name: field for field in self.source.type.fields}
+        self.names = list(self.fields)
+        self.full = writer if reader is None else schema_._reader_for_writer(reader, writer)
+        # Fields accessed so far, later blocks decode all of them in one pass
+        self.hot = frozenset()
+        self.misses = 0
+        self._decoders = {}
+
+    def decoder(self, names):
+        if len(names) == len(self.names):
+            return self.full
+        try:
+            return self._decoders[names]
+        except KeyError:
+            pass
+        ty = self.source.type
+        defined = set()
+        fields = [field.get_schema(defined) for name, field in self.fields.items() if name in names]
+        projection = {"type": "record", "name": ty.name, "namespace": ty.effective_namespace, "fields": fields}
+        try:
+            decoder = cavro.Schema(projection, parse_json=False, options=self.source.options).reader_for_writer(
+                self.writer
+            )
+        except cavro.DuplicateName:
+            # A field refers back to the record itself, so only the whole record can be decoded
+            decoder = self.full
+        self._decoders[names] = decoder
+        return decoder
+
+
+_LAZY_MAX_MISSES = 8
+
+
+class _LazyBlock:
+    def __init__(self, data, num_records, projections):
+        self.data = data
+        self.num_records = num_records
+        self.projections = projections
+        self.columns = {}
+
+    def get(self, index, name):
+        try:
+            column = self.columns[name]
+        except KeyError:
+            if name not in self.projections.fields:
+                raise
+            self._load(name)
+            column = self.columns[name]
+        return column[index]
+
+    def _load(self, name):
+        projections = self.projections
+        projections.hot = projections.hot | {name}
+        if self.columns:
+            # A second miss in the same block decodes everything rather than a pass per field, and
+            # if that keeps happening most fields are being read, so later blocks are decoded whole
+            projections.misses += 1
+            if projections.misses > _LAZY_MAX_MISSES:
+                projections.hot = frozenset(projections.names)
+            decoder = projections.full
+        else:
+            decoder = projections.decoder(projections.hot)
+        reader = cavro.MemoryReader(self.data)
+        rows = [decoder.binary_read(reader) for _ in range(self.num_records)]
+        names = projections.names if decoder is projections.full else projections.hot
+        for field in names:
+            if field not in self.columns:
+                self.columns[field] = [row[field] for row in rows]
+
+
+class LazyRecord(collections.abc.Mapping):
+    """A read-only record view, fields are decoded from the block's bytes when first accessed"""
+
+    __slots__ = ("_block", "_index")
+
+    def __init__(self, block, index):
+        self._block = block
+        self._index = index
+
+    def __getitem__(self, name):
+        return self._block.get(self._index, name)
+
+    def __iter__(self):
+        return iter(self._block.projections.names)
+
+    def __len__(self):
+        return len(self._block.projections.names)
+
+    def __repr__(self):
+        return f"LazyRecord({dict(self)!r})"
+
+
+class lazy_reader:
+    def __init__(self, fo, reader_schema=None, **kwargs):
+        self._header = _block.read_header(fo)
+        writer_cschema = cavro.Schema(self._header.schema, options=schema_._get_options(**kwargs))
+        if not isinstance(writer_cschema.type, cavro.RecordType):
+            raise ValueError("lazy records require a record schema")
+        self.writer_schema = schema_._wrap_type(writer_cschema.schema, writer_cschema)
+        reader_cschema = None
+        if reader_schema is not None:
+            reader_schema = schema_.parse_schema(reader_schema, **kwargs)
+            reader_cschema = schema_._get_cschema(reader_schema)
+        self.reader_schema = reader_schema
+        self._projections = _Projections(writer_cschema, reader_cschema)
+        self._records = self._iter_records(_block.iter_blocks(fo, self._header))
+
+    @property
+    def codec(self):
+        return self._header.codec
+
+    @property
+    def metadata(self):
+        return {k: v.decode() for k, v in self._header.metadata.items()}
+
+    def _iter_records(self, blocks):
+        for block in blocks:
+            lazy_block = _LazyBlock(block.decompress(), block.num_records, self._projections)
+            for index in range(block.num_records):
+                yield LazyRecord(lazy_block, index)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._records)
+
+
+def read_header(fo):
+    """Parse a container file's header, which can be passed to readers of byte ranges of the same file"""
+    return _block.read_header(fo)
+
+
+def count_records(fo):
+    """The number of records in a container file, read from the block headers alone"""
+    if isinstance(fo, (str, os.PathLike)):
+        with open(fo, "rb") as fo:
+            return count_records(fo)
+    header = _block.read_header(fo)
+    return sum(block.num_records for block in _block.iter_block_headers(fo, header))
 
 
 def schemaless_reader(fo, writer_schema, reader_schema=None, **kwargs):
@@ -116,10 +567,125 @@ def schemaless_reader(fo, writer_schema, reader_schema=None, **kwargs):
     return schema.binary_read(reader)
 
 
-def json_reader(fo, schema, reader_schema=None, *, decoder=AvroJSONDecoder):
+_JSON_SEPARATORS = re.compile(r"[\s,]*")
+
+
+def _iter_ndjson_chunks(fo, buf, chunk_size):
+    newline = "\n" if isinstance(buf, str) else b"\n"
+    while True:
+        more = fo.read(chunk_size)
+        if not more:
+            break
+        buf += more
+        cut = buf.rfind(newline) + 1
+        if cut:
+            yield buf[:cut]
+            buf = buf[cut:]
+    if buf.strip():
+        yield buf
+
+
+def _iter_json_array_chunks(fo, buf, chunk_size):
+    if isinstance(buf, bytes):
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        buf = text_decoder.decode(buf)
+
+        def read():
+            data = fo.read(chunk_size)
+            return text_decoder.decode(data, final=not data)
+
+    else:
+
+        def read():
+            return fo.read(chunk_size)
+
+    decoder = json.JSONDecoder()
+    pos = buf.index("[") + 1
+    values = []
+    eof = False
+    while True:
+        pos = _JSON_SEPARATORS.match(buf, pos).end()
+        if pos < len(buf) and buf[pos] == "]":
+            break
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+            # A value running up to the end of the buffer may be truncated
+            complete = eof or end < len(buf)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        if complete:
+            values.append(value)
+            pos = end
+            continue
+        if values:
+            yield values
+            values = []
+        more = read()
+        eof = not more
+        buf = buf[pos:] + more
+        pos = 0
+    if values:
+        yield values
+
+
+def _iter_json_chunks(fo, cschema, chunk_size):
+    buf = fo.read(chunk_size)
+    while buf and not buf.strip():
+        buf = fo.read(chunk_size)
+    if not buf:
+        return
+    first = buf.lstrip()[:1]
+    if first in ("[", b"[") and not isinstance(cschema.type, cavro.ArrayType):
+        yield from _iter_json_array_chunks(fo, buf, chunk_size)
+    else:
+        yield from _iter_ndjson_chunks(fo, buf, chunk_size)
+
+
+def _json_decode_lines(schema, lines):
+    for line in lines:
+        try:
+            schema.json_decode(line)
+        except ValueError as e:
+            raise _substitute_write_error(line, e) from e
+
+
+def _json_decode_chunk(schema, chunk):
+    if isinstance(chunk, list):
+        values = chunk
+    else:
+        lines = [line for line in chunk.splitlines() if line.strip()]
+        if isinstance(chunk, str):
+            text = "[" + ",".join(lines) + "]"
+        else:
+            text = b"[" + b",".join(lines) + b"]"
+        try:
+            # Parse every line in the chunk with one call into the json module
+            values = json.loads(text)
+        except ValueError:
+            _json_decode_lines(schema, lines)
+            raise
+    records = []
+    for value in values:
+        try:
+            records.append(schema.json_decode(value, deserialize=False))
+        except ValueError as e:
+            raise _substitute_write_error(value, e) from e
+    return records
+
+
+def _make_json_decode_state(writer_schema, reader_schema):
+    schema = schema_._get_cschema(schema_.parse_schema(writer_schema))
+    if reader_schema is not None:
+        schema = schema_._get_cschema(schema_.parse_schema(reader_schema)).reader_for_writer(schema)
+    return schema
+
+
+def json_reader(fo, schema, reader_schema=None, *, decoder=AvroJSONDecoder, chunk_size=None, workers=None):
     if decoder is not AvroJSONDecoder:
         return fa_json_reader(fo, schema, reader_schema, decoder=decoder)
-    
+
     writer_schema = schema_.parse_schema(schema)
     if reader_schema is None:
         reader_schema = writer_schema
@@ -128,6 +694,23 @@ def json_reader(fo, schema, reader_schema=None, *, decoder=AvroJSONDecoder):
         reader_schema = schema_.parse_schema(reader_schema)
         cschema = schema_._reader_for_writer(schema_._get_cschema(reader_schema), schema_._get_cschema(writer_schema))
 
+    if chunk_size is not None or workers is not None:
+        chunks = _iter_json_chunks(fo, cschema, chunk_size or 1 << 20)
+        if workers is not None:
+            writer_source = schema_._get_cschema(writer_schema).type.get_schema(set())
+            reader_source = None
+            if reader_schema is not writer_schema:
+                reader_source = schema_._get_cschema(reader_schema).type.get_schema(set())
+            state_args = (writer_source, reader_source)
+            for records in _parallel.ordered_map(
+                _json_decode_chunk, _make_json_decode_state, state_args, chunks, workers
+            ):
+                yield from records
+        else:
+            for chunk in chunks:
+                yield from _json_decode_chunk(cschema, chunk)
+        return
+
     for line in fo:
         if not line.strip():
             continue
@@ -0,0 +1,110 @@
+import argparse
+import itertools
+import json
+import os
+
+import cavro
+
+from . import schema as schema_
+from . import _block
+from . import _codecs
+from . import _parallel
+
+# Records stay as cavro Records between decoding and re-encoding, there's no need to build dicts, and
+# logical types stay as their underlying values, which re-encode as they were read
+_REWRITE_OPTIONS = schema_._OPTIONS.replace(logical_types=(), record_decodes_to_dict=False)
+
+
+def _output_metadata(header, schema_json, codec, metadata):
+    out = {k: v for k, v in header.metadata.items() if k not in ("avro.schema", "avro.codec")}
+    if metadata:
+        out.update({k: v.encode() if isinstance(v, str) else v for k, v in metadata.items()})
+    out["avro.schema"] = schema_json.encode()
+    out["avro.codec"] = codec.encode()
+    return out
+
+
+def _make_rewrite_state(writer_schema, reader_schema, src_codec, dst_codec, compression_level):
+    writer = cavro.Schema(writer_schema, options=_REWRITE_OPTIONS)
+    reader = cavro.Schema(reader_schema, options=_REWRITE_OPTIONS)
+    return (
+        schema_._reader_for_writer(reader, writer),
+        reader,
+        _codecs.get_decompressor(src_codec),
+        _codecs.get_compressor(dst_codec),
+        compression_level,
+    )
+
+
+def _rewrite_block(state, block):
+    resolved, reader, decompress, compress, compression_level = state
+    num_records, data = block
+    src = cavro.MemoryReader(decompress(data))
+    dst = cavro.MemoryWriter()
+    for _ in range(num_records):
+        reader.binary_write(dst, resolved.binary_read(src))
+    return num_records, compress(memoryview(dst.buffer)[: dst.len], compression_level)
+
+
+def rewrite(
+    src, dst, reader_schema, codec=None, compression_level=None, *, metadata=None, workers=None, processes=True
+):
+    header = _block.read_header(src)
+    codec = header.codec if codec is None else codec
+    _codecs.get_compressor(codec)  # Fail on unknown codecs before anything is written
+    reader_schema = schema_.parse_schema(reader_schema, _options=_REWRITE_OPTIONS)
+    reader_json = json.dumps(schema_._get_cschema(reader_schema).schema)
+
+    blocks = ((block.num_records, block.data) for block in _block.iter_blocks(src, header))
+    state_args = (header.schema, reader_json, header.codec, codec, compression_level)
+    rewritten = _parallel.ordered_map(_rewrite_block, _make_rewrite_state, state_args, blocks, workers, processes)
+    # Schemas that don't resolve only fail once a value is decoded, so the first block is rewritten before
+    # anything is written
+    first = next(rewritten, None)
+
+    sync_marker = os.urandom(16)
+    _block.write_header(dst, _output_metadata(header, reader_json, codec, metadata), sync_marker)
+    if first is None:
+        return
+    for num_records, data in itertools.chain([first], rewritten):
+        _block.write_raw_block(dst, num_records, data, sync_marker)
+
+
+def _make_recompress_state(src_codec, dst_codec, compression_level):
+    return _codecs.get_decompressor(src_codec), _codecs.get_compressor(dst_codec), compression_level
+
+
+def _recompress_block(state, block):
+    decompress, compress, compression_level = state
+    num_records, data = block
+    return num_records, compress(decompress(data), compression_level)
+
+
+def recompress(src, dst, codec, compression_level=None, *, workers=None, processes=False):
+    header = _block.read_header(src)
+    _codecs.get_compressor(codec)  # Fail on unknown codecs before anything is written
+    metadata = dict(header.metadata)
+    metadata["avro.codec"] = codec.encode()
+
+    _block.write_header(dst, metadata, header.sync_marker)
+    blocks = ((block.num_records, block.data) for block in _block.iter_blocks(src, header))
+    # The codecs release the GIL while (de)compressing, so threads are the default
+    state_args = (header.codec, codec, compression_level)
+    for num_records, data in _parallel.ordered_map(
+        _recompress_block, _make_recompress_state, state_args, blocks, workers, processes
+    ):
+        _block.write_raw_block(dst, num_records, data, header.sync_marker)
+
+
+def recompress_main(argv=None):
+    parser = argparse.ArgumentParser(prog="recompress", description="Change the codec of an avro container file")
+    parser.add_argument("--codec", required=True, choices=sorted(_codecs.BLOCK_COMPRESSORS), help="new codec")
+    parser.add_argument("--level", type=int, default=None, help="compression level")
+    parser.add_argument("--workers", type=int, default=None, help="number of blocks to compress in parallel")
+    parser.add_argument("--processes", action="store_true", help="use worker processes instead of threads")
+    parser.add_argument("input", help="avro input file")
+    parser.add_argument("output", help="avro output file")
+    args = parser.parse_args(argv)
+
+    with open(args.input, "rb") as src, open(args.output, "wb") as dst:
+        recompress(src, dst, args.codec, args.level, workers=args.workers, processes=args.processes)
@@ -91,6 +91,34 @@ class ReadPrepareType(cavro.CustomLogicalType):
         return self._reader(value, self._schema, self._schema)
 
 
+class DeferredLogicalType(cavro.CustomLogicalType):
+    # Leaves values as their underlying type, a batch converter is applied to them after decoding
+    def __init__(self, avro_type, logical_name):
+        self.logical_name = logical_name
+        self.underlying_types = (cavro.TYPES_BY_NAME[avro_type],)
+
+    @property
+    def equality_key(self):
+        return (self.logical_name, self.underlying_types)
+
+    def __eq__(self, other):
+        if not isinstance(other, DeferredLogicalType):
+            return False
+        return self.equality_key == other.equality_key
+
+    def __repr__(self):
+        return f"<Deferred {self.logical_name} for {self.underlying_types[0].type_name}>"
+
+    def _for_type(self, underlying):
+        return self
+
+    def custom_encode_value(self, value):
+        return value
+
+    def custom_decode_value(self, value):
+        return value
+
+
 _OPTIONS = cavro.Options(
     allow_error_type=True,
     raise_on_invalid_logical=True,
@@ -127,6 +155,7 @@ def _get_options(
     disable_tuple_notation=False,
     _ignore_default_error=False,
     write_union_type=None,
+    raw_logical_types=None,
     **kwargs,
 ):
     if base is None:
@@ -151,6 +180,17 @@ def _get_options(
     base = base.with_logical_types(*func_based_logical)
 
     updates = {}
+    if raw_logical_types:
+        # Decode the named logical types (or all of them for True) as their underlying values
+        if raw_logical_types is True:
+            updates["logical_types"] = ()
+        else:
+            if isinstance(raw_logical_types, str):
+                raw_logical_types = (raw_logical_types,)
+            raw = frozenset(raw_logical_types)
+            updates["logical_types"] = tuple(
+                logical for logical in base.logical_types if logical.logical_name not in raw
+            )
     if return_record_name is not None:
         if return_record_name:
             if return_record_name_override:
@@ -267,6 +307,20 @@ def _reader_for_writer(reader, writer):
     return reader.reader_for_writer(writer)
 
 
+@functools.lru_cache(maxsize=32)
+def _skip_schema(writer):
+    # Reading records against a reader schema with no fields walks the datum without building any values
+    ty = writer.type
+    if not isinstance(ty, cavro.RecordType):
+        return writer
+    reader = cavro.Schema(
+        {"type": "record", "name": ty.name, "namespace": ty.effective_namespace, "fields": []},
+        parse_json=False,
+        options=writer.options,
+    )
+    return reader.reader_for_writer(writer)
+
+
 _annotated_types = {}
 
 
@@ -0,0 +1,96 @@
+import argparse
+import contextlib
+import json
+import sys
+
+import cavro
+
+from . import schema as schema_
+from . import read
+from .write import _iter_chunks
+
+# Logical types are left as their underlying values and records as cavro Records, so values only pass
+# through the cheapest python representation between decoding one format and encoding the other.
+# Union branches are still resolved from the value, as they are by json_reader/writer.
+_TRANSCODE_OPTIONS = schema_._OPTIONS.replace(logical_types=(), record_decodes_to_dict=False)
+
+
+def _get_transcode_schema(schema):
+    return schema_._get_cschema(schema_.parse_schema(schema, _options=_TRANSCODE_OPTIONS))
+
+
+def _iter_json_batches(fi, cschema, chunk_size):
+    for chunk in read._iter_json_chunks(fi, cschema, chunk_size):
+        yield read._json_decode_chunk(cschema, chunk)
+
+
+def json_to_container(fi, fo, schema, codec="null", sync_interval=1000 * 16, metadata=None, *, chunk_size=1 << 20):
+    cschema = _get_transcode_schema(schema)
+    try:
+        container = cavro.ContainerWriter(
+            fo, cschema, codec, max_blocksize=sync_interval, metadata=metadata, options=_TRANSCODE_OPTIONS
+        )
+    except cavro.CodecUnavailable as e:
+        raise ValueError(f"unrecognized codec: {codec}") from e
+    for batch in _iter_json_batches(fi, cschema, chunk_size):
+        container.write_many(batch)
+    container.flush(True)
+
+
+def json_to_schemaless(fi, fo, schema, *, chunk_size=1 << 20):
+    cschema = _get_transcode_schema(schema)
+    for batch in _iter_json_batches(fi, cschema, chunk_size):
+        fo.write(b"".join(map(cschema.binary_encode, batch)))
+
+
+def container_to_json(fi, fo, *, batch_size=10_000):
+    try:
+        container = cavro.ContainerReader(fi, options=_TRANSCODE_OPTIONS)
+    except cavro.CodecUnavailable as e:
+        raise ValueError("Unrecognized codec") from e
+    except EOFError:
+        raise ValueError("cannot read header - is it an avro file?")
+    encode = container.schema.json_encode
+    for batch in _iter_chunks(container, batch_size):
+        fo.write("\n".join(map(encode, batch)))
+        fo.write("\n")
+
+
+def _open(path, mode):
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        return contextlib.nullcontext(stream.buffer if "b" in mode else stream)
+    return open(path, mode)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="transcode", description="Convert between avro json and avro binary")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    to_avro = commands.add_parser("json-to-avro", help="convert newline delimited avro json to avro binary")
+    to_avro.add_argument("--schema", required=True, help="path to the schema (.avsc) of the json records")
+    to_avro.add_argument("--codec", default="null", help="container codec (default: null)")
+    to_avro.add_argument("--schemaless", action="store_true", help="write concatenated datums without a container")
+    to_avro.add_argument("input", help="json input file, - for stdin")
+    to_avro.add_argument("output", help="avro output file, - for stdout")
+
+    to_json = commands.add_parser("avro-to-json", help="convert an avro container file to avro json")
+    to_json.add_argument("input", help="avro input file, - for stdin")
+    to_json.add_argument("output", help="json output file, - for stdout")
+
+    args = parser.parse_args(argv)
+    if args.command == "json-to-avro":
+        with open(args.schema) as fo:
+            schema = json.load(fo)
+        with _open(args.input, "rb") as fi, _open(args.output, "wb") as fo:
+            if args.schemaless:
+                json_to_schemaless(fi, fo, schema)
+            else:
+                json_to_container(fi, fo, schema, args.codec)
+    else:
+        with _open(args.input, "rb") as fi, _open(args.output, "w") as fo:
+            container_to_json(fi, fo)
+
+
+if __name__ == "__main__":
+    main()
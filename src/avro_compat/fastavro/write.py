@@ -1,9 +1,18 @@
+import collections
 import decimal
+import io
+import itertools
+import json
+import os
+import time
 import cavro
 import re
 from . import schema as schema_
 from ._logical_writers import LOGICAL_WRITERS
 from . import _write
+from . import _block
+from . import _stats
+from . import _parallel
 from .validation import ValidationError
 
 from fastavro._write_common import _is_appendable
@@ -62,6 +71,8 @@ class Writer:
         sync_marker=None,
         compression_level=None,
         options={},
+        *,
+        stats_fields=None,
     ):
         self.fo = fo
         self.schema = schema
@@ -101,29 +112,384 @@ class Writer:
                 max_blocksize=sync_interval,
                 metadata=metadata,
                 marker=sync_marker,
-                write_header=write_header,
+                write_header=False,
                 options=schema_options,
             )
         except cavro.CodecUnavailable as e:
             raise ValueError(f"unrecognized codec: {codec}") from e
 
+        self._encoded = bytearray()
+        self._num_encoded = 0
+
+        self._stats = None
+        if stats_fields:
+            if not write_header:
+                raise ValueError("block statistics cannot be collected when appending to a file")
+            self._stats = _stats.StatsCollector(stats_fields, schema)
+
+        if write_header:
+            # Written here rather than by cavro along with its first block, so encoded blocks can come first
+            _block.write_header(fo, self._header_metadata(), bytes(self._container.marker))
+
+    def _header_metadata(self):
+        metadata = dict(self._container.metadata or {})
+        metadata["avro.schema"] = json.dumps(self._container.schema.schema)
+        metadata["avro.codec"] = self._container.codec.name
+        return {key: value.encode() if isinstance(value, str) else value for key, value in metadata.items()}
+
     @property
     def block_count(self):
-        return self._container.num_pending
+        return self._container.num_pending + self._num_encoded
+
+    @property
+    def block_stats(self):
+        return None if self._stats is None else self._stats.blocks
+
+    def write_block_stats(self, fo):
+        """Write the statistics of the blocks flushed so far as a sidecar container file"""
+        _stats.write_block_stats(fo, self.block_stats)
+
+    def _flush_container(self, force=False):
+        pending = self._container.num_pending
+        self._container.flush(force)
+        if self._stats is not None and pending:
+            self._stats.close_block(pending)
 
     def dump(self):
-        self._container.flush()
+        self._flush_encoded()
+        self._flush_container()
 
     def flush(self):
-        self._container.flush()
+        self._flush_encoded()
+        self._flush_container()
 
     def write(self, record):
+        if self._num_encoded:
+            self._flush_encoded()
+        if self._stats is None:
+            self._container.write_one(record)
+            return
+        # Collected first, so a record whose values can't be read is never written without them
+        values = self._stats.values(record)
+        pending = self._container.num_pending
         self._container.write_one(record)
+        self._stats.add(values)
+        # cavro flushes a full block before adding a record that does not fit
+        flushed = pending + 1 - self._container.num_pending
+        if flushed:
+            self._stats.close_block(flushed)
 
     def write_block(self, block):
+        if self._num_encoded:
+            self._flush_encoded()
         items = list(block)
-        self._container.write_many(items)
-        self._container.flush()
+        if self._stats is None:
+            self._container.write_many(items)
+        else:
+            for item in items:
+                self.write(item)
+        self._flush_container()
+
+    def write_encoded(self, datum, validate=False):
+        if self._stats is not None:
+            raise ValueError("block statistics cannot be collected for encoded records")
+        if self._container.num_pending:
+            self._container.flush()
+        if validate:
+            self._check_encoded(datum)
+        self._encoded += datum
+        self._num_encoded += 1
+        if len(self._encoded) >= self.sync_interval:
+            self._flush_encoded()
+
+    def write_encoded_many(self, datums, validate=False):
+        for datum in datums:
+            self.write_encoded(datum, validate)
+
+    def _check_encoded(self, datum):
+        buf = io.BytesIO(datum)
+        try:
+            schema_._skip_schema(self._container.schema).binary_read(cavro.FileReader(buf))
+        except (EOFError, ValueError, cavro.CavroException) as e:
+            raise ValueError("encoded datum does not match the writer schema") from e
+        if buf.tell() != len(datum):
+            raise ValueError(f"encoded datum has {len(datum) - buf.tell()} unexpected trailing bytes")
+
+    def _flush_encoded(self):
+        if not self._num_encoded:
+            return
+        _block.write_block(
+            self.fo,
+            self._num_encoded,
+            self._encoded,
+            self._container.codec.name,
+            bytes(self._container.marker),
+            self.compression_level,
+        )
+        self._encoded = bytearray()
+        self._num_encoded = 0
+
+
+class RollingWriter:
+    def __init__(
+        self,
+        path,
+        schema,
+        codec="null",
+        sync_interval=1000 * 16,
+        metadata=None,
+        compression_level=None,
+        *,
+        max_bytes=None,
+        max_records=None,
+        max_seconds=None,
+        manifest_path=None,
+        options=None,
+    ):
+        options = options or {}
+        if max_bytes is None and max_records is None and max_seconds is None:
+            raise ValueError("at least one of max_bytes, max_records or max_seconds must be given")
+        path = str(path)
+        if path.format(index=0) == path.format(index=1):
+            raise ValueError("path must contain an {index} placeholder")
+        self.path = path
+        # Parse once, every Writer created on rotation re-uses the compiled schema
+        self.schema = schema_.parse_schema(schema, _options=schema_._get_options(**options))
+        self.codec = codec
+        self.sync_interval = sync_interval
+        self.metadata = metadata
+        self.compression_level = compression_level
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.max_seconds = max_seconds
+        self.manifest_path = manifest_path
+        self.options = options
+        self.manifest = []
+
+        self._index = 0
+        self._writer = None
+        self._tmp_path = None
+        self._num_records = 0
+        self._opened_at = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @property
+    def current_path(self):
+        return self.path.format(index=self._index)
+
+    def _open(self):
+        self._tmp_path = f"{self.current_path}.tmp"
+        fo = open(self._tmp_path, "wb")
+        try:
+            self._writer = Writer(
+                fo,
+                self.schema,
+                self.codec,
+                self.sync_interval,
+                self.metadata,
+                compression_level=self.compression_level,
+                options=self.options,
+            )
+        except Exception:
+            fo.close()
+            os.unlink(self._tmp_path)
+            raise
+        self._num_records = 0
+        self._opened_at = time.monotonic()
+
+    def _should_rotate(self):
+        if self.max_records is not None and self._num_records >= self.max_records:
+            return True
+        # Only flushed blocks are visible here, so a file can overshoot max_bytes by up to one block
+        if self.max_bytes is not None and self._writer.fo.tell() >= self.max_bytes:
+            return True
+        if self.max_seconds is not None and time.monotonic() - self._opened_at >= self.max_seconds:
+            return True
+        return False
+
+    def write(self, record):
+        if self._writer is None:
+            self._open()
+        self._writer.write(record)
+        self._num_records += 1
+        if self._should_rotate():
+            self.rotate()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def rotate(self):
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        writer.flush()
+        writer._container.close()
+        num_bytes = writer.fo.tell()
+        # On disk before the rename, so a crash can't leave a complete-looking but truncated file at path
+        writer.fo.flush()
+        os.fsync(writer.fo.fileno())
+        writer.fo.close()
+        path = self.current_path
+        os.replace(self._tmp_path, path)
+        self.manifest.append({"path": path, "records": self._num_records, "bytes": num_bytes})
+        self._index += 1
+        if self.manifest_path is not None:
+            self._write_manifest()
+
+    def _write_manifest(self):
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w") as fo:
+            json.dump(self.manifest, fo, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def close(self):
+        self.rotate()
+
+
+class PartitionedWriter:
+    def __init__(
+        self,
+        path,
+        schema,
+        codec="null",
+        sync_interval=1000 * 16,
+        metadata=None,
+        compression_level=None,
+        *,
+        max_open=128,
+        max_pending_records=None,
+        options=None,
+    ):
+        options = options or {}
+        path = str(path)
+        if path.format(key=0) == path.format(key=1):
+            raise ValueError("path must contain a {key} placeholder")
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self.path = path
+        self.codec = codec
+        self.sync_interval = sync_interval
+        self.metadata = metadata
+        self.compression_level = compression_level
+        self.max_open = max_open
+        self.max_pending_records = max_pending_records
+        self.options = options
+
+        self._schema_options = schema_._get_options(**options)
+        self.schema = schema_.parse_schema(schema, _options=self._schema_options)
+        self._cschema = schema_._get_cschema(self.schema)
+
+        # key -> (fo, cavro.ContainerWriter), least recently used first
+        self._open = collections.OrderedDict()
+        # key -> (sync marker, schema, codec) of partitions to append to when reopened
+        self._appends = {}
+        self._pending = {}
+        self._num_pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @property
+    def num_open(self):
+        return len(self._open)
+
+    @property
+    def num_pending(self):
+        return self._num_pending
+
+    def _open_partition(self, key):
+        name = str(key)
+        if "/" in name or "\\" in name or ".." in name:
+            # Keys usually come from record values, which must not reach outside the path's directory
+            raise ValueError(f"partition key must not contain '/', '\\' or '..': {key!r}")
+        while len(self._open) >= self.max_open:
+            self._close_partition(next(iter(self._open)))
+
+        path = self.path.format(key=key)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fo = open(path, "a+b")
+        codec = self.codec
+        try:
+            write_header = fo.tell() == 0
+            if write_header:
+                marker, cschema, codec = None, self._cschema, self.codec
+            else:
+                marker, cschema, codec = self._appends.get(key) or self._read_partition_header(fo)
+            container = cavro.ContainerWriter(
+                fo,
+                cschema,
+                codec,
+                max_blocksize=self.sync_interval,
+                metadata=self.metadata,
+                marker=marker,
+                write_header=write_header,
+                options=self._schema_options,
+            )
+        except cavro.CodecUnavailable as e:
+            fo.close()
+            raise ValueError(f"unrecognized codec: {codec}") from e
+        except BaseException:
+            fo.close()
+            raise
+        self._appends[key] = (container.marker, cschema, codec)
+        self._open[key] = (fo, container)
+        self._pending[key] = 0
+        return container
+
+    def _read_partition_header(self, fo):
+        # Partition written by someone else, new blocks must match its header like Writer's append does
+        fo.seek(0)
+        reader = cavro.ContainerReader(fo, options=self._schema_options)
+        reader._read_marker()
+        fo.seek(0, 2)
+        return reader.marker, reader.schema, reader.codec_name
+
+    def _close_partition(self, key):
+        fo, container = self._open.pop(key)
+        container.close()
+        fo.close()
+        self._num_pending -= self._pending.pop(key)
+
+    def _flush_largest(self):
+        while self._num_pending > self.max_pending_records:
+            key = max(self._pending, key=self._pending.get)
+            self._open[key][1].flush()
+            self._num_pending -= self._pending[key]
+            self._pending[key] = 0
+
+    def write(self, key, record):
+        if key in self._open:
+            self._open.move_to_end(key)
+            container = self._open[key][1]
+        else:
+            container = self._open_partition(key)
+        container.write_one(record)
+        pending = container.num_pending
+        self._num_pending += pending - self._pending[key]
+        self._pending[key] = pending
+        if self.max_pending_records is not None and self._num_pending > self.max_pending_records:
+            self._flush_largest()
+
+    def flush(self):
+        for key, (_, container) in self._open.items():
+            container.flush()
+            self._pending[key] = 0
+        self._num_pending = 0
+
+    def close(self):
+        while self._open:
+            self._close_partition(next(iter(self._open)))
 
 
 def writer(
@@ -140,9 +506,13 @@ def writer(
     strict=False,
     strict_allow_default=False,
     disable_tuple_notation=False,
+    stats_fields=None,
+    stats_fo=None,
 ):
     if isinstance(records, dict):
         raise ValueError('"records" argument should be an iterable, not dict')
+    if (stats_fields is None) != (stats_fo is None):
+        raise ValueError("stats_fields and stats_fo must be given together")
     output = Writer(
         fo,
         schema,
@@ -157,7 +527,17 @@ def writer(
             "strict_allow_default": strict_allow_default,
             "disable_tuple_notation": disable_tuple_notation,
         },
+        stats_fields=stats_fields,
     )
+    if stats_fields is not None:
+        try:
+            for record in records:
+                output.write(record)
+        except ValueError as e:
+            raise _substitute_write_error(records, e) from e
+        output._flush_container(True)
+        output.write_block_stats(stats_fo)
+        return
     try:
         output._container.write_many(records)
     except ValueError as e:
@@ -177,12 +557,55 @@ def schemaless_writer(fo, schema, record, **kwargs):
         raise _substitute_write_error(record, e) from e
 
 
-def json_writer(fo, schema, records, *, validator=False, encoder=AvroJSONEncoder, **kwargs):
+def _iter_chunks(records, size):
+    records = iter(records)
+    while chunk := list(itertools.islice(records, size)):
+        yield chunk
+
+
+def _json_encode_chunk(schema, records):
+    lines = []
+    for record in records:
+        try:
+            lines.append(schema.json_encode(record))
+        except (decimal.InvalidOperation, cavro.ExponentTooLarge) as e:
+            raise ValueError(str(e)) from e
+        except ValueError as e:
+            raise _substitute_write_error(record, e) from e
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _make_json_encode_state(schema, kwargs):
+    return schema_._get_cschema(schema_.parse_schema(schema, **kwargs))
+
+
+def json_writer(
+    fo,
+    schema,
+    records,
+    *,
+    validator=False,
+    encoder=AvroJSONEncoder,
+    batch_size=None,
+    workers=None,
+    **kwargs,
+):
     if encoder is not AvroJSONEncoder:
         return fa_json_writer(fo, schema, records, validator=validator, encoder=encoder, **kwargs)
     kwargs.setdefault("coerce_values_to_str", True)
     schema = schema_.parse_schema(schema, **kwargs)
     schema = schema_._get_cschema(schema)
+    if workers is not None:
+        chunks = _iter_chunks(records, batch_size or 10_000)
+        state_args = (schema.type.get_schema(set()), kwargs)
+        for text in _parallel.ordered_map(_json_encode_chunk, _make_json_encode_state, state_args, chunks, workers):
+            fo.write(text)
+        return
+    if batch_size is not None:
+        for chunk in _iter_chunks(records, batch_size):
+            fo.write(_json_encode_chunk(schema, chunk))
+        return
     for record in records:
         try:
             fo.write(schema.json_encode(record))
@@ -1,6 +1,10 @@
+import io
+import os
 import pytest
 from collections import namedtuple
 
+import avro_compat.fastavro as fastavro
+
 SkipTest = namedtuple('SkipTest', 'library file_name test_name')
 
 
@@ -48,4 +52,30 @@ def pytest_collection_modifyitems(config, items):
     skip_listed = pytest.mark.xfail(reason="included in skiplist")
     for item in items:
         if should_skip_test(item):
-            item.add_marker(skip_listed)
\ No newline at end of file
+            item.add_marker(skip_listed)
+
+
+@pytest.fixture
+def write_avro():
+    """Write records to an in-memory container file, returned at its start"""
+
+    def write(schema, records, **kwargs):
+        buf = io.BytesIO()
+        fastavro.writer(buf, schema, records, **kwargs)
+        buf.seek(0)
+        return buf
+
+    return write
+
+
+@pytest.fixture
+def read_avro():
+    """Read all records of a container file, given as a path or a file object"""
+
+    def read(source, **kwargs):
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as fo:
+                return list(fastavro.reader(fo, **kwargs))
+        return list(fastavro.reader(source, **kwargs))
+
+    return read
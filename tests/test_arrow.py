@@ -0,0 +1,145 @@
+import datetime
+import decimal
+import glob
+import os
+import subprocess
+import sys
+from io import BytesIO
+from os.path import abspath, basename, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+pa = pytest.importorskip("pyarrow")
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+# Recursive types have no arrow equivalent
+UNMAPPABLE = {"recursive.avro"}
+
+
+def readable_files():
+    for path in sorted(glob.glob(join(data_dir, "*.avro"))):
+        with open(path, "rb") as fo:
+            try:
+                fastavro.reader(fo)
+            except ValueError:
+                continue  # Codec not installed
+        yield path
+
+
+@pytest.mark.parametrize("path", list(readable_files()), ids=basename)
+def test_container_files_round_trip(path, read_avro):
+    records = read_avro(path)
+    with open(path, "rb") as fo:
+        reader = fastavro.reader(fo)
+        if basename(path) in UNMAPPABLE:
+            with pytest.raises(ValueError, match="recursive"):
+                fastavro.to_arrow(reader)
+            return
+        table = fastavro.to_arrow(reader)
+    assert table.num_rows == len(records)
+    assert table.schema == fastavro.arrow.arrow_schema(reader.writer_schema)
+    assert list(fastavro.from_arrow(table, reader.writer_schema)) == records
+
+
+schema = {
+    "type": "record",
+    "name": "Mapped",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "maybe", "type": ["null", "int"]},
+        {
+            "name": "choice",
+            "type": [
+                "null",
+                "long",
+                "string",
+                {"type": "record", "name": "R", "fields": [{"name": "x", "type": "int"}]},
+            ],
+        },
+        {"name": "items", "type": {"type": "array", "items": "string"}},
+        {"name": "scores", "type": {"type": "map", "values": "double"}},
+        {"name": "kind", "type": {"type": "enum", "name": "Kind", "symbols": ["A", "B"]}},
+        {"name": "digest", "type": {"type": "fixed", "name": "Digest", "size": 2}},
+        {"name": "amount", "type": {"type": "bytes", "logicalType": "decimal", "precision": 5, "scale": 2}},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+        {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+    ],
+}
+
+
+def test_schema_mapping():
+    assert fastavro.arrow.arrow_schema(schema) == pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("maybe", pa.int32()),
+            pa.field(
+                "choice",
+                pa.dense_union(
+                    [
+                        pa.field("null", pa.null()),
+                        pa.field("long", pa.int64()),
+                        pa.field("string", pa.string()),
+                        pa.field("R", pa.struct([pa.field("x", pa.int32(), nullable=False)])),
+                    ],
+                    type_codes=[0, 1, 2, 3],
+                ),
+            ),
+            pa.field("items", pa.list_(pa.field("item", pa.string(), nullable=False)), nullable=False),
+            pa.field("scores", pa.map_(pa.string(), pa.field("value", pa.float64(), nullable=False)), nullable=False),
+            pa.field("kind", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+            pa.field("digest", pa.binary(2), nullable=False),
+            pa.field("amount", pa.decimal128(5, 2), nullable=False),
+            pa.field("ts", pa.timestamp("ms", tz="UTC"), nullable=False),
+            pa.field("day", pa.date32(), nullable=False),
+        ]
+    )
+
+
+def make_records(num_records):
+    choices = [None, 1, "s", {"x": 2}]
+    return [
+        {
+            "id": i,
+            "maybe": None if i % 2 else i,
+            "choice": choices[i % 4],
+            "items": [str(i)] * (i % 3),
+            "scores": {"a": i / 2},
+            "kind": "AB"[i % 2],
+            "digest": b"a\0",
+            "amount": decimal.Decimal("1.25"),
+            "ts": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(milliseconds=i),
+            "day": datetime.date(2020, 1, 1) + datetime.timedelta(days=i),
+        }
+        for i in range(num_records)
+    ]
+
+
+def test_round_trip_by_block(write_avro, read_avro):
+    records = make_records(300)
+    buf = write_avro(schema, records, sync_interval=2000)
+    num_blocks = sum(1 for _ in fastavro.block_reader(BytesIO(buf.getvalue())))
+    table = fastavro.to_arrow(fastavro.reader(buf))
+    assert len(table.to_batches()) == num_blocks
+    assert table.column("choice").chunk(0)[3].as_py() == {"x": 2}
+
+    assert read_avro(write_avro(schema, fastavro.from_arrow(table, schema))) == records
+
+
+def test_from_arrow_casts_columns():
+    table = pa.table({"a": pa.array([1, 2], pa.int64()), "b": pa.array(["x", None])})
+    arrow_schema = {
+        "type": "record",
+        "name": "Cast",
+        "fields": [{"name": "a", "type": "int"}, {"name": "b", "type": ["null", "string"]}],
+    }
+    assert list(fastavro.from_arrow(table, arrow_schema)) == [{"a": 1, "b": "x"}, {"a": 2, "b": None}]
+    with pytest.raises(ValueError, match="fields: b"):
+        list(fastavro.from_arrow(table.select(["a"]), arrow_schema))
+
+
+def test_import_does_not_load_pyarrow():
+    code = "import sys, avro_compat.fastavro; print('pyarrow' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    assert subprocess.check_output([sys.executable, "-c", code], env=env).strip() == b"False"
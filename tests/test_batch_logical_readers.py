@@ -0,0 +1,125 @@
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+schema = {
+    "type": "record",
+    "name": "Batched",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "amount", "type": {"type": "string", "logicalType": "cents"}},
+        {"name": "maybe", "type": ["null", {"type": "string", "logicalType": "cents"}]},
+        {"name": "history", "type": {"type": "array", "items": {"type": "string", "logicalType": "cents"}}},
+        {
+            "name": "child",
+            "type": [
+                "null",
+                {
+                    "type": "record",
+                    "name": "Child",
+                    "fields": [
+                        {
+                            "name": "by_name",
+                            "type": {"type": "map", "values": {"type": "string", "logicalType": "cents"}},
+                        }
+                    ],
+                },
+            ],
+        },
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "amount": str(i),
+            "maybe": None if i % 2 else str(i * 2),
+            "history": [str(j) for j in range(i % 4)],
+            "child": None if i % 3 == 0 else {"by_name": {"a": str(i), "b": "1"}},
+        }
+        for i in range(num_records)
+    ]
+
+
+def to_cents(value):
+    return int(value) * 100
+
+
+@pytest.fixture
+def batch_readers():
+    calls = []
+
+    def read_cents(values, schema):
+        assert schema["logicalType"] == "cents"
+        calls.append(len(values))
+        return [to_cents(v) for v in values]
+
+    fastavro.read.BATCH_LOGICAL_READERS["string-cents"] = read_cents
+    yield calls
+    del fastavro.read.BATCH_LOGICAL_READERS["string-cents"]
+
+
+def expected(records):
+    return [
+        {
+            "id": r["id"],
+            "amount": to_cents(r["amount"]),
+            "maybe": None if r["maybe"] is None else to_cents(r["maybe"]),
+            "history": [to_cents(v) for v in r["history"]],
+            "child": None
+            if r["child"] is None
+            else {"by_name": {k: to_cents(v) for k, v in r["child"]["by_name"].items()}},
+        }
+        for r in records
+    ]
+
+
+def test_batch_reader_called_once_per_block(batch_readers, write_avro, read_avro):
+    records = make_records(250)
+    buf = write_avro(schema, records, sync_interval=2000)
+    num_blocks = sum(1 for _ in fastavro.block_reader(BytesIO(buf.getvalue())))
+    assert num_blocks > 1
+    batch_readers.clear()
+
+    assert read_avro(buf) == expected(records)
+    # amount, maybe, history and child.by_name are each converted once per block
+    assert len(batch_readers) == 4 * num_blocks
+
+
+def test_batch_reader_in_block_reader(batch_readers, write_avro):
+    records = make_records(100)
+    buf = write_avro(schema, records, sync_interval=1000)
+    assert [r for block in fastavro.block_reader(buf) for r in block] == expected(records)
+
+
+def test_batch_reader_with_reader_schema(batch_readers, write_avro):
+    records = make_records(20)
+    buf = write_avro(schema, records)
+    reader_schema = {
+        "type": "record",
+        "name": "Batched",
+        "fields": [{"name": "amount", "type": schema["fields"][1]["type"]}],
+    }
+    assert list(fastavro.reader(buf, reader_schema)) == [{"amount": r["amount"]} for r in expected(records)]
+
+
+def test_without_batch_readers_values_are_unchanged(write_avro, read_avro):
+    records = make_records(10)
+    assert read_avro(write_avro(schema, records)) == records
+
+
+def test_batch_reader_in_multi_type_union_is_rejected(batch_readers):
+    union_schema = {
+        "type": "record",
+        "name": "U",
+        "fields": [{"name": "value", "type": ["long", {"type": "string", "logicalType": "cents"}]}],
+    }
+    buf = BytesIO()
+    fastavro.writer(buf, union_schema, [{"value": 1}])
+    buf.seek(0)
+    with pytest.raises(ValueError, match="unions"):
+        fastavro.reader(buf)
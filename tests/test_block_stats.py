@@ -0,0 +1,219 @@
+import datetime
+import decimal
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _predicate, _stats
+
+schema = {
+    "type": "record",
+    "name": "Event",
+    "fields": [
+        {"name": "ts", "type": "long"},
+        {"name": "country", "type": ["null", "string"]},
+        {"name": "geo", "type": {"type": "record", "name": "Geo", "fields": [{"name": "lat", "type": "double"}]}},
+        {"name": "payload", "type": "string"},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {
+            "ts": i,
+            "country": None if i % 7 == 0 else ("DE" if i < 100 else "FR"),
+            "geo": {"lat": i / 2},
+            "payload": "x" * 20,
+        }
+        for i in range(num_records)
+    ]
+
+
+@pytest.fixture
+def write_with_stats(write_avro):
+    def write(records, schema=schema, stats_fields=("ts", "country", "geo.lat"), sync_interval=500, **kwargs):
+        stats = BytesIO()
+        buf = write_avro(
+            schema, records, sync_interval=sync_interval, stats_fields=list(stats_fields), stats_fo=stats, **kwargs
+        )
+        stats.seek(0)
+        return buf, stats
+
+    return write
+
+
+def test_stats_per_block(write_with_stats):
+    records = make_records(300)
+    buf, stats = write_with_stats(records)
+    blocks = _stats.read_block_stats(stats)
+    num_records = [block.num_records for block in fastavro.block_reader(buf)]
+    assert [b["num_records"] for b in blocks] == num_records
+    assert [b["block"] for b in blocks] == list(range(len(num_records)))
+
+    start = 0
+    for block in blocks:
+        chunk = records[start : start + block["num_records"]]
+        start += block["num_records"]
+        assert block["fields"]["ts"] == {"min": chunk[0]["ts"], "max": chunk[-1]["ts"], "null_count": 0}
+        countries = [r["country"] for r in chunk if r["country"] is not None]
+        assert block["fields"]["country"] == {
+            "min": min(countries),
+            "max": max(countries),
+            "null_count": len(chunk) - len(countries),
+        }
+        assert block["fields"]["geo.lat"]["max"] == chunk[-1]["geo"]["lat"]
+
+
+@pytest.mark.parametrize(
+    "where, keep",
+    [
+        (("ts", "==", 150), lambda r: r["ts"] == 150),
+        (("and", ("ts", ">=", 100), ("ts", "<", 120)), lambda r: 100 <= r["ts"] < 120),
+        (("ts", ">", 290), lambda r: r["ts"] > 290),
+        (("country", "==", "DE"), lambda r: r["country"] == "DE"),
+        (("country", "==", None), lambda r: r["country"] is None),
+        (("country", "in", ["US", "DE"]), lambda r: r["country"] == "DE"),
+        (("or", ("ts", "<", 5), ("geo.lat", ">=", 140)), lambda r: r["ts"] < 5 or r["geo"]["lat"] >= 140),
+        (("not", ("ts", "<", 200)), lambda r: r["ts"] >= 200),
+        (("payload", "==", "y"), lambda r: False),
+    ],
+)
+def test_reader_skips_blocks(where, keep, write_with_stats, read_avro):
+    records = make_records(300)
+    buf, stats = write_with_stats(records)
+    assert read_avro(buf, where=where, block_stats=stats) == [r for r in records if keep(r)]
+
+
+def test_blocks_outside_range_are_not_decompressed(monkeypatch, write_with_stats):
+    records = make_records(300)
+    buf, stats = write_with_stats(records, codec="deflate")
+    decompressed = []
+    original = fastavro.read._container.BlockContainer.decode_block
+
+    def decode_block(self, block):
+        decompressed.append(block.offset)
+        return original(self, block)
+
+    monkeypatch.setattr(fastavro.read._container.BlockContainer, "decode_block", decode_block)
+    assert [r["ts"] for r in fastavro.reader(buf, where=("ts", "==", 150), block_stats=stats)] == [150]
+    assert len(decompressed) == 1
+
+
+def test_stats_from_writer_class(read_avro):
+    buf = BytesIO()
+    output = fastavro.write.Writer(buf, schema, sync_interval=500, stats_fields=["ts"])
+    for record in make_records(50):
+        output.write(record)
+    output.flush()
+    assert sum(b["num_records"] for b in output.block_stats) == 50
+    buf.seek(0)
+    assert read_avro(buf, where=("ts", "==", 3), block_stats=output.block_stats)[0]["ts"] == 3
+
+
+def test_mismatched_stats(write_with_stats):
+    buf, stats = write_with_stats(make_records(300))
+    blocks = _stats.read_block_stats(stats)
+    blocks[0]["num_records"] += 1
+    with pytest.raises(ValueError, match="do not match"):
+        list(fastavro.reader(buf, where=("ts", "==", 1), block_stats=blocks))
+
+
+def test_invalid_stats_usage(write_with_stats):
+    buf, stats = write_with_stats(make_records(10))
+    with pytest.raises(ValueError, match="where expression"):
+        fastavro.reader(buf, block_stats=stats)
+    with pytest.raises(ValueError, match="together"):
+        fastavro.writer(BytesIO(), schema, [], stats_fields=["ts"])
+    with pytest.raises(ValueError, match="statistics"):
+        fastavro.writer(BytesIO(), schema, make_records(3), stats_fields=["geo"], stats_fo=BytesIO())
+
+
+logical_schema = {
+    "type": "record",
+    "name": "Reading",
+    "fields": [
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+        {"name": "local", "type": {"type": "long", "logicalType": "local-timestamp-millis"}},
+        {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+        {"name": "at", "type": {"type": "long", "logicalType": "time-micros"}},
+        {"name": "amount", "type": {"type": "bytes", "logicalType": "decimal", "precision": 10, "scale": 2}},
+    ],
+}
+epoch = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_readings(num_records):
+    return [
+        {
+            "ts": epoch + datetime.timedelta(minutes=i, microseconds=7),
+            "local": datetime.datetime(2024, 1, 1) + datetime.timedelta(seconds=i),
+            "day": datetime.date(2024, 1, 1) + datetime.timedelta(days=i),
+            "at": datetime.time(0, i // 60, i % 60, 250),
+            "amount": decimal.Decimal(i) / 4,
+        }
+        for i in range(num_records)
+    ]
+
+
+def test_logical_type_stats(write_with_stats):
+    records = make_readings(300)
+    fields = ["ts", "local", "day", "at", "amount"]
+    _, stats = write_with_stats(records, logical_schema, fields)
+    blocks = _stats.read_block_stats(stats)
+    assert len(blocks) > 1
+    start = 0
+    for block in blocks:
+        chunk = records[start : start + block["num_records"]]
+        start += block["num_records"]
+        for field in fields:
+            assert block["fields"][field] == {"min": chunk[0][field], "max": chunk[-1][field], "null_count": 0}
+
+
+@pytest.mark.parametrize(
+    "where",
+    [
+        ("ts", ">=", epoch + datetime.timedelta(minutes=290)),
+        ("local", "<", datetime.datetime(2024, 1, 1, 0, 0, 10)),
+        ("day", "==", datetime.date(2024, 3, 1)),
+        ("at", ">", datetime.time(0, 4, 50)),
+        ("amount", "in", [decimal.Decimal("1.5"), decimal.Decimal("70")]),
+    ],
+)
+def test_reader_skips_blocks_by_logical_values(where, monkeypatch, write_with_stats, read_avro):
+    records = make_readings(300)
+    buf, stats = write_with_stats(records, logical_schema, [where[0]])
+    num_blocks = len(list(fastavro.block_reader(BytesIO(buf.getvalue()))))
+    decoded = []
+    original = fastavro.read._container.BlockContainer.decode_block
+
+    def decode_block(self, block):
+        decoded.append(block.offset)
+        return original(self, block)
+
+    monkeypatch.setattr(fastavro.read._container.BlockContainer, "decode_block", decode_block)
+    _, test = _predicate.compile_where(where)
+    assert read_avro(buf, where=where, block_stats=stats) == [r for r in records if test(r)]
+    assert len(decoded) < num_blocks
+
+
+def test_stats_use_defaults_of_missing_fields(write_with_stats, read_avro):
+    defaulted = {
+        "type": "record",
+        "name": "Defaulted",
+        "fields": [
+            {"name": "id", "type": "long"},
+            {"name": "country", "type": "string", "default": "XX"},
+            {"name": "priority", "type": "long", "default": 3},
+        ],
+    }
+    records = [{"id": i} if i % 2 else {"id": i, "country": "DE", "priority": 1} for i in range(100)]
+    buf, stats = write_with_stats(records, defaulted, ["country", "priority"], sync_interval=200)
+    blocks = _stats.read_block_stats(stats)
+    assert sum(block["num_records"] for block in blocks) == 100
+    for block in blocks:
+        assert block["fields"]["country"] == {"min": "DE", "max": "XX", "null_count": 0}
+        assert block["fields"]["priority"] == {"min": 1, "max": 3, "null_count": 0}
+    stats.seek(0)
+    assert len(read_avro(buf, where=("country", "==", "XX"), block_stats=stats)) == 50
@@ -0,0 +1,72 @@
+import datetime
+import os
+import subprocess
+import sys
+from io import BytesIO
+
+import numpy as np
+
+
+schema = {
+    "type": "record",
+    "name": "Times",
+    "fields": [
+        {"name": "ts_us", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+        {"name": "ts_ms", "type": ["null", {"type": "long", "logicalType": "timestamp-millis"}]},
+        {"name": "local_us", "type": {"type": "long", "logicalType": "local-timestamp-micros"}},
+        {"name": "local_ms", "type": {"type": "long", "logicalType": "local-timestamp-millis"}},
+        {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+        {"name": "time_ms", "type": {"type": "int", "logicalType": "time-millis"}},
+        {"name": "time_us", "type": {"type": "long", "logicalType": "time-micros"}},
+    ],
+}
+
+moment = datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc)
+
+
+def make_records(num_records):
+    return [
+        {
+            "ts_us": moment + datetime.timedelta(microseconds=i),
+            "ts_ms": None if i % 2 else moment,
+            "local_us": moment.replace(tzinfo=None),
+            "local_ms": moment.replace(tzinfo=None),
+            "day": moment.date() + datetime.timedelta(days=i),
+            "time_ms": datetime.time(1, 2, 3, 4000),
+            "time_us": datetime.time(1, 2, 3, 4),
+        }
+        for i in range(num_records)
+    ]
+
+
+def test_datetime64_output(write_avro, read_avro):
+    records = read_avro(write_avro(schema, make_records(10)), datetime64=True)
+
+    first, second = records[:2]
+    assert first["ts_us"] == np.datetime64("2024-01-02T03:04:05.678000", "us")
+    assert second["ts_us"] == np.datetime64("2024-01-02T03:04:05.678001", "us")
+    assert first["ts_ms"] == np.datetime64("2024-01-02T03:04:05.678", "ms")
+    assert second["ts_ms"] is None
+    assert first["local_us"] == np.datetime64("2024-01-02T03:04:05.678000", "us")
+    assert first["local_ms"] == np.datetime64("2024-01-02T03:04:05.678", "ms")
+    assert second["day"] == np.datetime64("2024-01-03", "D")
+    assert first["time_ms"] == np.timedelta64(3723004, "ms")
+    assert first["time_us"] == np.timedelta64(3723000004, "us")
+    for record in records:
+        assert not any(isinstance(v, (datetime.date, datetime.time)) for v in record.values())
+
+
+def test_datetime64_matches_default_decoding(write_avro, read_avro):
+    data = write_avro(schema, make_records(50)).getvalue()
+    default = read_avro(BytesIO(data))
+    as_numpy = read_avro(BytesIO(data), datetime64=True)
+    for expected, actual in zip(default, as_numpy):
+        assert actual["ts_us"].item() == expected["ts_us"].replace(tzinfo=None)
+        assert actual["day"].item() == expected["day"]
+
+
+def test_import_does_not_import_numpy():
+    # cavro may load numpy itself, so check the package's own reference is still unset
+    code = "import avro_compat.fastavro._numpy as m; print(m.np is None)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    assert subprocess.check_output([sys.executable, "-c", code], env=env).strip() == b"True"
@@ -0,0 +1,145 @@
+from io import BytesIO
+from os.path import abspath, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+
+schema = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+    ],
+}
+
+
+@pytest.fixture
+def make_file(write_avro, read_avro):
+    """A file of rows sorted by id, and its records as read back"""
+
+    def make(num_records=2000, step=2, codec="null"):
+        records = [{"id": i * step, "name": f"n{i}", "ts": 1000 * i} for i in range(num_records)]
+        buf = write_avro(schema, records, codec=codec, sync_interval=1000)
+        return buf, read_avro(BytesIO(buf.getvalue()))
+
+    return make
+
+
+def test_index_entries(make_file):
+    buf, _ = make_file()
+    index = fastavro.build_index(buf, key="id")
+    buf.seek(0)
+    blocks = list(fastavro.block_reader(buf))
+    assert index.num_blocks == len(blocks) > 1
+    assert index.num_records == 2000
+    first = 0
+    for i, block in enumerate(blocks):
+        records = list(block)
+        assert index.first_record(i) == first
+        assert index.key_range(i) == (records[0]["id"], records[-1]["id"])
+        first += len(records)
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_seek_record(codec, make_file):
+    buf, expected = make_file(codec=codec)
+    index = fastavro.build_index(buf, key="id")
+    buf.seek(0)
+    r = fastavro.reader(buf, index=index)
+    for n in [1999, 0, 1234, 77, 1000]:
+        r.seek_record(n)
+        assert next(r) == expected[n]
+    r.seek_record(1995)
+    assert list(r) == expected[1995:]
+    r.seek_record(2000)
+    assert list(r) == []
+
+
+def test_get(make_file):
+    buf, expected = make_file()
+    index = fastavro.build_index(buf, key="id")
+    buf.seek(0)
+    r = fastavro.reader(buf, index=index)
+    assert r.get(2 * 1500) == expected[1500]
+    assert next(r) == expected[1501]
+    assert r.get(0) == expected[0]
+    assert r.get(3998) == expected[-1]
+    assert r.get(3) is None
+    assert r.get(-1, "missing") == "missing"
+    assert r.get(4000) is None
+
+
+def test_get_duplicate_keys_returns_first(write_avro):
+    records = [{"id": i // 100, "name": f"n{i}", "ts": 0} for i in range(1000)]
+    buf = write_avro(schema, records, sync_interval=500)
+    index = fastavro.build_index(buf, key="id")
+    buf.seek(0)
+    assert fastavro.reader(buf, index=index).get(7)["name"] == "n700"
+
+
+def test_logical_type_key_uses_underlying_value(make_file):
+    buf, expected = make_file()
+    index = fastavro.build_index(buf, key="ts")
+    buf.seek(0)
+    assert fastavro.reader(buf, index=index).get(5000) == expected[5]
+
+
+def test_weather_sorted(read_avro):
+    with open(join(data_dir, "weather-sorted.avro"), "rb") as fo:
+        expected = read_avro(fo)
+        fo.seek(0)
+        index = fastavro.build_index(fo, key="time")
+        fo.seek(0)
+        r = fastavro.reader(fo, index=index)
+        assert r.get(expected[3]["time"]) == expected[3]
+
+
+def test_index_round_trip(tmp_path, make_file):
+    buf, expected = make_file()
+    index = fastavro.build_index(buf, key="id")
+    path = tmp_path / "rows.idx"
+    with open(path, "wb") as fo:
+        index.write(fo)
+    loaded = fastavro.load_index(str(path))
+    assert loaded.tobytes() == index.tobytes()
+    assert loaded.key == "id"
+    assert fastavro.load_index(BytesIO(index.tobytes())).num_blocks == index.num_blocks
+
+    buf.seek(0)
+    r = fastavro.reader(buf, index=path, fields=["name"])
+    r.seek_record(42)
+    assert next(r) == {"name": "n42"}
+
+
+def test_index_without_key(make_file):
+    buf, expected = make_file()
+    index = fastavro.build_index(buf)
+    assert index.key is None
+    buf.seek(0)
+    r = fastavro.reader(buf, index=index)
+    r.seek_record(10)
+    assert next(r) == expected[10]
+    with pytest.raises(ValueError, match="no key"):
+        r.get(1)
+
+
+def test_invalid_index_usage(make_file):
+    buf, _ = make_file()
+    other, _ = make_file()
+    with pytest.raises(ValueError, match="not sorted"):
+        fastavro.build_index(BytesIO(buf.getvalue()), key="name")
+    index = fastavro.build_index(other, key="id")
+    with pytest.raises(ValueError, match="does not belong"):
+        fastavro.reader(BytesIO(buf.getvalue()), index=index)
+    with pytest.raises(ValueError, match="where"):
+        plain_index = fastavro.build_index(BytesIO(buf.getvalue()))
+        fastavro.reader(BytesIO(buf.getvalue()), index=plain_index, where=("id", "==", 1))
+    with pytest.raises(ValueError, match="requires an index"):
+        fastavro.reader(BytesIO(buf.getvalue())).seek_record(1)
+    with pytest.raises(ValueError, match="not a container index"):
+        fastavro.load_index(BytesIO(bytes(64)))
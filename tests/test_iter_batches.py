@@ -0,0 +1,111 @@
+import datetime
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro.columnar import BinaryColumn, Column
+
+schema = {
+    "type": "record",
+    "name": "Columns",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "small", "type": "int"},
+        {"name": "flag", "type": "boolean"},
+        {"name": "ratio", "type": ["null", "double"]},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "blob", "type": "bytes"},
+        {"name": "digest", "type": {"type": "fixed", "name": "Digest", "size": 4}},
+        {"name": "other_digest", "type": "Digest"},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+    ],
+}
+
+epoch = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "small": -i,
+            "flag": i % 2 == 0,
+            "ratio": None if i % 3 == 0 else i / 4,
+            "name": None if i % 5 == 0 else f"name-{i}",
+            "blob": bytes(range(i % 7)),
+            "digest": i.to_bytes(4, "little"),
+            "other_digest": b"\0\0\0\0",
+            "tags": [str(i)] * (i % 3),
+            "ts": epoch + datetime.timedelta(milliseconds=i),
+        }
+        for i in range(num_records)
+    ]
+
+
+def rows(batches):
+    for batch in batches:
+        columns = {name: column.to_list() for name, column in batch.items()}
+        for values in zip(*columns.values()):
+            yield dict(zip(columns, values))
+
+
+def test_one_batch_per_block(write_avro):
+    records = make_records(500)
+    buf = write_avro(schema, records, sync_interval=2000)
+    block_sizes = [block.num_records for block in fastavro.block_reader(BytesIO(buf.getvalue()))]
+    batches = list(fastavro.reader(buf).iter_batches())
+    assert [len(batch["id"]) for batch in batches] == block_sizes
+    assert list(rows(batches)) == records
+
+
+def test_column_types(write_avro):
+    batch = next(fastavro.reader(write_avro(schema, make_records(30))).iter_batches())
+    assert batch["id"].values.dtype == np.int64
+    assert batch["small"].values.dtype == np.int32
+    assert batch["flag"].values.dtype == np.bool_
+    assert batch["ratio"].values.dtype == np.float64
+    assert batch["digest"].values.dtype == np.dtype("V4")
+    assert batch["other_digest"].values.dtype == np.dtype("V4")
+    assert batch["tags"].values.dtype == object
+    assert batch["ts"].values.dtype == object
+    assert batch["id"].validity is None
+    assert batch["ratio"].validity.tolist() == [i % 3 != 0 for i in range(30)]
+
+    name = batch["name"]
+    assert isinstance(name, BinaryColumn)
+    assert name.offsets.dtype == np.int64 and len(name.offsets) == 31
+    assert name.data.tobytes() == b"".join(f"name-{i}".encode() for i in range(30) if i % 5)
+    assert name[0] is None and name[1] == "name-1"
+    assert batch["blob"][3] == b"\0\1\2"
+
+
+def test_fixed_batch_size(write_avro):
+    records = make_records(500)
+    batches = list(fastavro.reader(write_avro(schema, records, sync_interval=2000)).iter_batches(batch_size=128))
+    assert [len(batch["id"]) for batch in batches] == [128, 128, 128, 116]
+    assert list(rows(batches)) == records
+
+
+def test_datetime64_columns(write_avro):
+    batch = next(fastavro.reader(write_avro(schema, make_records(10)), datetime64=True).iter_batches())
+    ts = batch["ts"]
+    assert isinstance(ts, Column)
+    assert ts.values.dtype == np.dtype("datetime64[ms]")
+    assert ts.values[3] == np.datetime64("2020-01-01T00:00:00.003")
+
+
+@pytest.mark.parametrize("batch_size", [None, 64])
+def test_after_partial_iteration(batch_size, write_avro):
+    records = make_records(500)
+    r = fastavro.reader(write_avro(schema, records, sync_interval=2000))
+    first = [next(r) for _ in range(10)]
+    assert first + list(rows(r.iter_batches(batch_size))) == records
+
+
+def test_non_record_schema(write_avro):
+    buf = write_avro("long", [1, 2, 3])
+    with pytest.raises(ValueError, match="record schema"):
+        next(fastavro.reader(buf).iter_batches())
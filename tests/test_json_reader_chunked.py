@@ -0,0 +1,75 @@
+from io import BytesIO, StringIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+schema = {
+    "type": "record",
+    "name": "JsonChunk",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {"id": i, "name": None if i % 5 == 0 else f"näme-{i}", "tags": [str(j) for j in range(i % 3)]}
+        for i in range(num_records)
+    ]
+
+
+def to_ndjson(records):
+    fo = StringIO()
+    fastavro.json_writer(fo, schema, records)
+    return fo.getvalue()
+
+
+def to_json_array(records):
+    lines = to_ndjson(records).splitlines()
+    return "[\n  " + ",\n  ".join(lines) + "\n]\n"
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 13}, {"chunk_size": 4096}, {"workers": 2, "chunk_size": 500}])
+@pytest.mark.parametrize("to_text", [to_ndjson, to_json_array])
+def test_chunked_matches_line_reader(binary, kwargs, to_text):
+    records = make_records(300)
+    text = to_text(records)
+    fo = BytesIO(text.encode()) if binary else StringIO(text)
+    assert list(fastavro.json_reader(fo, schema, **kwargs)) == records
+
+
+def test_chunked_with_reader_schema():
+    records = make_records(20)
+    reader_schema = {
+        "type": "record",
+        "name": "JsonChunk",
+        "fields": [{"name": "id", "type": "long"}, {"name": "extra", "type": "int", "default": 1}],
+    }
+    text = to_ndjson(records)
+    expected = list(fastavro.json_reader(StringIO(text), schema, reader_schema))
+    assert list(fastavro.json_reader(StringIO(text), schema, reader_schema, chunk_size=64)) == expected
+    assert list(fastavro.json_reader(StringIO(text), schema, reader_schema, workers=2)) == expected
+
+
+def test_chunked_array_of_arrays_is_ndjson():
+    array_schema = {"type": "array", "items": "long"}
+    fo = StringIO("[1, 2]\n[]\n[3]\n")
+    assert list(fastavro.json_reader(fo, array_schema, chunk_size=4)) == [[1, 2], [], [3]]
+
+
+@pytest.mark.parametrize(
+    "text", ['{"id": 1, "name": null, "tags": []}\n{"id": ', '[{"id": 1, "name": null, "tags": []}']
+)
+def test_chunked_truncated_input(text):
+    with pytest.raises(ValueError):
+        list(fastavro.json_reader(StringIO(text), schema, chunk_size=8))
+
+
+def test_chunked_empty_input():
+    assert list(fastavro.json_reader(StringIO("\n\n"), schema, chunk_size=8)) == []
+    assert list(fastavro.json_reader(StringIO("[]"), schema, chunk_size=8)) == []
@@ -0,0 +1,48 @@
+from io import StringIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+schema = {
+    "type": "record",
+    "name": "JsonBatch",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "amount", "type": "double"},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "name": None if i % 5 == 0 else f"name-{i}",
+            "amount": i / 4,
+            "tags": [str(j) for j in range(i % 3)],
+        }
+        for i in range(num_records)
+    ]
+
+
+def write_json(records, **kwargs):
+    fo = StringIO()
+    fastavro.json_writer(fo, schema, records, **kwargs)
+    return fo.getvalue()
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 7}, {"batch_size": 1000}, {"workers": 2, "batch_size": 50}])
+def test_batched_output_is_identical(kwargs):
+    records = make_records(333)
+    assert write_json(iter(records), **kwargs) == write_json(records)
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 10}, {"workers": 2, "batch_size": 10}])
+def test_batched_errors(kwargs):
+    records = make_records(30)
+    records[17]["id"] = "not a long"
+    with pytest.raises(ValueError):
+        write_json(records, **kwargs)
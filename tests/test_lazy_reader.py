@@ -0,0 +1,85 @@
+from collections.abc import Mapping
+from os.path import abspath, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+
+schema = {
+    "type": "record",
+    "name": "Wide",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "digest", "type": {"type": "fixed", "name": "Digest", "size": 2}},
+        {"name": "other", "type": "Digest"},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "tags", "type": {"type": "map", "values": "string"}},
+    ]
+    + [{"name": f"f{i}", "type": "string"} for i in range(50)],
+}
+
+
+def make_records(num_records):
+    return [
+        dict(
+            {"id": i, "digest": b"ab", "other": b"cd", "name": None if i % 2 else f"n{i}", "tags": {"t": str(i)}},
+            **{f"f{j}": f"{i}-{j}" for j in range(50)},
+        )
+        for i in range(num_records)
+    ]
+
+
+def test_records_are_mappings(write_avro):
+    records = make_records(100)
+    lazy = list(fastavro.lazy_reader(write_avro(schema, records, sync_interval=2000)))
+    assert all(isinstance(record, Mapping) for record in lazy)
+    assert lazy == records
+    assert [dict(record) for record in lazy] == records
+    assert len(lazy[0]) == len(schema["fields"])
+    assert list(lazy[0]) == [field["name"] for field in schema["fields"]]
+    assert "f3" in lazy[0] and "missing" not in lazy[0]
+    assert lazy[0].get("missing") is None
+    with pytest.raises(KeyError):
+        lazy[0]["missing"]
+    with pytest.raises(TypeError):
+        lazy[0]["id"] = 1
+
+
+def test_only_accessed_fields_are_decoded(write_avro):
+    records = make_records(300)
+    reader = fastavro.lazy_reader(write_avro(schema, records, sync_interval=2000))
+    assert [(r["id"], r["other"], r["name"]) for r in reader] == [(r["id"], r["other"], r["name"]) for r in records]
+    assert reader._projections.hot == {"id", "other", "name"}
+
+
+def test_values_are_cached(write_avro):
+    record = next(fastavro.lazy_reader(write_avro(schema, make_records(5))))
+    assert record["tags"] is record["tags"]
+
+
+def test_reader_schema(write_avro):
+    reader_schema = {
+        "type": "record",
+        "name": "Wide",
+        "fields": [
+            {"name": "f1", "type": "string"},
+            {"name": "extra", "type": "int", "default": 7},
+        ],
+    }
+    lazy = list(fastavro.lazy_reader(write_avro(schema, make_records(10)), reader_schema))
+    assert [dict(r) for r in lazy] == [{"f1": f"{i}-1", "extra": 7} for i in range(10)]
+
+
+def test_recursive_schema(read_avro):
+    with open(join(data_dir, "recursive.avro"), "rb") as fo:
+        expected = read_avro(fo)
+    with open(join(data_dir, "recursive.avro"), "rb") as fo:
+        assert list(fastavro.lazy_reader(fo)) == expected
+
+
+def test_non_record_schema(write_avro):
+    buf = write_avro("long", [1])
+    with pytest.raises(ValueError, match="record schema"):
+        fastavro.lazy_reader(buf)
@@ -0,0 +1,100 @@
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro.write import PartitionedWriter
+
+schema = {
+    "type": "record",
+    "name": "Partitioned",
+    "fields": [
+        {"name": "tenant", "type": "string"},
+        {"name": "value", "type": "long"},
+    ],
+}
+
+
+def make_records(num_records, num_tenants):
+    return [{"tenant": f"t{i % num_tenants}", "value": i} for i in range(num_records)]
+
+
+def expected_by_tenant(records):
+    by_tenant = {}
+    for record in records:
+        by_tenant.setdefault(record["tenant"], []).append(record)
+    return by_tenant
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_partitions_with_eviction(tmp_path, codec, read_avro):
+    records = make_records(500, 20)
+    with PartitionedWriter(tmp_path / "{key}" / "data.avro", schema, codec=codec, max_open=3) as out:
+        for record in records:
+            out.write(record["tenant"], record)
+            assert out.num_open <= 3
+
+    for tenant, tenant_records in expected_by_tenant(records).items():
+        assert read_avro(tmp_path / tenant / "data.avro") == tenant_records
+
+
+def test_pending_budget(tmp_path, read_avro):
+    records = make_records(500, 10)
+    with PartitionedWriter(tmp_path / "{key}.avro", schema, max_pending_records=20) as out:
+        for record in records:
+            out.write(record["tenant"], record)
+            assert out.num_pending <= 20
+
+    for tenant, tenant_records in expected_by_tenant(records).items():
+        assert read_avro(tmp_path / f"{tenant}.avro") == tenant_records
+
+
+def test_appends_to_existing_file(tmp_path, read_avro):
+    existing = [{"tenant": "a", "value": -1}]
+    with open(tmp_path / "a.avro", "wb") as fo:
+        fastavro.writer(fo, schema, existing)
+
+    with PartitionedWriter(tmp_path / "{key}.avro", schema) as out:
+        out.write("a", {"tenant": "a", "value": 1})
+
+    assert read_avro(tmp_path / "a.avro") == existing + [{"tenant": "a", "value": 1}]
+
+
+def test_appends_with_existing_codec(tmp_path):
+    existing = [{"tenant": "a", "value": i} for i in range(100)]
+    with open(tmp_path / "a.avro", "wb") as fo:
+        fastavro.writer(fo, schema, existing, codec="deflate")
+
+    with PartitionedWriter(tmp_path / "{key}.avro", schema, max_open=1) as out:
+        out.write("a", {"tenant": "a", "value": 100})
+        out.write("b", {"tenant": "b", "value": 0})
+        out.write("a", {"tenant": "a", "value": 101})
+
+    with open(tmp_path / "a.avro", "rb") as fo:
+        r = fastavro.reader(fo)
+        assert r.codec == "deflate"
+        assert list(r) == existing + [{"tenant": "a", "value": 100}, {"tenant": "a", "value": 101}]
+
+
+def test_unreadable_partition_is_closed(tmp_path, monkeypatch):
+    with open(tmp_path / "a.avro", "wb") as fo:
+        fo.write(b"not avro")
+    opened = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        fo = real_open(*args, **kwargs)
+        opened.append(fo)
+        return fo
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    with PartitionedWriter(tmp_path / "{key}.avro", schema) as out:
+        with pytest.raises(ValueError, match="header"):
+            out.write("a", {"tenant": "a", "value": 1})
+    assert opened and all(fo.closed for fo in opened)
+
+
+@pytest.mark.parametrize("key", ["../escaped", "a/b", "a\\b", ".."])
+def test_rejects_keys_outside_the_directory(tmp_path, key):
+    with PartitionedWriter(tmp_path / "out" / "{key}.avro", schema) as out:
+        with pytest.raises(ValueError, match="partition key"):
+            out.write(key, {"tenant": key, "value": 1})
+    assert [p.name for p in tmp_path.iterdir()] == []
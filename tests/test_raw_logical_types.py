@@ -0,0 +1,69 @@
+import datetime
+import decimal
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+schema = {
+    "type": "record",
+    "name": "Times",
+    "fields": [
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+        {"name": "local", "type": {"type": "long", "logicalType": "local-timestamp-millis"}},
+        {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+        {"name": "amount", "type": {"type": "bytes", "logicalType": "decimal", "precision": 6, "scale": 2}},
+    ],
+}
+
+moment = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+record = {
+    "ts": moment,
+    "local": moment.replace(tzinfo=None),
+    "day": moment.date(),
+    "amount": decimal.Decimal("1.25"),
+}
+
+
+@pytest.fixture
+def read_one(write_avro, read_avro):
+    def read(**kwargs):
+        [decoded] = read_avro(write_avro(schema, [record]), **kwargs)
+        return decoded
+
+    return read
+
+
+def test_all_logical_types_raw(read_one):
+    assert read_one(raw_logical_types=True) == {
+        "ts": 1704164645000000,
+        "local": 1704164645000,
+        "day": 19724,
+        "amount": (125).to_bytes(1, "big"),
+    }
+
+
+def test_selected_logical_types_raw(read_one):
+    assert read_one(raw_logical_types=["timestamp-micros", "date"]) == {
+        "ts": 1704164645000000,
+        "local": record["local"],
+        "day": 19724,
+        "amount": record["amount"],
+    }
+
+
+def test_single_logical_type_raw(read_one):
+    assert read_one(raw_logical_types="decimal") == dict(record, amount=(125).to_bytes(1, "big"))
+
+
+@pytest.mark.parametrize("raw", [None, False, ()])
+def test_logical_types_decoded_by_default(raw, read_one):
+    assert read_one(raw_logical_types=raw) == record
+
+
+def test_schemaless_raw_logical_types():
+    buf = BytesIO()
+    fastavro.schemaless_writer(buf, schema, record)
+    buf.seek(0)
+    assert fastavro.schemaless_reader(buf, schema, raw_logical_types=["timestamp-micros"])["ts"] == 1704164645000000
@@ -0,0 +1,52 @@
+from io import BytesIO
+from os.path import abspath, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+
+schema = {
+    "type": "record",
+    "name": "Raw",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "scores", "type": {"type": "map", "values": "double"}},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {"id": i, "name": None if i % 4 == 0 else f"n{i}", "scores": {str(j): j / 2 for j in range(i % 3)}}
+        for i in range(num_records)
+    ]
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_raw_records_match_schemaless_encoding(codec, write_avro):
+    records = make_records(500)
+    fo = write_avro(schema, records, codec=codec, sync_interval=200)
+
+    raw = list(fastavro.raw_record_reader(fo))
+    assert len(raw) == len(records)
+    for datum, record in zip(raw, records):
+        assert isinstance(datum, memoryview)
+        assert fastavro.schemaless_reader(BytesIO(datum), schema) == record
+
+
+@pytest.mark.parametrize("filename", ["weather.avro", "test-deflate-1.avro", "java-generated-uuid.avro"])
+def test_raw_records_from_files(filename, read_avro):
+    with open(join(data_dir, filename), "rb") as fo:
+        expected = read_avro(fo)
+        fo.seek(0)
+        raw_reader = fastavro.raw_record_reader(fo)
+        decoded = [fastavro.schemaless_reader(BytesIO(datum), raw_reader.writer_schema) for datum in raw_reader]
+    assert decoded == expected
+
+
+def test_raw_reader_rejects_non_avro():
+    with pytest.raises(ValueError):
+        fastavro.raw_record_reader(BytesIO(b"not an avro file"))
@@ -0,0 +1,103 @@
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+address = {
+    "type": "record",
+    "name": "Address",
+    "namespace": "test.geo",
+    "fields": [{"name": "city", "type": "string"}, {"name": "zip", "type": "string"}],
+}
+
+schema = {
+    "type": "record",
+    "name": "Person",
+    "namespace": "test",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "home", "type": address},
+        {"name": "work", "type": ["null", "test.geo.Address"]},
+        {
+            "name": "orders",
+            "type": {
+                "type": "array",
+                "items": {
+                    "type": "record",
+                    "name": "Order",
+                    "fields": [{"name": "sku", "type": "string"}, {"name": "qty", "type": "int"}],
+                },
+            },
+        },
+        {"name": "totals", "type": {"type": "map", "values": "Order"}},
+        {"name": "digest", "type": {"type": "fixed", "name": "Digest", "size": 4}},
+        {"name": "notes", "type": "string"},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "home": {"city": f"h{i}", "zip": "1"},
+            "work": None if i % 2 else {"city": f"w{i}", "zip": "2"},
+            "orders": [{"sku": f"s{j}", "qty": j} for j in range(i % 3)],
+            "totals": {"a": {"sku": "t", "qty": i}},
+            "digest": b"abcd",
+            "notes": "n" * i,
+        }
+        for i in range(num_records)
+    ]
+
+
+@pytest.fixture
+def read_fields(write_avro, read_avro):
+    def read(fields, records=None, **kwargs):
+        return read_avro(write_avro(schema, records or make_records(20), sync_interval=500), fields=fields, **kwargs)
+
+    return read
+
+
+def test_top_level_fields(read_fields):
+    assert read_fields(["id", "digest"]) == [{"id": i, "digest": b"abcd"} for i in range(20)]
+
+
+def test_nested_paths(read_fields):
+    records = read_fields(["home.city", "work.city", "orders[*].qty", "totals[*].sku"])
+    assert records == [
+        {
+            "home": {"city": f"h{i}"},
+            "work": None if i % 2 else {"city": f"w{i}"},
+            "orders": [{"qty": j} for j in range(i % 3)],
+            "totals": {"a": {"sku": "t"}},
+        }
+        for i in range(20)
+    ]
+
+
+def test_whole_field_wins_over_nested_path(read_fields):
+    records = read_fields(["home.city", "home"])
+    assert records[0] == {"home": {"city": "h0", "zip": "1"}}
+
+
+def test_fields_with_reader_schema(read_fields):
+    reader_schema = dict(schema, fields=schema["fields"] + [{"name": "extra", "type": "int", "default": 3}])
+    assert read_fields(["id", "extra"], reader_schema=reader_schema)[:2] == [
+        {"id": 0, "extra": 3},
+        {"id": 1, "extra": 3},
+    ]
+
+
+def test_projected_reader_schema(write_avro):
+    reader = fastavro.reader(write_avro(schema, make_records(1)), fields=["id", "home.city"])
+    assert fastavro.schema.to_parsing_canonical_form(reader.reader_schema) == (
+        '{"name":"test.Person","type":"record","fields":[{"name":"id","type":"long"},'
+        '{"name":"home","type":{"name":"test.geo.Address","type":"record",'
+        '"fields":[{"name":"city","type":"string"}]}}]}'
+    )
+
+
+@pytest.mark.parametrize("path", ["missing", "home.missing", "id.x", "orders.sku", "[*]", "home..city"])
+def test_invalid_paths(path, read_fields):
+    with pytest.raises(ValueError, match="field path"):
+        read_fields([path])
@@ -0,0 +1,120 @@
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _container
+
+schema = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+
+def make_records(start, stop):
+    return [{"id": i, "name": f"n{i}"} for i in range(start, stop)]
+
+
+class Clock:
+    """Stands in for time.sleep and time.monotonic, calling on_sleep each time the reader waits"""
+
+    def __init__(self, monkeypatch, on_sleep=None):
+        self.now = 0
+        self.delays = []
+        self.on_sleep = on_sleep
+        monkeypatch.setattr(_container.time, "sleep", self.sleep)
+        monkeypatch.setattr(_container.time, "monotonic", lambda: self.now)
+
+    def sleep(self, delay):
+        self.delays.append(delay)
+        self.now += delay
+        if self.on_sleep is not None:
+            self.on_sleep()
+
+
+def test_follow_appended_blocks(tmp_path, monkeypatch):
+    path = tmp_path / "rows.avro"
+    with open(path, "wb") as fo:
+        fastavro.writer(fo, schema, make_records(0, 10))
+    appended = []
+
+    def append():
+        if len(appended) < 3:
+            start = 10 * (len(appended) + 1)
+            with open(path, "a+b") as fo:
+                fastavro.writer(fo, schema, make_records(start, start + 10))
+            appended.append(start)
+
+    Clock(monkeypatch, append)
+    with open(path, "rb") as fo:
+        r = fastavro.reader(fo, follow=True, poll_interval=0.01, idle_timeout=1)
+        assert [next(r) for _ in range(10)] == make_records(0, 10)
+        assert list(r) == make_records(10, 40)
+
+
+def test_follow_partial_block(tmp_path, monkeypatch, write_avro):
+    data = write_avro(schema, make_records(0, 500), sync_interval=1000).getvalue()
+    header = fastavro.read_header(BytesIO(data))
+    path = tmp_path / "rows.avro"
+    # The file grows a few hundred bytes at a time, so most reads see a partial block
+    cut = header.size + 10
+    with open(path, "wb") as fo:
+        fo.write(data[:cut])
+    pieces = [data[i : i + 333] for i in range(cut, len(data), 333)]
+
+    def append():
+        if pieces:
+            with open(path, "ab") as fo:
+                fo.write(pieces.pop(0))
+
+    Clock(monkeypatch, append)
+    with open(path, "rb") as fo:
+        r = fastavro.reader(fo, follow=True, poll_interval=0.01, max_poll_interval=0.05, idle_timeout=1)
+        assert list(r) == make_records(0, 500)
+    assert not pieces
+
+
+def test_follow_backoff(tmp_path, monkeypatch, write_avro):
+    path = tmp_path / "rows.avro"
+    with open(path, "wb") as fo:
+        fo.write(write_avro(schema, make_records(0, 5)).getvalue())
+    clock = Clock(monkeypatch)
+    with open(path, "rb") as fo:
+        r = fastavro.reader(fo, follow=True, poll_interval=1, max_poll_interval=8, idle_timeout=30)
+        assert list(r) == make_records(0, 5)
+    assert clock.delays == [1, 2, 4, 8, 8, 8]
+
+
+def test_follow_does_not_reread_blocks(tmp_path, monkeypatch, read_avro):
+    path = tmp_path / "rows.avro"
+    with open(path, "wb") as fo:
+        fastavro.writer(fo, schema, make_records(0, 10))
+    decoded = []
+    original = _container.BlockContainer.decode_block
+
+    def decode_block(self, block):
+        decoded.append(block.offset)
+        return original(self, block)
+
+    def append():
+        if len(decoded) < 3:
+            with open(path, "a+b") as fo:
+                fastavro.writer(fo, schema, make_records(0, 1))
+
+    monkeypatch.setattr(_container.BlockContainer, "decode_block", decode_block)
+    Clock(monkeypatch, append)
+    with open(path, "rb") as fo:
+        assert len(read_avro(fo, follow=True, idle_timeout=1)) == 12
+    assert len(decoded) == len(set(decoded)) == 3
+
+
+def test_follow_invalid_combinations(write_avro):
+    data = write_avro(schema, make_records(0, 5)).getvalue()
+    with pytest.raises(ValueError, match="follow"):
+        fastavro.reader(BytesIO(data), follow=True, recover=True)
+    with pytest.raises(ValueError, match="follow"):
+        fastavro.reader(BytesIO(data), follow=True, end=100)
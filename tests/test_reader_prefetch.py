@@ -0,0 +1,102 @@
+import threading
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _block
+
+schema = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+records = [{"id": i, "name": f"n{i}"} for i in range(3000)]
+
+
+@pytest.fixture
+def make_file(write_avro):
+    def make(codec="null"):
+        return write_avro(schema, records, codec=codec, sync_interval=1000).getvalue()
+
+    return make
+
+
+def prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "avro-prefetch"]
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate", "bzip2"])
+@pytest.mark.parametrize("num_blocks", [1, 3, 100])
+def test_prefetch(codec, num_blocks, make_file, read_avro):
+    assert read_avro(BytesIO(make_file(codec)), prefetch_blocks=num_blocks) == records
+    assert not prefetch_threads()
+
+
+def test_prefetch_with_options(make_file):
+    data = make_file("deflate")
+    r = fastavro.reader(BytesIO(data), prefetch_blocks=2, fields=["id"], where=("id", ">=", 2500))
+    assert list(r) == [{"id": i} for i in range(2500, 3000)]
+    assert len(list(fastavro.block_reader(BytesIO(data), prefetch_blocks=2))) > 1
+
+
+def test_prefetch_stops_when_abandoned(make_file):
+    r = fastavro.reader(BytesIO(make_file("deflate")), prefetch_blocks=2)
+    assert next(r) == records[0]
+    assert prefetch_threads()
+    r._container._close_blocks()
+    assert not prefetch_threads()
+
+
+def test_prefetch_seek_and_skip(make_file):
+    data = make_file("deflate")
+    index = fastavro.build_index(BytesIO(data), key="id")
+    r = fastavro.reader(BytesIO(data), prefetch_blocks=2, index=index)
+    assert next(r) == records[0]
+    r.seek_record(2000)
+    assert next(r) == records[2000]
+    assert r.get(10) == records[10]
+    r.skip(1500)
+    assert next(r) == records[1511]
+    assert list(r) == records[1512:]
+
+
+def test_prefetch_errors_are_raised(make_file):
+    data = bytearray(make_file("deflate"))
+    buf = BytesIO(bytes(data))
+    header = _block.read_header(buf)
+    block = list(_block.iter_blocks(buf, header))[2]
+    data[block.offset + block.size // 2] ^= 0xFF
+    with pytest.raises(ValueError):
+        list(fastavro.reader(BytesIO(bytes(data)), prefetch_blocks=2))
+    assert not prefetch_threads()
+
+    r = fastavro.reader(BytesIO(bytes(data)), prefetch_blocks=2, recover=True)
+    assert len(list(r)) == len(records) - block.num_records
+    assert r.recovery.corrupt_blocks[0].offset == block.offset
+
+
+def test_prefetch_invalid_usage(make_file):
+    data = make_file()
+    with pytest.raises(ValueError, match="negative"):
+        fastavro.reader(BytesIO(data), prefetch_blocks=-1)
+    with pytest.raises(ValueError, match="follow"):
+        fastavro.reader(BytesIO(data), prefetch_blocks=2, follow=True)
+
+
+@pytest.mark.parametrize("num_blocks", [0, 1, 3])
+def test_prefetch_recovery_positions(num_blocks, make_file):
+    data = bytearray(make_file())
+    buf = BytesIO(bytes(data))
+    header = _block.read_header(buf)
+    blocks = list(_block.iter_blocks(buf, header))
+    data[blocks[2].offset + blocks[2].size // 2] ^= 0xFF
+    r = fastavro.reader(BytesIO(bytes(data)), prefetch_blocks=num_blocks, recover=True)
+    assert len(list(r)) == len(records) - blocks[2].num_records
+    corrupt = r.recovery.corrupt_blocks[0]
+    assert corrupt.offset == blocks[2].offset
+    assert corrupt.resumed_at == blocks[3].offset
@@ -0,0 +1,154 @@
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _block
+
+schema = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+records = [{"id": i, "name": f"name-{i}"} for i in range(3000)]
+
+
+@pytest.fixture
+def make_file(write_avro):
+    """The file's bytes to corrupt, with its header and blocks"""
+
+    def make(codec="null"):
+        buf = write_avro(schema, records, codec=codec, sync_interval=2000)
+        header = _block.read_header(buf)
+        return bytearray(buf.getvalue()), header, list(_block.iter_blocks(buf, header))
+
+    return make
+
+
+def block_records(blocks, index):
+    start = sum(block.num_records for block in blocks[:index])
+    return records[start : start + blocks[index].num_records]
+
+
+def expected_without(blocks, index):
+    lost = block_records(blocks, index)
+    return [r for r in records if r not in lost]
+
+
+def test_corrupt_block_data(make_file):
+    data, header, blocks = make_file("deflate")
+    block = blocks[3]
+    data[block.offset + block.size // 2] ^= 0xFF
+    with pytest.raises(EOFError):
+        list(fastavro.reader(BytesIO(bytes(data))))
+
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    assert list(r) == expected_without(blocks, 3)
+    assert r.recovery.bad_blocks == 1
+    assert r.recovery.records_lost == block.num_records
+    corrupt = r.recovery.corrupt_blocks[0]
+    assert corrupt.offset == block.offset
+    assert corrupt.num_records == block.num_records
+    assert corrupt.resumed_at == blocks[4].offset
+
+
+def test_trailing_garbage_is_corrupt(make_file):
+    data, header, blocks = make_file()
+    block = blocks[2]
+    # The block's last string is shortened by one byte, so the block decodes with a byte left over
+    last = block_records(blocks, 2)[-1]["name"].encode()
+    end = block.offset + len(data[block.offset :].split(header.sync_marker)[0])
+    assert data[end - len(last) : end] == last
+    data[end - len(last) - 1] -= 2
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    assert list(r) == expected_without(blocks, 2)
+    assert "after its last record" in str(r.recovery.corrupt_blocks[0].error)
+
+
+def test_corrupt_block_count(make_file):
+    data, header, blocks = make_file()
+    block = blocks[1]
+    data[block.offset : block.offset + 1] = b"\x01"
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    assert list(r) == expected_without(blocks, 1)
+    corrupt = r.recovery.corrupt_blocks[0]
+    assert corrupt.offset == block.offset
+    assert corrupt.num_records is None
+    assert corrupt.resumed_at == blocks[2].offset
+    assert r.recovery.records_lost is None
+
+
+def test_corrupt_sync_marker(make_file):
+    data, header, blocks = make_file()
+    data[blocks[2].offset - 3] ^= 0xFF
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    # Without its sync marker, the start of the following block can't be found either
+    lost = block_records(blocks, 1) + block_records(blocks, 2)
+    assert list(r) == [r for r in records if r not in lost]
+    assert r.recovery.bad_blocks == 2
+    assert [b.offset for b in r.recovery.corrupt_blocks] == [blocks[1].offset, blocks[2].offset]
+    assert [b.num_records for b in r.recovery.corrupt_blocks] == [blocks[1].num_records, blocks[2].num_records]
+    assert {b.resumed_at for b in r.recovery.corrupt_blocks} == {blocks[3].offset}
+    assert r.recovery.records_lost == len(lost)
+
+
+def test_corrupt_block_size(make_file):
+    data, header, blocks = make_file()
+    block = blocks[1]
+    # A size running past the next sync marker, so the skipped records can't be counted
+    size = _block.read_long(BytesIO(bytes(data[block.offset + 2 :])))
+    assert _block.encode_long(size) == data[block.offset + 2 : block.offset + 4]
+    data[block.offset + 2 : block.offset + 4] = _block.encode_long(size + 1)
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    assert list(r) == expected_without(blocks, 1)
+    assert r.recovery.bad_blocks == 1
+    assert r.recovery.records_lost is None
+
+
+def test_truncated_file(make_file):
+    data, header, blocks = make_file()
+    r = fastavro.reader(BytesIO(bytes(data[:-10])), recover=True)
+    assert list(r) == records[: -blocks[-1].num_records]
+    assert r.recovery.bad_blocks == 1
+    assert r.recovery.records_lost == blocks[-1].num_records
+
+
+def test_multiple_corrupt_blocks(make_file):
+    data, header, blocks = make_file("deflate")
+    for index in (0, 4):
+        data[blocks[index].offset + blocks[index].size // 2] ^= 0xFF
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    expected = [r for r in expected_without(blocks, 0) if r not in block_records(blocks, 4)]
+    assert list(r) == expected
+    assert [b.offset for b in r.recovery.corrupt_blocks] == [blocks[0].offset, blocks[4].offset]
+    assert r.recovery.records_lost == blocks[0].num_records + blocks[4].num_records
+
+
+def test_clean_file(make_file):
+    data, header, blocks = make_file()
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    assert list(r) == records
+    assert r.recovery.bad_blocks == 0
+    assert fastavro.reader(BytesIO(bytes(data))).recovery is None
+
+
+def test_recover_with_where(make_file):
+    data, header, blocks = make_file("deflate")
+    data[blocks[0].offset + blocks[0].size // 2] ^= 0xFF
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True, where=("id", ">=", 2990))
+    assert list(r) == records[2990:]
+
+
+def test_skip_past_corrupt_block(make_file):
+    data, header, blocks = make_file()
+    data[blocks[2].offset - 3] ^= 0xFF
+    r = fastavro.reader(BytesIO(bytes(data)), recover=True)
+    lost = block_records(blocks, 1) + block_records(blocks, 2)
+    expected = [r for r in records if r not in lost]
+    r.skip(blocks[0].num_records + 10)
+    assert list(r) == expected[blocks[0].num_records + 10 :]
+    assert r.recovery.bad_blocks == 2
@@ -0,0 +1,97 @@
+from io import BytesIO
+from os.path import abspath, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _block
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+
+schema = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+records = [{"id": i, "name": f"n{i}"} for i in range(3000)]
+
+
+@pytest.fixture
+def make_file(write_avro):
+    def make(codec="null"):
+        return write_avro(schema, records, codec=codec, sync_interval=1000).getvalue()
+
+    return make
+
+
+def read_splits(data, num_splits, **kwargs):
+    bounds = [len(data) * i // num_splits for i in range(num_splits + 1)]
+    return [list(fastavro.reader(BytesIO(data), start=a, end=b, **kwargs)) for a, b in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+@pytest.mark.parametrize("num_splits", [1, 2, 3, 10, 100])
+def test_splits_cover_file_once(codec, num_splits, make_file):
+    data = make_file(codec)
+    splits = read_splits(data, num_splits)
+    assert [r for split in splits for r in split] == records
+
+
+def test_split_per_byte(make_file):
+    data = make_file()
+    splits = read_splits(data, len(data))
+    assert sum(map(len, splits)) == len(records)
+    assert [r for split in splits for r in split] == records
+
+
+def test_cached_header(make_file):
+    data = make_file("deflate")
+    header = fastavro.read_header(BytesIO(data))
+    splits = read_splits(data, 5, header=header)
+    assert [r for split in splits for r in split] == records
+
+
+def test_split_boundaries_follow_sync_markers(make_file, read_avro):
+    data = make_file()
+    buf = BytesIO(data)
+    header = _block.read_header(buf)
+    blocks = list(_block.iter_blocks(buf, header))
+    marker = blocks[2].offset - len(header.sync_marker)
+    # A block belongs to the range its preceding sync marker starts in
+    before = read_avro(BytesIO(data), end=marker)
+    after = read_avro(BytesIO(data), start=marker)
+    assert len(before) == blocks[0].num_records + blocks[1].num_records
+    assert before + after == records
+    assert read_avro(BytesIO(data), start=marker + 1)[0] == records[len(before) + blocks[2].num_records]
+
+
+def test_split_past_last_block(make_file, read_avro):
+    data = make_file()
+    assert read_avro(BytesIO(data), start=len(data) - 3) == []
+    assert read_avro(BytesIO(data), start=len(data) + 10) == []
+
+
+def test_split_with_options(make_file, read_avro):
+    data = make_file()
+    split = read_avro(BytesIO(data), start=len(data) // 2, fields=["id"], where=("id", "<", 2000))
+    assert split
+    assert all(set(r) == {"id"} and r["id"] < 2000 for r in split)
+
+
+def test_find_sync(make_file):
+    data = make_file()
+    buf = BytesIO(data)
+    header = _block.read_header(buf)
+    found = _block.find_sync(buf, header.sync_marker, header.size, chunk_size=7)
+    assert found == data.index(header.sync_marker, header.size)
+    assert _block.find_sync(buf, header.sync_marker, len(data) - 3) is None
+
+
+def test_split_invalid_combinations(make_file):
+    data = make_file()
+    with pytest.raises(ValueError, match="cannot be combined"):
+        fastavro.reader(BytesIO(data), start=0, index=fastavro.build_index(BytesIO(data)))
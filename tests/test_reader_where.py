@@ -0,0 +1,179 @@
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _predicate
+
+schema = {
+    "type": "record",
+    "name": "Visit",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "country", "type": "string"},
+        {
+            "name": "geo",
+            "type": ["null", {"type": "record", "name": "Geo", "fields": [{"name": "lat", "type": "double"}]}],
+        },
+        {"name": "payload", "type": "string"},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "country": "DE" if i % 10 == 0 else "FR",
+            "geo": None if i % 3 == 0 else {"lat": i / 2},
+            "payload": "x" * (i % 50),
+        }
+        for i in range(num_records)
+    ]
+
+
+@pytest.fixture
+def read_where(write_avro, read_avro):
+    def read(records, **kwargs):
+        return read_avro(write_avro(schema, records, sync_interval=1000), **kwargs)
+
+    return read
+
+
+@pytest.mark.parametrize(
+    "where, keep",
+    [
+        (("country", "==", "DE"), lambda r: r["country"] == "DE"),
+        (("country", "!=", "DE"), lambda r: r["country"] != "DE"),
+        (("id", "<", 10), lambda r: r["id"] < 10),
+        (("id", ">=", 490), lambda r: r["id"] >= 490),
+        (("id", "in", {1, 5, 700}), lambda r: r["id"] in {1, 5, 700}),
+        (("country", "not in", ("FR",)), lambda r: r["country"] != "FR"),
+        (("geo", "==", None), lambda r: r["geo"] is None),
+        (("geo.lat", ">", 100), lambda r: r["geo"] is not None and r["geo"]["lat"] > 100),
+        (("not", ("geo.lat", "<=", 100)), lambda r: not (r["geo"] is not None and r["geo"]["lat"] <= 100)),
+        (
+            ("and", ("country", "==", "DE"), ("or", ("id", "<", 100), ("id", ">", 400))),
+            lambda r: r["country"] == "DE" and (r["id"] < 100 or r["id"] > 400),
+        ),
+    ],
+)
+def test_where_expressions(where, keep, read_where):
+    records = make_records(500)
+    assert read_where(records, where=where) == [r for r in records if keep(r)]
+
+
+def test_where_callable_with_fields(read_where):
+    records = make_records(200)
+    seen = []
+
+    def test(record):
+        seen.append(record)
+        return record["id"] % 7 == 0
+
+    assert read_where(records, where=test, where_fields=["id"]) == [r for r in records if r["id"] % 7 == 0]
+    # Only the requested fields are decoded for the test
+    assert seen[0] == {"id": 0}
+
+
+def test_where_callable_without_fields(read_where):
+    records = make_records(50)
+    assert read_where(records, where=lambda r: r["payload"] == "") == [r for r in records if r["payload"] == ""]
+
+
+def test_where_with_fields_and_reader_schema(read_where):
+    records = make_records(100)
+    assert read_where(records, where=("country", "==", "DE"), fields=["id"]) == [
+        {"id": r["id"]} for r in records if r["country"] == "DE"
+    ]
+    reader_schema = dict(schema, fields=schema["fields"] + [{"name": "extra", "type": "int", "default": 1}])
+    result = read_where(records, reader_schema=reader_schema, where=("id", "==", 3))
+    assert result == [dict(records[3], extra=1)]
+
+
+@pytest.mark.parametrize("path, message", [("d[*].e", "wildcards"), ("geo..lat", "invalid"), ("[*]", "invalid")])
+def test_where_paths_are_checked_when_compiled(path, message):
+    with pytest.raises(ValueError, match=message):
+        _predicate.compile_where((path, "==", 1))
+
+
+def test_where_no_matches(read_where):
+    assert read_where(make_records(100), where=("country", "==", "US")) == []
+
+
+@pytest.mark.parametrize("where", [("id", "~", 1), ("not",), "id == 1", ("missing", "==", 1)])
+def test_invalid_where(where, read_where):
+    with pytest.raises(ValueError):
+        read_where(make_records(5), where=where)
+
+
+class CountingSchema:
+    def __init__(self, schema):
+        self.schema = schema
+        self.calls = 0
+
+    def binary_read(self, reader):
+        self.calls += 1
+        return self.schema.binary_read(reader)
+
+
+def test_where_only_decodes_matching_records(write_avro):
+    records = make_records(500)
+    r = fastavro.reader(write_avro(schema, records, sync_interval=1000), where=("id", "in", {7, 250, 499}))
+    counting = CountingSchema(r._container.schema)
+    r._container.schema = counting
+    assert [record["id"] for record in r] == [7, 250, 499]
+    assert counting.calls == 3
+
+
+nested_schema = {
+    "type": "record",
+    "name": "Node",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "label", "type": {"type": "string", "logicalType": "uuid"}},
+        {"name": "raw", "type": ["null", "string", "bytes"]},
+        {"name": "when", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+        {"name": "tags", "type": {"type": "map", "values": {"type": "array", "items": "string"}}},
+        {"name": "left", "type": ["null", "Node"]},
+        {"name": "right", "type": ["null", "Node"]},
+    ],
+}
+
+
+def make_nodes(num_records):
+    def node(i, depth):
+        return {
+            "id": i,
+            "label": f"00000000-0000-0000-0000-{i:012d}",
+            "raw": [None, f"s{i}", b"b%d" % i][i % 3],
+            "when": 1000 * i,
+            "tags": {"t": [f"x{i}"] * (i % 3)},
+            "left": node(i + 1, depth - 1) if depth else None,
+            "right": None,
+        }
+
+    return [node(i, i % 3) for i in range(num_records)]
+
+
+@pytest.mark.parametrize(
+    "where",
+    [
+        ("id", "in", {3, 40, 41}),
+        ("left.id", "==", 11),
+        ("raw", "==", "s4"),
+        ("and", ("id", ">", 10), ("left.left.id", ">", 0)),
+    ],
+)
+def test_where_nested_and_recursive(where, write_avro, read_avro):
+    records = make_nodes(60)
+    data = write_avro(nested_schema, records, sync_interval=500).getvalue()
+    expected = [r for r in read_avro(BytesIO(data)) if _matches(where, r)]
+    assert expected
+    assert read_avro(BytesIO(data), where=where) == expected
+
+
+def _matches(where, record):
+    from avro_compat.fastavro import _predicate
+
+    return _predicate.compile_where(where)[1](record)
@@ -0,0 +1,139 @@
+import datetime
+import decimal
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro.rewrite import recompress, recompress_main, rewrite
+
+writer_schema = {
+    "type": "record",
+    "name": "Evolve",
+    "fields": [
+        {"name": "id", "type": "int"},
+        {"name": "name", "type": "string"},
+        {"name": "dropped", "type": {"type": "array", "items": "long"}},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+    ],
+}
+
+reader_schema = {
+    "type": "record",
+    "name": "Evolve",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "label", "type": "string", "aliases": ["name"]},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+        {"name": "added", "type": ["null", "string"], "default": None},
+    ],
+}
+
+
+@pytest.fixture
+def make_file(write_avro):
+    def make(num_records, codec="null"):
+        records = [{"id": i, "name": f"n{i}", "dropped": [i] * (i % 3), "ts": i * 1000} for i in range(num_records)]
+        return write_avro(writer_schema, records, codec=codec, sync_interval=300, metadata={"owner": "me"})
+
+    return make
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+@pytest.mark.parametrize("src_codec,dst_codec", [("null", None), ("deflate", "null"), ("null", "bzip2")])
+def test_rewrite_matches_reader_schema_resolution(workers, src_codec, dst_codec, make_file, read_avro):
+    src = make_file(500, src_codec)
+    expected = read_avro(src, reader_schema=reader_schema)
+    src.seek(0)
+
+    dst = BytesIO()
+    rewrite(src, dst, reader_schema, dst_codec, workers=workers)
+    dst.seek(0)
+
+    out = fastavro.reader(dst)
+    assert out.codec == (dst_codec or src_codec)
+    assert out.writer_schema == reader_schema
+    assert out.metadata["owner"] == "me"
+    assert list(out) == expected
+
+
+def test_rewrite_keeps_block_record_counts(make_file):
+    src = make_file(500)
+    src_counts = [block.num_records for block in fastavro.block_reader(src)]
+    src.seek(0)
+    dst = BytesIO()
+    rewrite(src, dst, reader_schema)
+    dst.seek(0)
+    assert [block.num_records for block in fastavro.block_reader(dst)] == src_counts
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_rewrite_with_the_same_schema_keeps_logical_values(workers, write_avro):
+    schema = {
+        "type": "record",
+        "name": "Logical",
+        "fields": [
+            {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+            {"name": "day", "type": {"type": "int", "logicalType": "date"}},
+            {"name": "at", "type": {"type": "int", "logicalType": "time-millis"}},
+            {"name": "amount", "type": {"type": "bytes", "logicalType": "decimal", "precision": 6, "scale": 2}},
+        ],
+    }
+    epoch = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    records = [
+        {
+            "ts": epoch + datetime.timedelta(seconds=i),
+            "day": epoch.date() + datetime.timedelta(days=i),
+            "at": datetime.time(0, 0, i % 60),
+            "amount": decimal.Decimal(i) / 4,
+        }
+        for i in range(200)
+    ]
+    src = write_avro(schema, records, sync_interval=300)
+    dst = BytesIO()
+    rewrite(src, dst, schema, "deflate", workers=workers)
+    dst.seek(0)
+    out = fastavro.reader(dst)
+    assert out.codec == "deflate"
+    assert list(out) == records
+
+
+def test_rewrite_writes_nothing_when_schemas_do_not_resolve(make_file):
+    src = make_file(10)
+    unresolvable = {"type": "record", "name": "Evolve", "fields": [{"name": "ts", "type": "int"}]}
+    dst = BytesIO()
+    with pytest.raises(fastavro.read.SchemaResolutionError):
+        rewrite(src, dst, unresolvable)
+    assert dst.getvalue() == b""
+
+
+@pytest.mark.parametrize("workers,processes", [(None, False), (3, False), (2, True)])
+@pytest.mark.parametrize("src_codec,dst_codec", [("null", "deflate"), ("deflate", "xz"), ("bzip2", "null")])
+def test_recompress(workers, processes, src_codec, dst_codec, make_file, read_avro):
+    src = make_file(500, src_codec)
+    expected = read_avro(src)
+    src.seek(0)
+    src_blocks = [(block.num_records, list(block)) for block in fastavro.block_reader(src)]
+    src.seek(0)
+
+    dst = BytesIO()
+    recompress(src, dst, dst_codec, 5, workers=workers, processes=processes)
+    dst.seek(0)
+    assert fastavro.reader(dst).codec == dst_codec
+    dst.seek(0)
+    assert [(block.num_records, list(block)) for block in fastavro.block_reader(dst)] == src_blocks
+    dst.seek(0)
+    assert read_avro(dst) == expected
+
+    # The sync marker is carried over unchanged
+    assert src.getvalue()[-16:] == dst.getvalue()[-16:]
+
+
+def test_recompress_cli(tmp_path, make_file, read_avro):
+    src = make_file(50)
+    (tmp_path / "in.avro").write_bytes(src.getvalue())
+    recompress_main(["--codec", "deflate", "--workers", "2", str(tmp_path / "in.avro"), str(tmp_path / "out.avro")])
+    with open(tmp_path / "out.avro", "rb") as fo:
+        out = fastavro.reader(fo)
+        assert out.codec == "deflate"
+        assert list(out) == read_avro(src)
@@ -0,0 +1,75 @@
+import json
+import os
+
+import pytest
+
+from avro_compat.fastavro.write import RollingWriter
+
+schema = {
+    "type": "record",
+    "name": "Rolling",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+
+def make_records(num_records):
+    return [{"id": i, "name": f"name-{i}"} for i in range(num_records)]
+
+
+def test_rotates_by_record_count(tmp_path, read_avro):
+    records = make_records(25)
+    with RollingWriter(tmp_path / "part-{index:03d}.avro", schema, max_records=10) as out:
+        out.write_many(records)
+
+    assert [entry["records"] for entry in out.manifest] == [10, 10, 5]
+    read_back = []
+    for entry in out.manifest:
+        assert entry["bytes"] == (tmp_path / entry["path"]).stat().st_size
+        read_back.extend(read_avro(entry["path"]))
+    assert read_back == records
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_rotates_by_bytes(tmp_path):
+    records = make_records(1000)
+    with RollingWriter(tmp_path / "part-{index}.avro", schema, sync_interval=100, max_bytes=1000) as out:
+        out.write_many(records)
+
+    assert len(out.manifest) > 1
+    assert sum(entry["records"] for entry in out.manifest) == len(records)
+
+
+def test_writes_manifest(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    with RollingWriter(
+        tmp_path / "part-{index}.avro", schema, codec="deflate", max_records=3, manifest_path=manifest_path
+    ) as out:
+        out.write_many(make_records(7))
+
+    with open(manifest_path) as fo:
+        assert json.load(fo) == out.manifest
+
+
+def test_no_empty_file_on_close(tmp_path):
+    with RollingWriter(tmp_path / "part-{index}.avro", schema, max_records=5) as out:
+        out.write_many(make_records(5))
+    assert len(out.manifest) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["part-0.avro"]
+
+
+def test_file_is_synced_before_it_is_renamed(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append("fsync"))
+    replace = os.replace
+    monkeypatch.setattr(os, "replace", lambda src, dst: (calls.append("replace"), replace(src, dst)))
+    with RollingWriter(tmp_path / "part-{index}.avro", schema, max_records=5) as out:
+        out.write_many(make_records(10))
+    assert calls == ["fsync", "replace", "fsync", "replace"]
+
+
+def test_path_requires_index(tmp_path):
+    with pytest.raises(ValueError):
+        RollingWriter(tmp_path / "part.avro", schema, max_records=5)
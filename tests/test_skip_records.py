@@ -0,0 +1,112 @@
+from io import BytesIO
+from os.path import abspath, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _block
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+
+schema = {
+    "type": "record",
+    "name": "Row",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+
+records = [{"id": i, "name": f"n{i}"} for i in range(2000)]
+
+
+@pytest.fixture
+def make_file(write_avro):
+    def make(codec="null"):
+        return write_avro(schema, records, codec=codec, sync_interval=1000)
+
+    return make
+
+
+def test_count_records(make_file, read_avro):
+    assert fastavro.count_records(make_file("deflate")) == 2000
+    with open(join(data_dir, "weather.avro"), "rb") as fo:
+        num_records = len(read_avro(fo))
+        fo.seek(0)
+        assert fastavro.count_records(fo) == num_records
+    assert fastavro.count_records(join(data_dir, "weather.avro")) == num_records
+
+
+def test_block_headers_do_not_read_block_data(make_file):
+    buf = make_file()
+    header = _block.read_header(buf)
+    blocks = list(_block.iter_blocks(buf, header))
+    buf.seek(header.size)
+    headers = list(_block.iter_block_headers(buf, header))
+    assert headers == [(block.offset, block.num_records, block.size) for block in blocks]
+
+
+def test_block_headers_detect_truncation(make_file):
+    data = make_file().getvalue()
+    buf = BytesIO(data[:-5])
+    header = _block.read_header(buf)
+    with pytest.raises(EOFError, match="truncated"):
+        list(_block.iter_block_headers(buf, header))
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+@pytest.mark.parametrize("kwargs", [{}, {"fields": ["id"]}, {"datetime64": True}])
+def test_skip(codec, kwargs, make_file):
+    expected = [{k: v for k, v in r.items() if k in kwargs.get("fields", r)} for r in records]
+    r = fastavro.reader(make_file(codec), **kwargs)
+    r.skip(1500)
+    assert next(r) == expected[1500]
+    r.skip(0)
+    r.skip(3)
+    assert next(r) == expected[1504]
+    r.skip(10)
+    assert list(r) == expected[1515:]
+
+
+def test_skip_after_reading(make_file):
+    r = fastavro.reader(make_file())
+    assert next(r) == records[0]
+    r.skip(1200)
+    assert next(r) == records[1201]
+
+
+def test_skip_past_end(make_file):
+    r = fastavro.reader(make_file())
+    r.skip(5000)
+    assert list(r) == []
+
+
+def test_skip_with_where(make_file):
+    r = fastavro.reader(make_file(), where=("id", ">=", 100))
+    r.skip(10)
+    assert next(r) == records[110]
+
+
+def test_skip_with_reader_schema(make_file):
+    reader_schema = dict(schema, fields=schema["fields"] + [{"name": "extra", "type": "int", "default": 1}])
+    r = fastavro.reader(make_file(), reader_schema)
+    r.skip(7)
+    assert next(r) == dict(records[7], extra=1)
+
+
+def test_skip_negative(make_file):
+    with pytest.raises(ValueError):
+        fastavro.reader(make_file()).skip(-1)
+
+
+def test_skip_unseekable(make_file):
+    class Unseekable:
+        def __init__(self, data):
+            self._buf = BytesIO(data)
+
+        def read(self, n=-1):
+            return self._buf.read(n)
+
+    r = fastavro.reader(Unseekable(make_file().getvalue()))
+    r.skip(1234)
+    assert next(r) == records[1234]
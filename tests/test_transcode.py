@@ -0,0 +1,105 @@
+import glob
+import json
+from io import BytesIO, StringIO
+from os.path import abspath, basename, dirname, join
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import transcode
+
+data_dir = join(abspath(dirname(__file__)), "lib-tests", "fastavro_tests", "avro-files")
+avro_files = sorted(
+    f for f in glob.glob(join(data_dir, "*.avro")) if "snappy" not in basename(f) and "error-type" not in basename(f)
+)
+
+schema = {
+    "type": "record",
+    "name": "Transcode",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-micros"}},
+        {"name": "payload", "type": "bytes"},
+        {"name": "nested", "type": {"type": "array", "items": {"type": "map", "values": "double"}}},
+    ],
+}
+
+
+def make_records(num_records):
+    return [
+        {
+            "id": i,
+            "name": None if i % 3 == 0 else f"name-{i}",
+            "ts": 1_600_000_000_000_000 + i,
+            "payload": bytes(range(i % 7)),
+            "nested": [{"x": i / 2}] * (i % 2),
+        }
+        for i in range(num_records)
+    ]
+
+
+def records_to_json(records):
+    fo = StringIO()
+    fastavro.json_writer(fo, schema, records)
+    return fo.getvalue()
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate"])
+def test_json_to_container_and_back(codec):
+    text = records_to_json(make_records(200))
+
+    container = BytesIO()
+    transcode.json_to_container(BytesIO(text.encode()), container, schema, codec, chunk_size=100)
+    container.seek(0)
+    assert fastavro.reader(container).codec == codec
+
+    container.seek(0)
+    out = StringIO()
+    transcode.container_to_json(container, out, batch_size=7)
+    assert out.getvalue() == text
+
+
+def test_json_to_schemaless():
+    records = make_records(50)
+    out = BytesIO()
+    transcode.json_to_schemaless(StringIO(records_to_json(records)), out, schema)
+    out.seek(0)
+    decoded = [fastavro.schemaless_reader(out, schema) for _ in records]
+    assert decoded == [fastavro.schemaless_reader(BytesIO(_encode(r)), schema) for r in records]
+    assert out.read() == b""
+
+
+def _encode(record):
+    fo = BytesIO()
+    fastavro.schemaless_writer(fo, schema, record)
+    return fo.getvalue()
+
+
+@pytest.mark.parametrize("filename", avro_files, ids=basename)
+def test_container_round_trip(filename, read_avro):
+    with open(filename, "rb") as fo:
+        expected = read_avro(fo)
+        fo.seek(0)
+        writer_schema = json.loads(fastavro.reader(fo).metadata["avro.schema"])
+        fo.seek(0)
+        text = StringIO()
+        transcode.container_to_json(fo, text)
+
+    container = BytesIO()
+    transcode.json_to_container(StringIO(text.getvalue()), container, writer_schema)
+    container.seek(0)
+    assert read_avro(container) == expected
+
+
+def test_cli(tmp_path):
+    schema_path = tmp_path / "schema.avsc"
+    schema_path.write_text(json.dumps(schema))
+    json_path = tmp_path / "in.json"
+    json_path.write_text(records_to_json(make_records(20)))
+
+    transcode.main(
+        ["json-to-avro", "--schema", str(schema_path), "--codec", "deflate", str(json_path), str(tmp_path / "out.avro")]
+    )
+    transcode.main(["avro-to-json", str(tmp_path / "out.avro"), str(tmp_path / "out.json")])
+    assert (tmp_path / "out.json").read_text() == json_path.read_text()
@@ -0,0 +1,117 @@
+import datetime
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+import avro_compat.fastavro as fastavro
+
+schema = {
+    "type": "record",
+    "name": "Columns",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "small", "type": "int"},
+        {"name": "flag", "type": "boolean"},
+        {"name": "ratio", "type": ["null", "double"]},
+        {"name": "name", "type": ["null", "string"]},
+        {"name": "digest", "type": {"type": "fixed", "name": "Digest", "size": 2}},
+        {"name": "ts", "type": {"type": "long", "logicalType": "timestamp-millis"}},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+    ],
+}
+
+
+def make_columns(num_records):
+    tags = np.empty(num_records, dtype=object)
+    tags[:] = [[str(i)] * (i % 3) for i in range(num_records)]
+    return {
+        "id": np.arange(num_records, dtype="int64"),
+        "small": np.arange(num_records, dtype="int16"),
+        "flag": np.arange(num_records) % 2 == 0,
+        "ratio": np.ma.masked_array(np.arange(num_records) / 4, mask=np.arange(num_records) % 3 == 0),
+        "name": np.array([f"name-{i}" for i in range(num_records)]),
+        "digest": np.array([b"a\0"] * num_records, dtype="S2"),
+        "ts": np.datetime64("2020-01-01T00:00:00", "ms") + np.arange(num_records),
+        "tags": tags,
+    }
+
+
+def test_write_columns(read_avro):
+    buf = BytesIO()
+    fastavro.write_columns(buf, schema, make_columns(25), masks={"name": np.arange(25) % 5 == 0}, chunk_size=10)
+    buf.seek(0)
+    records = read_avro(buf)
+    assert len(records) == 25
+    epoch = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    for i, record in enumerate(records):
+        assert record == {
+            "id": i,
+            "small": i,
+            "flag": i % 2 == 0,
+            "ratio": None if i % 3 == 0 else i / 4,
+            "name": None if i % 5 == 0 else f"name-{i}",
+            "digest": b"a\0",
+            "ts": epoch + datetime.timedelta(milliseconds=i),
+            "tags": [str(i)] * (i % 3),
+        }
+
+
+def test_round_trip_through_iter_batches(read_avro):
+    buf = BytesIO()
+    fastavro.write_columns(buf, schema, make_columns(100), sync_interval=500)
+    buf.seek(0)
+    batches = list(fastavro.reader(buf).iter_batches())
+    assert len(batches) > 1
+    out = BytesIO()
+    for batch in batches:
+        # Further batches append to the same file
+        fastavro.write_columns(out, schema, batch)
+    out.seek(0)
+    buf.seek(0)
+    assert read_avro(out) == read_avro(buf)
+
+
+def test_plain_lists(read_avro):
+    buf = BytesIO()
+    schema = {"type": "record", "name": "R", "fields": [{"name": "a", "type": "long"}, {"name": "b", "type": "string"}]}
+    fastavro.write_columns(buf, schema, {"a": [1, 2], "b": ["x", "y"]})
+    buf.seek(0)
+    assert read_avro(buf) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+@pytest.mark.parametrize(
+    "columns, message",
+    [
+        ({"id": np.array([1.5])}, "dtype float64"),
+        ({"small": np.array([1 << 40])}, "out of range"),
+        ({"flag": np.array([1])}, "dtype int64"),
+        ({"digest": np.array([b"abc"])}, "dtype |S3"),
+        ({"id": np.ma.masked_array([1], mask=[True])}, "not nullable"),
+        ({"id": np.array([1, 2]), "small": np.array([1])}, "same length"),
+        ({"missing": np.array([1])}, "missing"),
+    ],
+)
+def test_invalid_columns(columns, message):
+    with pytest.raises(ValueError, match=message):
+        fastavro.write_columns(BytesIO(), schema, columns)
+
+
+def test_write_dataframe(read_avro):
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"a": [1, 2, 3], "b": [1.5, None, 2.5], "c": [0.5, float("nan"), 1.0]})
+    df_schema = {
+        "type": "record",
+        "name": "Frame",
+        "fields": [
+            {"name": "a", "type": "long"},
+            {"name": "b", "type": ["null", "double"]},
+            {"name": "c", "type": "double"},
+        ],
+    }
+    buf = BytesIO()
+    fastavro.write_dataframe(buf, df_schema, frame)
+    buf.seek(0)
+    records = read_avro(buf)
+    assert [r["b"] for r in records] == [1.5, None, 2.5]
+    assert np.isnan(records[1]["c"])
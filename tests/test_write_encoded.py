@@ -0,0 +1,86 @@
+from io import BytesIO
+
+import pytest
+
+import avro_compat.fastavro as fastavro
+from avro_compat.fastavro import _block
+from avro_compat.fastavro.write import Writer
+
+schema = {
+    "type": "record",
+    "name": "Encoded",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {"name": "tags", "type": {"type": "array", "items": "string"}},
+    ],
+}
+
+
+def encode(record):
+    buf = BytesIO()
+    fastavro.schemaless_writer(buf, schema, record)
+    return buf.getvalue()
+
+
+def make_records(num_records):
+    return [{"id": i, "tags": [str(i)] * (i % 3)} for i in range(num_records)]
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate", "bzip2", "xz"])
+def test_write_encoded_round_trip(codec, read_avro):
+    records = make_records(1000)
+    fo = BytesIO()
+    out = Writer(fo, schema, codec, sync_interval=500)
+    out.write_encoded_many((encode(r) for r in records), validate=True)
+    out.flush()
+
+    fo.seek(0)
+    assert read_avro(fo) == records
+
+
+def test_write_encoded_mixed_with_write(read_avro):
+    records = make_records(10)
+    fo = BytesIO()
+    out = Writer(fo, schema)
+    for i, record in enumerate(records):
+        if i % 2:
+            out.write(record)
+        else:
+            out.write_encoded(encode(record))
+        assert out.block_count == 1
+    out.flush()
+
+    fo.seek(0)
+    assert read_avro(fo) == records
+
+
+def test_write_encoded_first_block_is_not_empty():
+    fo = BytesIO()
+    out = Writer(fo, schema, metadata={"origin": "encoded"})
+    out.write_encoded_many(encode(r) for r in make_records(3))
+    out.flush()
+
+    fo.seek(0)
+    header = _block.read_header(fo)
+    assert header.metadata["origin"] == b"encoded"
+    # Read raw, since block_reader passes over empty blocks
+    assert [block.num_records for block in _block.iter_blocks(fo, header)] == [3]
+
+
+def test_write_encoded_appends(read_avro):
+    fo = BytesIO()
+    fastavro.writer(fo, schema, make_records(3))
+    out = Writer(fo, schema)
+    out.write_encoded(encode({"id": 3, "tags": []}))
+    out.flush()
+
+    fo.seek(0)
+    assert read_avro(fo) == make_records(4)
+
+
+@pytest.mark.parametrize("datum", [b"\x02", encode({"id": 1, "tags": ["a"]}) + b"\x00"])
+def test_write_encoded_validate(datum):
+    out = Writer(BytesIO(), schema)
+    with pytest.raises(ValueError):
+        out.write_encoded(datum, validate=True)
+    assert out.block_count == 0